@@ -19,11 +19,24 @@ Version: 1.0.0
 """
 
 import pyodbc
+import asyncio
 import configparser
+import concurrent.futures
 import os
-from contextlib import contextmanager
-from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass
+import queue
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Optional, List, Dict, Any, Tuple, Callable, TypeVar, Sequence, Iterator
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from decimal import Decimal
+
+try:
+    import aioodbc
+except ImportError:  # optional dependency
+    aioodbc = None
 
 
 # =============================================================================
@@ -149,12 +162,115 @@ def get_connection() -> pyodbc.Connection:
     return connection
 
 
+T = TypeVar('T')
+
+# Per-thread connection shared by all calls inside a connection_scope()
+_local = threading.local()
+
+# Idle connections kept for pooled scopes (see connection_scope(pooled=True))
+POOL_SIZE = 4
+_pool: 'queue.Queue[pyodbc.Connection]' = queue.Queue(maxsize=POOL_SIZE)
+
+
+def _acquire_pooled() -> pyodbc.Connection:
+    """Take an idle connection from the pool, or open a new one."""
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        return get_connection()
+
+
+def _release_pooled(connection: pyodbc.Connection, healthy: bool) -> None:
+    """Return a connection to the pool (rolled back), or close it."""
+    if healthy:
+        try:
+            connection.rollback()
+            _pool.put_nowait(connection)
+            return
+        except (pyodbc.Error, queue.Full):
+            pass
+    connection.close()
+
+
+@contextmanager
+def connection_scope(pooled: bool = False):
+    """
+    Share one connection across every database call made in this block.
+    
+    While the scope is active, connection_context() and cursor_context()
+    (and therefore every call_procedure* helper) reuse the thread's
+    connection instead of opening a new one per call. Scopes nest: an
+    inner scope simply joins the outer one.
+    
+    Positional call_procedure_with_result() calls also keep one cursor per
+    (procedure, parameter count) for the life of the scope, so repeated
+    calls reuse the driver's prepared statement instead of re-preparing.
+    
+    Args:
+        pooled: If True, the connection is taken from (and returned to) a
+                small pool of up to POOL_SIZE idle connections instead of
+                being opened and closed. Used by worker threads (run_pooled).
+    
+    Usage:
+        with connection_scope():
+            sales = SaleRepository.get_today_sales()
+            low_stock = InventoryRepository.get_low_stock_items()
+    
+    Yields:
+        pyodbc.Connection: The shared connection
+    """
+    connection = getattr(_local, 'connection', None)
+    if connection is not None:
+        yield connection
+        return
+    
+    connection = _acquire_pooled() if pooled else get_connection()
+    _local.connection = connection
+    _local.prepared = {}
+    healthy = False
+    try:
+        yield connection
+        healthy = True
+    finally:
+        prepared, _local.prepared = _local.prepared, None
+        for cursor, _ in prepared.values():
+            cursor.close()
+        _local.connection = None
+        if pooled:
+            # A connection that saw an error may be broken; don't reuse it
+            _release_pooled(connection, healthy)
+        else:
+            connection.close()
+
+
+async def run_pooled(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking repository call on a worker thread with a pooled connection.
+    
+    Independent calls started together with asyncio.gather() each get their
+    own connection (one active statement per connection), so their server
+    work and network waits overlap.
+    
+    Example:
+        summary, top = await asyncio.gather(
+            run_pooled(SaleRepository.get_daily_summary),
+            run_pooled(SaleRepository.get_top_selling_products, 10)
+        )
+    """
+    def call() -> T:
+        with connection_scope(pooled=True):
+            return fn(*args, **kwargs)
+    return await asyncio.to_thread(call)
+
+
 @contextmanager
 def connection_context():
     """
     Context manager for database connections.
     
     Ensures connections are properly closed even if exceptions occur.
+    Inside a connection_scope() the scoped connection is reused and
+    left open for the next call.
     
     Usage:
         with connection_context() as conn:
@@ -165,6 +281,11 @@ def connection_context():
     Yields:
         pyodbc.Connection: Active database connection
     """
+    scoped = getattr(_local, 'connection', None)
+    if scoped is not None:
+        yield scoped
+        return
+    
     connection = None
     try:
         connection = get_connection()
@@ -196,23 +317,19 @@ def cursor_context(commit: bool = False):
     Yields:
         pyodbc.Cursor: Active database cursor
     """
-    connection = None
     cursor = None
-    try:
-        connection = get_connection()
-        cursor = connection.cursor()
-        yield cursor
-        if commit:
-            connection.commit()
-    except Exception:
-        if connection:
+    with connection_context() as connection:
+        try:
+            cursor = connection.cursor()
+            yield cursor
+            if commit:
+                connection.commit()
+        except Exception:
             connection.rollback()
-        raise
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
+            raise
+        finally:
+            if cursor:
+                cursor.close()
 
 
 # =============================================================================
@@ -472,6 +589,7 @@ def call_create_sale(
                  - Product_Code: str
                  - Quantity: int
                  - Unit_Price: Decimal
+                 Repeated products are merged; they must share a Unit_Price.
     
     Returns:
         ProcedureResult with success status and created key
@@ -492,60 +610,57 @@ def call_create_sale(
         else:
             print(f"Error: {result.error_message}")
     """
+    # Details are bound as one table-valued parameter (dbo.SaleDetailType,
+    # keyed on Product_Code), so repeated products are merged first. Lines
+    # for the same product at different prices cannot be merged.
+    merged: Dict[str, List[Any]] = {}
+    for d in details:
+        code = str(d['Product_Code'])
+        if code in merged:
+            if Decimal(str(d['Unit_Price'])) != Decimal(str(merged[code][2])):
+                return ProcedureResult(
+                    success=False,
+                    error_message=f"Product {code} is listed twice with different unit prices"
+                )
+            merged[code][1] += int(d['Quantity'])
+        else:
+            merged[code] = [code, int(d['Quantity']), d['Unit_Price']]
+    detail_rows = [tuple(row) for row in merged.values()]
+    
     with connection_context() as conn:
         cursor = conn.cursor()
         
         try:
-            # Build the INSERT statements for details
-            detail_inserts = []
-            for detail in details:
-                # Escape single quotes in product code if any
-                prod_code = str(detail['Product_Code']).replace("'", "''")
-                insert = f"INSERT INTO @Details (Product_Code, Quantity, Unit_Price) VALUES ('{prod_code}', {detail['Quantity']}, {detail['Unit_Price']});"
-                detail_inserts.append(insert)
-            
-            # Escape input values
-            safe_invoice = str(invoice_no).replace("'", "''")
-            safe_customer = str(customer_id).replace("'", "''")
-            safe_employee = str(employee_id).replace("'", "''")
-            safe_discount = float(discount)
-            
-            # Build the complete SQL with values embedded (pyodbc can't use ? in multi-statement batches)
-            sql = f"""
+            # One batch: the procedure runs its own transaction, and the
+            # trailing COMMIT closes the driver's implicit transaction, so no
+            # separate commit round-trip is needed afterwards.
+            sql = """
                 SET NOCOUNT ON;
                 
-                -- Declare table variable for sale details
-                DECLARE @Details dbo.SaleDetailType;
-                
-                -- Declare output variables
                 DECLARE @CreatedKey NVARCHAR(20);
                 DECLARE @Success BIT;
                 DECLARE @ErrorMessage NVARCHAR(500);
                 
-                -- Insert detail rows into table variable
-                {chr(10).join(detail_inserts)}
-                
-                -- Call the stored procedure
                 EXEC dbo.usp_CreateSale
-                    @InvoiceNo = N'{safe_invoice}',
-                    @CustomerID = N'{safe_customer}',
-                    @EmployeeID = N'{safe_employee}',
-                    @Discount = {safe_discount},
-                    @Details = @Details,
+                    @InvoiceNo = ?,
+                    @CustomerID = ?,
+                    @EmployeeID = ?,
+                    @Discount = ?,
+                    @Details = ?,
                     @CreatedKey = @CreatedKey OUTPUT,
                     @Success = @Success OUTPUT,
                     @ErrorMessage = @ErrorMessage OUTPUT;
                 
-                -- Return the results
+                IF @@TRANCOUNT > 0 COMMIT TRANSACTION;
+                
                 SELECT @Success AS Success, @CreatedKey AS CreatedKey, @ErrorMessage AS ErrorMessage;
             """
             
-            # Execute
-            cursor.execute(sql)
-            
-            # Get the result
+            cursor.execute(sql, [
+                str(invoice_no), str(customer_id), str(employee_id),
+                float(discount), detail_rows
+            ])
             row = cursor.fetchone()
-            conn.commit()
             
             if row:
                 return ProcedureResult(
@@ -577,7 +692,8 @@ def call_create_sale(
 def call_procedure(
     procedure_name: str,
     params: Optional[Any] = None,
-    has_output: bool = True
+    has_output: bool = True,
+    raise_errors: bool = False
 ) -> Any:
     """
     Generic helper to call stored procedures.
@@ -592,6 +708,8 @@ def call_procedure(
             - Tuple of positional parameter values
         has_output: If True, expects @Success, @ErrorMessage, @CreatedKey outputs
                    If False, just executes and returns True on success
+        raise_errors: If True, pyodbc errors are re-raised (after rollback)
+                      so callers can inspect SQLSTATE instead of getting False
     
     Returns:
         If has_output=True: ProcedureResult with success status and any created key
@@ -672,6 +790,8 @@ def call_procedure(
                 
         except pyodbc.Error as e:
             conn.rollback()
+            if raise_errors:
+                raise
             if has_output:
                 return ProcedureResult(
                     success=False,
@@ -685,8 +805,9 @@ def call_procedure(
 def call_procedure_with_result(
     procedure_name: str,
     params: Optional[Any] = None,
-    commit: bool = False
-) -> List[pyodbc.Row]:
+    commit: bool = False,
+    with_description: bool = False
+) -> Any:
     """
     Call a stored procedure that returns a result set (SELECT).
     
@@ -699,9 +820,12 @@ def call_procedure_with_result(
             - Dict of parameter names and values (without @ prefix)
             - Tuple of positional parameter values
         commit: If True, commit the transaction (for INSERT/UPDATE procedures)
+        with_description: If True, also return cursor.description so callers
+                          can map column names to positions once per result set
     
     Returns:
-        List of rows from the procedure's SELECT statement
+        List of rows from the procedure's SELECT statement, or
+        (cursor.description, rows) when with_description=True
     
     Example:
         # No params:
@@ -716,34 +840,396 @@ def call_procedure_with_result(
         # With commit (for INSERT/UPDATE):
         rows = call_procedure_with_result('usp_CreatePurchaseOrder', params, commit=True)
     """
+    prepared = getattr(_local, 'prepared', None)
+    if prepared is not None and not isinstance(params, dict):
+        return _call_prepared(prepared, procedure_name, params, commit, with_description)
+    
     with cursor_context(commit=commit) as cursor:
-        if params is None or (isinstance(params, (tuple, list)) and len(params) == 0):
-            # No parameters
-            sql = f"EXEC dbo.{procedure_name}"
-            cursor.execute(sql)
-        elif isinstance(params, dict):
-            # Skip empty dict or dict with just Page/PageSize (not used)
-            # Filter out Page/PageSize as our procedures don't use them
-            filtered_params = {k: v for k, v in params.items() if k not in ('Page', 'PageSize')}
-            if not filtered_params:
-                sql = f"EXEC dbo.{procedure_name}"
-                cursor.execute(sql)
-            else:
-                param_assignments = []
-                param_values = []
-                for key, value in filtered_params.items():
-                    param_assignments.append(f"@{key} = ?")
-                    param_values.append(value)
-                param_str = ', '.join(param_assignments)
-                sql = f"EXEC dbo.{procedure_name} {param_str}"
-                cursor.execute(sql, param_values)
-        else:
-            # Tuple/list of positional params
-            placeholders = ', '.join(['?'] * len(params))
-            sql = f"EXEC dbo.{procedure_name} {placeholders}"
-            cursor.execute(sql, list(params))
-        
-        return cursor.fetchall()
+        _execute_procedure(cursor, procedure_name, params)
+        rows = cursor.fetchall()
+        if with_description:
+            return cursor.description, rows
+        return rows
+
+
+def _call_prepared(
+    prepared: Dict[Tuple[str, int], Tuple[pyodbc.Cursor, str]],
+    procedure_name: str,
+    params: Optional[Any],
+    commit: bool,
+    with_description: bool
+) -> Any:
+    """
+    Run a positional procedure call on the scope's cached cursor.
+    
+    pyodbc keeps a cursor's prepared statement while the SQL text stays the
+    same, so reusing one cursor per (procedure, arity) with a fixed
+    {CALL ...} string skips the prepare step on every repeat call.
+    """
+    values = list(params) if params else []
+    key = (procedure_name, len(values))
+    entry = prepared.get(key)
+    if entry is None:
+        placeholders = ', '.join(['?'] * len(values))
+        sql = f"{{CALL dbo.{procedure_name} ({placeholders})}}" if values else f"{{CALL dbo.{procedure_name}}}"
+        entry = prepared[key] = (_local.connection.cursor(), sql)
+    
+    cursor, sql = entry
+    connection = _local.connection
+    try:
+        cursor.execute(sql, values)
+        rows = cursor.fetchall()
+        description = cursor.description
+        while cursor.nextset():
+            pass  # drain trailing results so the cursor is ready for reuse
+        if commit:
+            connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    if with_description:
+        return description, rows
+    return rows
+
+
+def column_index(description: Any) -> Dict[str, int]:
+    """
+    Map column names to their positions in a result set.
+    
+    Args:
+        description: cursor.description from an executed statement
+    
+    Returns:
+        Dict of column name -> zero-based index
+    """
+    return {column[0]: position for position, column in enumerate(description)}
+
+
+_converters: Dict[Tuple[type, Tuple[str, ...], Tuple[Tuple[str, Callable[[Any], Any]], ...]], Callable[[Any], Any]] = {}
+_converters_lock = threading.Lock()
+
+
+def _row_converter(
+    cls: type,
+    description: Any,
+    converters: Optional[Dict[str, Callable[[Any], Any]]]
+) -> Callable[[Any], Any]:
+    """
+    Return a compiled row -> cls function for this result set layout.
+    
+    Columns are matched to dataclass fields case-insensitively
+    (Invoice_No -> invoice_no), or by the field's metadata['column'] when
+    the names differ; columns with no matching field are ignored.
+    The generated function indexes the row directly (r[0], r[1], ...), and
+    is cached per (cls, column names, converters), so code is generated once
+    per procedure shape and call sites with different converters do not
+    share a converter.
+    """
+    columns = tuple(column[0] for column in description)
+    # The converter functions themselves (not id()) are part of the key, so
+    # an entry keeps them alive and a recycled id can never match
+    conversions = tuple(sorted(converters.items(), key=lambda item: item[0])) if converters else ()
+    key = (cls, columns, conversions)
+    converter = _converters.get(key)
+    if converter is not None:
+        return converter
+    
+    converters = converters or {}
+    positions = {name.lower(): index for index, name in enumerate(columns)}
+    namespace: Dict[str, Any] = {'_cls': cls}
+    args = []
+    for field in fields(cls):
+        column = field.metadata.get('column', field.name).lower()
+        if not field.init or column not in positions:
+            continue
+        value = f"r[{positions[column]}]"
+        if field.name in converters:
+            namespace[f"_conv_{field.name}"] = converters[field.name]
+            value = f"_conv_{field.name}({value})"
+        args.append(f"{field.name}={value}")
+    
+    source = f"def _convert(r):\n    return _cls({', '.join(args)})\n"
+    exec(source, namespace)
+    converter = namespace['_convert']
+    with _converters_lock:
+        _converters[key] = converter
+    return converter
+
+
+def call_procedure_materialized(
+    procedure_name: str,
+    params: Optional[Any],
+    cls: type,
+    converters: Optional[Dict[str, Callable[[Any], Any]]] = None
+) -> List[Any]:
+    """
+    Call a stored procedure and build a dataclass instance per row.
+    
+    The row -> cls function is generated from cursor.description on first
+    use (see _row_converter), so each row costs one call with positional
+    indexing instead of a getattr per column.
+    
+    Args:
+        procedure_name: Name of the stored procedure
+        params: Dict, tuple, or None (same forms as call_procedure_with_result)
+        cls: Dataclass to construct; fields are matched to column names
+        converters: Optional mapping of field name -> conversion callable
+    
+    Returns:
+        List of cls instances
+    
+    Example:
+        sales = call_procedure_materialized(
+            'usp_GetSalesByCustomer', ('CUS001',), Sale, {'net_amount_cents': to_cents})
+    """
+    description, rows = call_procedure_with_result(
+        procedure_name, params, with_description=True
+    )
+    if not rows:
+        return []
+    convert = _row_converter(cls, description, converters)
+    return [convert(row) for row in rows]
+
+
+def call_procedure_multi(
+    procedure_name: str,
+    params: Optional[Any] = None,
+    commit: bool = False,
+    with_description: bool = False
+) -> List[Any]:
+    """
+    Call a stored procedure that returns several result sets.
+    
+    All result sets are read in one round-trip using cursor.nextset(),
+    e.g. a header row followed by its detail rows.
+    
+    Args:
+        procedure_name: Name of the stored procedure
+        params: Dict, tuple, or None (same forms as call_procedure_with_result)
+        commit: If True, commit the transaction
+        with_description: If True, each entry is (cursor.description, rows)
+    
+    Returns:
+        List with one list of rows per result set, in order
+    
+    Example:
+        header_rows, payment_rows = call_procedure_multi(
+            'usp_GetInvoiceWithPayments', ('INV001',)
+        )
+    """
+    with cursor_context(commit=commit) as cursor:
+        _execute_procedure(cursor, procedure_name, params)
+        result_sets = []
+        while True:
+            rows = cursor.fetchall()
+            result_sets.append((cursor.description, rows) if with_description else rows)
+            if not cursor.nextset():
+                return result_sets
+
+
+def iter_procedure(
+    procedure_name: str,
+    params: Optional[Any] = None,
+    batch_size: int = 500
+) -> Iterator[pyodbc.Row]:
+    """
+    Call a stored procedure and yield its rows as they are fetched.
+    
+    Rows are pulled from the driver in batches of batch_size with
+    fetchmany(), so large listings (exports, bulk processing) never hold
+    the whole result set in memory. The connection stays open until the
+    generator is exhausted or closed.
+    
+    Args:
+        procedure_name: Name of the stored procedure
+        params: Dict, tuple, or None (same forms as call_procedure_with_result)
+        batch_size: Number of rows fetched per driver call
+    
+    Yields:
+        Rows from the procedure's first result set
+    
+    Example:
+        for row in iter_procedure('usp_ListProducts'):
+            writer.writerow(row)
+    """
+    with cursor_context() as cursor:
+        _execute_procedure(cursor, procedure_name, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
+
+def _procedure_sql(procedure_name: str, params: Optional[Any]) -> Tuple[str, List[Any]]:
+    """
+    Build the EXEC statement and parameter list for a procedure call.
+    
+    Params may be None, a dict of named parameters (Page/PageSize are
+    ignored) or a positional tuple/list. A positional value that is itself a
+    list of tuples is bound by pyodbc as a table-valued parameter
+    (e.g. dbo.CodeListType).
+    """
+    if params is None or (isinstance(params, (tuple, list)) and len(params) == 0):
+        # No parameters
+        return f"EXEC dbo.{procedure_name}", []
+    if isinstance(params, dict):
+        # Filter out Page/PageSize as our procedures don't use them
+        filtered_params = {k: v for k, v in params.items() if k not in ('Page', 'PageSize')}
+        if not filtered_params:
+            return f"EXEC dbo.{procedure_name}", []
+        param_str = ', '.join(f"@{key} = ?" for key in filtered_params)
+        return f"EXEC dbo.{procedure_name} {param_str}", list(filtered_params.values())
+    # Tuple/list of positional params
+    placeholders = ', '.join(['?'] * len(params))
+    return f"EXEC dbo.{procedure_name} {placeholders}", list(params)
+
+
+def _execute_procedure(cursor: pyodbc.Cursor, procedure_name: str, params: Optional[Any]) -> None:
+    """
+    Execute a stored procedure on the given cursor without fetching.
+    
+    Shared by the result-returning helpers; see _procedure_sql for the
+    accepted params forms.
+    """
+    sql, values = _procedure_sql(procedure_name, params)
+    if values:
+        cursor.execute(sql, values)
+    else:
+        cursor.execute(sql)
+
+
+_inflight: Dict[Tuple[Any, ...], 'concurrent.futures.Future[List[pyodbc.Row]]'] = {}
+_inflight_lock = threading.Lock()
+
+
+def singleflight_call(procedure_name: str, params: Optional[Any] = None) -> List[pyodbc.Row]:
+    """
+    Call a read-only procedure, sharing the result with identical in-flight calls.
+    
+    If another thread is already running the same procedure with the same
+    parameters, this call waits for that result instead of sending its own
+    request. Nothing is cached: once the first call finishes, the next one
+    goes to the server again. Only use this for side-effect-free procedures;
+    the returned rows are shared and must not be modified.
+    
+    Args:
+        procedure_name: Name of the stored procedure
+        params: Dict, tuple, or None (same forms as call_procedure_with_result)
+    
+    Returns:
+        List of rows from the procedure's SELECT statement
+    """
+    if isinstance(params, dict):
+        key = (procedure_name, tuple(sorted(params.items())))
+    else:
+        key = (procedure_name, tuple(params or ()))
+    
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = concurrent.futures.Future()
+    
+    if not leader:
+        return future.result()
+    
+    try:
+        rows = call_procedure_with_result(procedure_name, params)
+        future.set_result(rows)
+        return rows
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+async def call_procedure_async(
+    procedure_name: str,
+    params: Optional[Any] = None,
+    commit: bool = False
+) -> List[pyodbc.Row]:
+    """
+    Awaitable version of call_procedure_with_result.
+    
+    With aioodbc installed, the call uses a connection from the enclosing
+    aio_pool_scope() pool (AIO_POOL_MINSIZE..AIO_POOL_MAXSIZE), or its own
+    connection outside a scope. Otherwise pyodbc runs
+    on a worker thread with its own connection. Either way, independent
+    queries started with asyncio.gather() overlap their network waits.
+    
+    Args:
+        procedure_name: Name of the stored procedure
+        params: Dict, tuple, or None (same forms as call_procedure_with_result)
+        commit: If True, commit the transaction
+    
+    Returns:
+        List of rows from the procedure's SELECT statement
+    
+    Example:
+        async with aio_pool_scope():
+            products, purchases = await asyncio.gather(
+                call_procedure_async('usp_ListProducts'),
+                call_procedure_async('usp_ListPurchases')
+            )
+    """
+    if aioodbc is None:
+        return await asyncio.to_thread(call_procedure_with_result, procedure_name, params, commit)
+    
+    sql, values = _procedure_sql(procedure_name, params)
+    pool = _aio_pool.get()
+    if pool is not None:
+        connection_cm = pool.acquire()
+    else:
+        connection_cm = aioodbc.connect(dsn=get_connection_string())
+    async with connection_cm as connection:
+        async with connection.cursor() as cursor:
+            await cursor.execute(sql, values)
+            rows = await cursor.fetchall()
+        if commit:
+            await connection.commit()
+    return rows
+
+
+# aioodbc pools are tied to the event loop that created them, so a pool lives
+# only for an aio_pool_scope() block (closed before the loop ends) instead of
+# being cached per loop; the dashboard runs one asyncio.run() per refresh.
+AIO_POOL_MINSIZE = 5
+AIO_POOL_MAXSIZE = 20
+_aio_pool: ContextVar[Any] = ContextVar('_aio_pool', default=None)
+
+
+@asynccontextmanager
+async def aio_pool_scope():
+    """
+    Open an aioodbc pool for the calls made in this block, then close it.
+    
+    Tasks started inside the block (asyncio.gather) inherit the pool through
+    the context. Outside a scope, call_procedure_async opens a single
+    connection per call instead. No-op when aioodbc is not installed.
+    
+    Usage:
+        async with db.aio_pool_scope():
+            summary, top = await asyncio.gather(...)
+    """
+    if aioodbc is None or _aio_pool.get() is not None:
+        yield
+        return
+    
+    pool = await aioodbc.create_pool(
+        dsn=get_connection_string(),
+        minsize=AIO_POOL_MINSIZE,
+        maxsize=AIO_POOL_MAXSIZE
+    )
+    token = _aio_pool.set(pool)
+    try:
+        yield
+    finally:
+        _aio_pool.reset(token)
+        pool.close()
+        await pool.wait_closed()
 
 
 def call_procedure_scalar(
@@ -774,6 +1260,256 @@ def call_procedure_scalar(
     return None
 
 
+
+def call_procedure_json(procedure_name: str, params: Optional[Any] = None) -> bytes:
+    """
+    Call a procedure that builds its result with FOR JSON and return the document.
+    
+    SQL Server may split FOR JSON output across several rows; they are
+    joined back together here. The text is returned as UTF-8 bytes, ready to
+    be written to a file or response without parsing.
+    
+    Args:
+        procedure_name: Name of the stored procedure
+        params: Dict, tuple, or None (same forms as call_procedure_with_result)
+    
+    Returns:
+        JSON document as bytes (b'null' if the procedure returned no rows)
+    
+    Example:
+        payload = call_procedure_json('usp_GetTopSellingProductsJson', (10, None, None))
+    """
+    rows = call_procedure_with_result(procedure_name, params)
+    text = ''.join(row[0] for row in rows if row[0] is not None)
+    return (text or 'null').encode('utf-8')
+
+
+def call_procedure_status(procedure_name: str, params: Optional[Any] = None) -> int:
+    """
+    Call a stored procedure, commit, and return its RETURN status code.
+    
+    Used with procedures that report expected outcomes (not found, has
+    dependent rows, ...) as a small RETURN code instead of raising.
+    Genuine database errors (THROW, lost connection) still raise pyodbc.Error
+    after the transaction is rolled back.
+    
+    Args:
+        procedure_name: Name of the stored procedure
+        params: Dict, tuple, or None for parameters
+    
+    Returns:
+        The procedure's RETURN value (0 conventionally means success)
+    
+    Example:
+        code = call_procedure_status('usp_DeleteProduct', ('PRD001',))
+    """
+    if not params:
+        param_str, param_values = '', []
+    elif isinstance(params, dict):
+        param_str = ', '.join(f"@{key} = ?" for key in params)
+        param_values = list(params.values())
+    else:
+        param_str = ', '.join(['?'] * len(params))
+        param_values = list(params)
+    
+    sql = (
+        "SET NOCOUNT ON; DECLARE @rc INT; "
+        f"EXEC @rc = dbo.{procedure_name} {param_str}; "
+        "SELECT @rc AS Status;"
+    )
+    with cursor_context(commit=True) as cursor:
+        cursor.execute(sql, param_values)
+        row = cursor.fetchone()
+        return row.Status if row else -1
+
+# Python type -> (SQL type, column size, decimal digits) for Cursor.setinputsizes
+_INPUT_SIZES = {
+    str: (pyodbc.SQL_WVARCHAR, 4000, 0),
+    int: (pyodbc.SQL_INTEGER, 0, 0),
+    float: (pyodbc.SQL_DOUBLE, 0, 0),
+    Decimal: (pyodbc.SQL_DECIMAL, 18, 2),
+    bool: (pyodbc.SQL_BIT, 0, 0),
+    date: (pyodbc.SQL_TYPE_DATE, 0, 0),
+    datetime: (pyodbc.SQL_TYPE_TIMESTAMP, 0, 0),
+}
+
+
+class PreparedProcedure:
+    """
+    Stored procedure call with its SQL text and parameter types fixed up front.
+    
+    Built once (usually as a repository class attribute) by prepare().
+    Every call reuses the same EXEC statement and declares the parameter
+    types with setinputsizes, so the driver neither re-infers them nor
+    sends a different statement text.
+    """
+    
+    def __init__(self, procedure_name: str, types: Sequence[Any]):
+        self.procedure_name = procedure_name
+        self.sql = f"EXEC dbo.{procedure_name} {', '.join(['?'] * len(types))}".rstrip()
+        self.input_sizes = [
+            _INPUT_SIZES[t] if isinstance(t, type) else t for t in types
+        ]
+    
+    def __call__(self, *params: Any) -> bool:
+        """
+        Execute the procedure and commit.
+        
+        Returns:
+            True if successful, False on a database error (rolled back)
+        """
+        with connection_context() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.setinputsizes(self.input_sizes)
+                cursor.execute(self.sql, params)
+                conn.commit()
+                return True
+            except pyodbc.Error:
+                conn.rollback()
+                return False
+            finally:
+                cursor.close()
+    
+    def many(self, rows: Sequence[Sequence[Any]]) -> bool:
+        """
+        Execute the procedure once per row in a single batch and commit.
+        
+        The statement is prepared once and reused for every row.
+        
+        Returns:
+            True if all rows succeeded, False on a database error (rolled back)
+        """
+        if not rows:
+            return True
+        with connection_context() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.fast_executemany = True
+                cursor.setinputsizes(self.input_sizes)
+                cursor.executemany(self.sql, rows)
+                conn.commit()
+                return True
+            except pyodbc.Error:
+                conn.rollback()
+                return False
+            finally:
+                cursor.close()
+
+
+def prepare(procedure_name: str, types: Sequence[Any]) -> PreparedProcedure:
+    """
+    Create a reusable call for a stored procedure with a fixed signature.
+    
+    Args:
+        procedure_name: Name of the stored procedure
+        types: Python type (str, int, float, Decimal, bool, date, datetime)
+               or explicit (sql_type, size, digits) tuple for each parameter,
+               in the procedure's parameter order
+    
+    Returns:
+        PreparedProcedure; call it with the positional parameter values
+    
+    Example:
+        _ADD_CATEGORY = prepare('usp_AddCategory', (str, str, str))
+        _ADD_CATEGORY('CAT005', 'Audio', 'Audio accessories')
+    """
+    return PreparedProcedure(procedure_name, types)
+
+
+# =============================================================================
+# ERROR HANDLING / RETRY HELPERS
+# =============================================================================
+
+# SQLSTATE 40001 = serialization failure; SQL Server native error 1205 = deadlock victim
+DEADLOCK_SQLSTATES = frozenset({'40001'})
+DEADLOCK_NATIVE_CODE = '(1205)'
+
+
+def is_deadlock(error: pyodbc.Error) -> bool:
+    """
+    Check whether a pyodbc error is a retryable deadlock/serialization failure.
+    
+    Args:
+        error: Exception raised by pyodbc
+    
+    Returns:
+        True if the statement was chosen as a deadlock victim
+    """
+    if error.args and error.args[0] in DEADLOCK_SQLSTATES:
+        return True
+    return DEADLOCK_NATIVE_CODE in str(error)
+
+
+# SQL Server native error 2812 = could not find stored procedure
+MISSING_PROCEDURE_NATIVE_CODE = '(2812)'
+
+
+def is_missing_procedure(error: pyodbc.Error) -> bool:
+    """
+    Check whether a pyodbc error means the stored procedure does not exist.
+    
+    Used by optional fast paths that fall back on older databases; any other
+    ProgrammingError (syntax, parameters, permissions) must still be raised.
+    
+    Args:
+        error: Exception raised by pyodbc
+    
+    Returns:
+        True if SQL Server could not find the procedure
+    """
+    return MISSING_PROCEDURE_NATIVE_CODE in str(error)
+
+
+def retry_on_deadlock(fn: Callable[[], T], tries: int = 3, base_delay: float = 0.05) -> T:
+    """
+    Call fn(), retrying with exponential backoff if it loses a deadlock.
+    
+    Only deadlock/serialization failures are retried; every other error
+    (constraint violations, RAISERROR validation, etc.) is raised at once.
+    
+    Args:
+        fn: Zero-argument callable doing the database work. It must let
+            pyodbc errors propagate (e.g. call_procedure(..., raise_errors=True))
+        tries: Maximum number of attempts
+        base_delay: Delay in seconds before the first retry (doubled each time)
+    
+    Returns:
+        Whatever fn() returns
+    
+    Example:
+        retry_on_deadlock(lambda: call_procedure(
+            'usp_AdjustInventory', ('PRD001', -2, 'Damaged'),
+            has_output=False, raise_errors=True
+        ))
+    """
+    for attempt in range(tries):
+        try:
+            return fn()
+        except pyodbc.Error as e:
+            if attempt == tries - 1 or not is_deadlock(e):
+                raise
+            time.sleep(base_delay * (2 ** attempt))
+
+
+def error_message(error: pyodbc.Error) -> str:
+    """
+    Extract the server message from a pyodbc error.
+    
+    Strips the '[Microsoft][ODBC Driver ...][SQL Server]' prefixes and the
+    trailing native error code so the text can be shown to the user.
+    
+    Args:
+        error: Exception raised by pyodbc
+    
+    Returns:
+        The plain error message text
+    """
+    message = error.args[1] if len(error.args) > 1 else str(error)
+    message = message.rsplit(']', 1)[-1]
+    return message.split(' (', 1)[0].strip()
+
+
 # =============================================================================
 # PAGINATION HELPER
 # =============================================================================
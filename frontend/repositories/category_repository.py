@@ -14,6 +14,8 @@ Changes Applied:
 - MIGRATED TO STORED PROCEDURES for all CRUD operations
 - Uses usp_AddCategory, usp_UpdateCategory, usp_DeleteCategory
 - Uses usp_GetCategoryById, usp_ListCategories, usp_GetNextCategoryId
+- delete_cascade() removes a category and its subcategories in one call
+  (usp_DeleteCategoryCascade, single transaction)
 - Maintains backward-compatible interface for existing UI code
 
 =============================================================================
@@ -23,6 +25,7 @@ from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 import db
 from repositories.field_mapper import map_category
+from repositories.subcategory_repository import SubcategoryRepository
 
 
 @dataclass
@@ -74,6 +77,13 @@ class CategoryRepository:
     NOW USES STORED PROCEDURES for all database operations.
     """
     
+    # RETURN codes of usp_DeleteCategoryCascade
+    _DELETE_CASCADE_RESULTS = {
+        0: (True, "Category and its subcategories deleted successfully"),
+        1: (False, "Category not found"),
+        2: (False, "Cannot delete: Products exist in this category's subcategories"),
+    }
+    
     @staticmethod
     def get_all() -> List[Category]:
         """
@@ -174,6 +184,30 @@ class CategoryRepository:
         except Exception as e:
             return False, str(e)
     
+    @staticmethod
+    def delete_cascade(cat_id: str) -> tuple[bool, str]:
+        """
+        Delete a category together with all of its subcategories.
+        Uses: usp_DeleteCategoryCascade
+        
+        Both deletes run in one transaction on the server, so nothing is
+        removed if any subcategory still has products.
+        
+        Args:
+            cat_id: Category ID to delete
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        
+        Raises:
+            pyodbc.Error: On unexpected database errors
+        """
+        code = db.call_procedure_status('usp_DeleteCategoryCascade', (cat_id,))
+        SubcategoryRepository.invalidate()
+        return CategoryRepository._DELETE_CASCADE_RESULTS.get(
+            code, (False, "Category could not be deleted")
+        )
+    
     @staticmethod
     def get_next_id() -> str:
         """
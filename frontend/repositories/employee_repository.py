@@ -9,13 +9,15 @@ All operations use stored procedures from stored_procedures.sql:
 - usp_GetEmployeeById: Get employee by ID
 - usp_GetEmployeeByUsername: Get employee by username (includes password_hash)
 - usp_GetEmployeeWithPassword: Get employee with password for authentication
-- usp_AddEmployee: Create new employee
+- usp_AddEmployee: Create new employee (RETURN 1 if the username is taken)
 - usp_UpdateEmployee: Update employee details
 - usp_DeleteEmployee: Delete employee
 - usp_GetNextEmployeeId: Generate next employee ID
 - usp_ChangeEmployeePassword: Change employee password
 - usp_CheckSalesExistForEmployee: Check if employee has sales records
 
+The employee list is cached for 30s; every write clears it.
+
 =============================================================================
 """
 
@@ -24,6 +26,7 @@ from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 import db
+from repositories.ttl_cache import TTLCache
 
 # Password hashing with pbkdf2_sha256
 from passlib.hash import pbkdf2_sha256
@@ -93,6 +96,20 @@ class EmployeeRepository:
     ALL METHODS USE STORED PROCEDURES.
     """
     
+    # usp_ListEmployees result (key 'all'), shared by get_all,
+    # get_all_employees and get_for_dropdown. Cleared on employee writes.
+    _cache = TTLCache(maxsize=1, ttl=30)
+    
+    # RETURN codes of usp_AddEmployee
+    _CREATE_RESULTS = {
+        0: (True, "Employee created successfully"),
+        1: (False, "Username already exists"),
+        2: (False, "An employee with this ID already exists"),
+    }
+    
+    # Every hash written by hash_password() starts with this
+    _HASH_PREFIX = '$pbkdf2-sha256$'
+    
     @staticmethod
     def hash_password(password: str) -> str:
         """Hash a password using pbkdf2_sha256."""
@@ -101,6 +118,9 @@ class EmployeeRepository:
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
         """Verify a password against its hash."""
+        # Reject other formats (e.g. the sample admin row) without parsing them
+        if not password_hash.startswith(EmployeeRepository._HASH_PREFIX):
+            return False
         try:
             return pbkdf2_sha256.verify(password, password_hash)
         except Exception:
@@ -137,8 +157,17 @@ class EmployeeRepository:
         Retrieve all employees.
         Uses: usp_ListEmployees
         """
-        rows = db.call_procedure_with_result('usp_ListEmployees')
-        return [Employee.from_row(row) for row in rows]
+        employees = EmployeeRepository._cache.get('all')
+        if employees is None:
+            rows = db.call_procedure_with_result('usp_ListEmployees')
+            employees = [Employee.from_row(row) for row in rows]
+            EmployeeRepository._cache.set('all', employees)
+        return list(employees)
+    
+    @staticmethod
+    def invalidate() -> None:
+        """Drop the cached employee list (after an employee change)."""
+        EmployeeRepository._cache.clear()
     
     @staticmethod
     def get_all_employees() -> List[Dict[str, Any]]:
@@ -207,13 +236,10 @@ class EmployeeRepository:
         """
         Create a new employee.
         Uses: usp_AddEmployee
-        """
-        # Check if username is already taken
-        if username:
-            existing = EmployeeRepository.get_by_username(username)
-            if existing:
-                return False, "Username already exists"
         
+        A taken username is reported by the procedure (unique index on
+        Username), so this is a single round trip.
+        """
         # Hash password if provided
         password_hash = None
         if password:
@@ -222,7 +248,7 @@ class EmployeeRepository:
         try:
             # usp_AddEmployee params: EmployeeId, EmployeeName, Phone, Email, 
             # Position, Salary, Username, PasswordHash, Role
-            success = db.call_procedure('usp_AddEmployee', (
+            code = db.call_procedure_status('usp_AddEmployee', (
                 employee_id,
                 employee_name,
                 phone,
@@ -232,12 +258,13 @@ class EmployeeRepository:
                 username,
                 password_hash,
                 role
-            ), has_output=False)
+            ))
             
-            if success:
-                return True, "Employee created successfully"
-            else:
-                return False, "Failed to create employee"
+            if code == 0:
+                EmployeeRepository.invalidate()
+            return EmployeeRepository._CREATE_RESULTS.get(
+                code, (False, "Failed to create employee")
+            )
         except Exception as e:
             return False, f"Failed to create employee: {str(e)}"
     
@@ -259,11 +286,6 @@ class EmployeeRepository:
         if not employee_name or not username or not password:
             return False, "Employee name, username, and password are required"
         
-        # Check if username already exists
-        existing = EmployeeRepository.get_by_username(username)
-        if existing:
-            return False, "Username already exists"
-        
         # Generate new employee ID
         new_id = EmployeeRepository.get_next_id()
         
@@ -340,6 +362,7 @@ class EmployeeRepository:
             ), has_output=False)
             
             if success:
+                EmployeeRepository.invalidate()
                 return True, "Employee updated successfully"
             else:
                 return False, "Employee not found"
@@ -385,6 +408,7 @@ class EmployeeRepository:
         try:
             success = db.call_procedure('usp_DeleteEmployee', (employee_id,), has_output=False)
             if success:
+                EmployeeRepository.invalidate()
                 return True, "Employee deleted successfully"
             else:
                 return False, "Employee not found"
@@ -19,9 +19,11 @@ Why Changed: Eliminates runtime AttributeError exceptions from DB/UI naming mism
 =============================================================================
 """
 
-from typing import Any, Dict
-from decimal import Decimal
+import sys
+from typing import Any, Callable, Dict, Optional, Sequence
+from decimal import Decimal, ROUND_HALF_UP
 from datetime import date, datetime
+from functools import lru_cache
 
 
 def to_snake_case(name: str) -> str:
@@ -34,6 +36,123 @@ def to_snake_case(name: str) -> str:
     return ''.join(result)
 
 
+def to_decimal(value: Any) -> Decimal:
+    """
+    Convert a DB money value to Decimal, memoizing repeated prices.
+    
+    Decimal inputs are returned as-is (pyodbc already returns DECIMAL
+    columns as Decimal); ints and floats go through a bounded LRU cache
+    because price tiers repeat heavily across catalog rows.
+    """
+    if isinstance(value, Decimal):
+        return value
+    return _parse_decimal(value)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _parse_decimal(value: Any) -> Decimal:
+    if isinstance(value, int):
+        return Decimal(value)
+    # repr() keeps the shortest round-tripping form of a float
+    return Decimal(repr(value)) if isinstance(value, float) else Decimal(str(value))
+
+
+_ONE = Decimal(1)
+
+
+def to_cents(value: Any) -> Optional[int]:
+    """
+    Convert a DB money value (DECIMAL(10,2)) to an integer number of cents.
+    
+    Decimal arithmetic is exact, so 12.34 becomes exactly 1234; values with
+    more than two decimal places are rounded half-up. None stays None.
+    """
+    if value is None:
+        return None
+    if type(value) is int:
+        return value * 100
+    return int(to_decimal(value).scaleb(2).quantize(_ONE, rounding=ROUND_HALF_UP))
+
+
+@lru_cache(maxsize=4096)
+def from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a 2-place Decimal (memoized)."""
+    return Decimal(cents).scaleb(-2)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def to_float(value: Decimal) -> float:
+    """Convert a Decimal price to float for serialization (memoized)."""
+    return float(value)
+
+
+# Shared instances for low-cardinality text columns (brand, category names, ...)
+_INTERN: Dict[str, str] = {}
+_INTERN_MAX = 1024
+
+
+def intern_str(value: Any) -> Any:
+    """
+    Return a shared instance of a repeated string column value.
+    
+    Columns such as Brand or Cat_Name hold a few dozen distinct values
+    across thousands of rows; interning them lets every row point at the
+    same str object. Non-strings (including None) are returned unchanged.
+    """
+    if not isinstance(value, str):
+        return value
+    shared = _INTERN.get(value)
+    if shared is None:
+        shared = sys.intern(value)
+        if len(_INTERN) < _INTERN_MAX:
+            _INTERN[shared] = shared
+    return shared
+
+
+def compile_row_factory(
+    cls: type,
+    required: Sequence[str],
+    optional: Sequence[str] = (),
+    converters: Optional[Dict[str, Callable[[Any], Any]]] = None
+) -> Callable[[Any], Any]:
+    """
+    Build a straight-line ``row -> cls`` constructor at import time.
+
+    The generated function passes columns positionally, in the order given,
+    so ``required`` followed by ``optional`` must match the dataclass field
+    order. Required columns are read as plain attributes; optional columns
+    fall back to None when the procedure does not return them.
+
+    Args:
+        cls: Dataclass to construct
+        required: Column names always present in the result set
+        optional: Column names that may be missing from the result set
+        converters: Optional mapping of column name -> conversion callable
+
+    Returns:
+        Function taking a database row and returning a ``cls`` instance
+
+    Example:
+        InventoryItem.from_row = staticmethod(compile_row_factory(
+            InventoryItem, ('Product_Code', 'Current_Stock'), ('Brand',)))
+    """
+    converters = converters or {}
+    namespace: Dict[str, Any] = {'_cls': cls, '_getattr': getattr}
+    args = []
+    for column in required:
+        args.append(f"row.{column}")
+    for column in optional:
+        args.append(f"_getattr(row, {column!r}, None)")
+    for index, column in enumerate(list(required) + list(optional)):
+        if column in converters:
+            namespace[f"_conv_{column}"] = converters[column]
+            args[index] = f"_conv_{column}({args[index]})"
+    
+    source = f"def _from_row(row):\n    return _cls({', '.join(args)})\n"
+    exec(source, namespace)
+    return namespace['_from_row']
+
+
 def map_row_to_dict(row: Any) -> Dict[str, Any]:
     """Convert a database row object to a dictionary with snake_case keys."""
     if row is None:
@@ -0,0 +1,58 @@
+"""
+=============================================================================
+ID Pool
+=============================================================================
+Thread-safe pool of pre-allocated IDs, used by the repositories to hand out
+new keys without a stored procedure call per insert.
+
+IDs are reserved from the database in ranges of `batch_size` (backed by a
+sequence, so ranges never overlap between clients) and handed out locally
+until the range runs out. IDs left unused when the application exits are
+simply skipped, which leaves gaps in the numbering but never duplicates.
+
+Usage:
+    _invoice_ids = IdPool(reserve_invoice_range, batch_size=50)
+
+    invoice_no = _invoice_ids.next()
+
+=============================================================================
+"""
+
+import threading
+from collections import deque
+from typing import Callable, Iterable
+
+
+class IdPool:
+    """
+    Hands out IDs from ranges reserved in bulk.
+    
+    Attributes:
+        batch_size: Number of IDs reserved per database call
+    """
+    
+    def __init__(self, reserve: Callable[[int], Iterable[str]], batch_size: int = 50):
+        """
+        Args:
+            reserve: Callable that reserves `count` IDs and returns them in order
+            batch_size: Number of IDs to reserve whenever the pool runs empty
+        """
+        self.batch_size = batch_size
+        self._reserve = reserve
+        self._ids: 'deque[str]' = deque()
+        self._lock = threading.Lock()
+    
+    def next(self) -> str:
+        """Return the next unused ID, reserving a new range if needed."""
+        with self._lock:
+            if not self._ids:
+                self._ids.extend(self._reserve(self.batch_size))
+            return self._ids.popleft()
+    
+    def clear(self) -> None:
+        """Drop any IDs still held (they are not returned to the database)."""
+        with self._lock:
+            self._ids.clear()
+    
+    def __len__(self) -> int:
+        return len(self._ids)
@@ -13,6 +13,7 @@ Table Schema:
 
 Stored Procedures Used:
 - usp_ListInventory: Get all inventory with product details
+- usp_ListInventoryFiltered: Get inventory filtered by category/brand/low stock
 - usp_GetInventoryByProduct: Get inventory for a specific product
 - usp_GetLowStockProducts: Get products below min stock level
 - usp_AdjustInventory: Manually adjust stock level
@@ -21,10 +22,15 @@ Stored Procedures Used:
 =============================================================================
 """
 
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Iterable, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
+import threading
+import time
+import pyodbc
 import db
+from repositories.field_mapper import compile_row_factory
+from repositories.product_repository import ProductRepository
 
 
 @dataclass
@@ -69,21 +75,12 @@ class InventoryItem:
     cost_price: Optional[float] = None
     subcat_name: Optional[str] = None
     cat_name: Optional[str] = None
+    _low_stock: bool = field(init=False, repr=False, compare=False)
     
-    @classmethod
-    def from_row(cls, row) -> 'InventoryItem':
-        """Create an InventoryItem instance from a database row."""
-        return cls(
-            product_code=row.Product_Code,
-            current_stock=row.Current_Stock,
-            last_updated=row.Last_Updated,
-            product_name=getattr(row, 'Product_Name', None),
-            brand=getattr(row, 'Brand', None),
-            min_stock_level=getattr(row, 'Min_Stock_Level', None),
-            retail_price=getattr(row, 'Retail_Price', None),
-            cost_price=getattr(row, 'Cost_Price', None),
-            subcat_name=getattr(row, 'Subcat_Name', None),
-            cat_name=getattr(row, 'Cat_Name', None)
+    def __post_init__(self):
+        # Checked per row by the inventory filters and counters
+        self._low_stock = (
+            self.min_stock_level is not None and self.current_stock <= self.min_stock_level
         )
     
     @property
@@ -105,12 +102,11 @@ class InventoryItem:
     def subcategory_name(self) -> Optional[str]:
         """Alias for subcat_name - UI compatibility."""
         return self.subcat_name
+    
     @property
     def is_low_stock(self) -> bool:
-        """Check if stock is at or below minimum level."""
-        if self.min_stock_level is None:
-            return False
-        return self.current_stock <= self.min_stock_level
+        """Whether stock is at or below minimum level (computed at construction)."""
+        return self._low_stock
     
     @property
     def stock_value(self) -> float:
@@ -127,6 +123,28 @@ class InventoryItem:
         return self.current_stock * self.retail_price
 
 
+# Generated once at import: positional constructor call, no per-row kwargs dict
+InventoryItem.from_row = staticmethod(compile_row_factory(
+    InventoryItem,
+    required=('Product_Code', 'Current_Stock', 'Last_Updated'),
+    optional=('Product_Name', 'Brand', 'Min_Stock_Level', 'Retail_Price',
+              'Cost_Price', 'Subcat_Name', 'Cat_Name')
+))
+
+
+# Process-level cache for usp_GetInventorySummary (dashboard renders call it a
+# lot). Cleared whenever this process changes stock.
+_SUMMARY_TTL = 5.0
+_summary_cache: Dict[str, Any] = {'ts': 0.0, 'val': None}
+_summary_lock = threading.Lock()
+
+
+def _invalidate_summary_cache() -> None:
+    """Drop the cached inventory summary after a stock change."""
+    with _summary_lock:
+        _summary_cache['val'] = None
+
+
 class InventoryRepository:
     """
     Repository class for INVENTORY table operations.
@@ -138,14 +156,58 @@ class InventoryRepository:
     """
     
     @staticmethod
-    def get_all() -> List[InventoryItem]:
+    def invalidate(product_codes: Optional[Iterable[str]] = None) -> None:
+        """
+        Drop cached stock after a change made outside this repository
+        (a sale or a received purchase).
+        
+        Args:
+            product_codes: Products whose stock changed, or None to clear
+                           every cached product
+        """
+        _invalidate_summary_cache()
+        if product_codes is None:
+            ProductRepository.invalidate()
+        else:
+            for product_code in product_codes:
+                ProductRepository.invalidate(product_code)
+    
+    @staticmethod
+    def get_all(low_stock_only: bool = False) -> List[InventoryItem]:
         """
         Retrieve all inventory records with product details.
         
+        Args:
+            low_stock_only: If True, only return items at or below their
+                minimum stock level (filtered in SQL, not in Python)
+        
         Returns:
             List of InventoryItem objects
         """
-        rows = db.call_procedure_with_result('usp_ListInventory', ())
+        procedure = 'usp_GetLowStockProducts' if low_stock_only else 'usp_ListInventory'
+        rows = db.call_procedure_with_result(procedure, ())
+        return [InventoryItem.from_row(row) for row in rows]
+    
+    @staticmethod
+    def get_filtered(
+        category: Optional[str] = None,
+        brand: Optional[str] = None,
+        low_stock: bool = False
+    ) -> List[InventoryItem]:
+        """
+        Retrieve inventory records filtered on the server.
+        
+        Args:
+            category: Optional category ID (Cat_ID) to filter by
+            brand: Optional brand name to filter by
+            low_stock: If True, only return items at or below minimum level
+        
+        Returns:
+            List of InventoryItem objects matching all given filters
+        """
+        rows = db.call_procedure_with_result(
+            'usp_ListInventoryFiltered', (category, brand, 1 if low_stock else 0)
+        )
         return [InventoryItem.from_row(row) for row in rows]
     
     @staticmethod
@@ -222,13 +284,17 @@ class InventoryRepository:
         adjustment = new_stock - current
         
         try:
-            return db.call_procedure('usp_AdjustInventory', (
+            success = db.retry_on_deadlock(lambda: db.call_procedure('usp_AdjustInventory', (
                 product_code,
                 adjustment,
                 'Manual stock update'
-            ), has_output=False)
-        except Exception:
+            ), has_output=False, raise_errors=True))
+        except pyodbc.Error:
             return False
+        if success:
+            _invalidate_summary_cache()
+            ProductRepository.invalidate(product_code)
+        return success
     
     @staticmethod
     def adjust_stock(product_code: str, adjustment: int, reason: str = '') -> bool:
@@ -243,16 +309,46 @@ class InventoryRepository:
         Returns:
             True if adjusted successfully
         
+        Note: This will fail if adjustment would result in negative stock.
+        """
+        success, _ = InventoryRepository.adjust_stock_with_message(
+            product_code, adjustment, reason
+        )
+        return success
+    
+    @staticmethod
+    def adjust_stock_with_message(product_code: str, adjustment: int,
+                                  reason: str = '') -> Tuple[bool, str]:
+        """
+        Adjust stock level and report why a failed adjustment was rejected.
+        
+        Deadlocks are retried automatically; other database errors are
+        reported through the returned message.
+        
+        Args:
+            product_code: Product code to adjust
+            adjustment: Amount to add (positive) or subtract (negative)
+            reason: Reason for adjustment (for logging)
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        
         Note: This will fail if adjustment would result in negative stock.
         """
         try:
-            return db.call_procedure('usp_AdjustInventory', (
+            db.retry_on_deadlock(lambda: db.call_procedure('usp_AdjustInventory', (
                 product_code,
                 adjustment,
                 reason if reason else 'Manual adjustment'
-            ), has_output=False)
-        except Exception:
-            return False
+            ), has_output=False, raise_errors=True))
+        except pyodbc.OperationalError as e:
+            return False, f"Database busy, please try again: {db.error_message(e)}"
+        except pyodbc.Error as e:
+            return False, db.error_message(e)
+        
+        _invalidate_summary_cache()
+        ProductRepository.invalidate(product_code)
+        return True, "Stock adjusted successfully"
     
     @staticmethod
     def check_stock_available(product_code: str, quantity: int) -> bool:
@@ -277,24 +373,37 @@ class InventoryRepository:
         Returns:
             Dict with 'cost_value' and 'retail_value'
         """
-        rows = db.call_procedure_with_result('usp_GetInventorySummary', ())
-        if rows:
-            row = rows[0]
-            return {
-                'cost_value': float(getattr(row, 'Cost_Value', 0) or 0),
-                'retail_value': float(getattr(row, 'Retail_Value', 0) or 0)
-            }
-        return {'cost_value': 0.0, 'retail_value': 0.0}
+        summary = InventoryRepository.get_inventory_summary()
+        return {
+            'cost_value': summary['cost_value'],
+            'retail_value': summary['retail_value']
+        }
     
     @staticmethod
     def get_inventory_summary() -> Dict[str, Any]:
         """
         Get summary statistics for inventory.
         
+        Results are cached for a few seconds (_SUMMARY_TTL) and dropped
+        as soon as stock is changed through this repository.
+        
         Returns:
             Dict with total_products, total_units, low_stock_count,
             cost_value, retail_value
         """
+        cached = _summary_cache['val']
+        if cached is not None and time.monotonic() - _summary_cache['ts'] < _SUMMARY_TTL:
+            return dict(cached)
+        
+        summary = InventoryRepository._load_inventory_summary()
+        with _summary_lock:
+            _summary_cache['val'] = summary
+            _summary_cache['ts'] = time.monotonic()
+        return dict(summary)
+    
+    @staticmethod
+    def _load_inventory_summary() -> Dict[str, Any]:
+        """Run usp_GetInventorySummary and map its single row."""
         rows = db.call_procedure_with_result('usp_GetInventorySummary', ())
         if rows:
             row = rows[0]
@@ -15,20 +15,25 @@ Stored Procedures Used:
 - usp_AddPayment: Create new payment
 - usp_GetPaymentById: Get single payment
 - usp_GetPaymentsBySale: Get payments for an invoice
+- usp_GetInvoiceWithPayments: Get invoice header and its payments in one call
 - usp_ListPayments: List all payments
+- usp_GetNextPaymentId / usp_GetNextPaymentIds: Allocate IDs from dbo.PaymentSeq
 - usp_GetPaymentSummary: Get payment statistics
 
 =============================================================================
 """
 
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Iterable, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+import re
+import pyodbc
 import db
+from repositories.field_mapper import compile_row_factory
 
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     """
     Data class representing a payment.
@@ -45,17 +50,11 @@ class Payment:
     payment_method: str
     amount_paid: Decimal
     payment_date: datetime
+    _amount_f: float = field(init=False, repr=False, compare=False)
     
-    @classmethod
-    def from_row(cls, row) -> 'Payment':
-        """Create a Payment instance from a database row."""
-        return cls(
-            payment_id=row.Payment_ID,
-            invoice_no=row.Invoice_No,
-            payment_method=row.Payment_Method,
-            amount_paid=Decimal(str(row.Amount_Paid)),
-            payment_date=row.Payment_Date
-        )
+    def __post_init__(self):
+        # Serialized on every listing; convert the Decimal once
+        self._amount_f = float(self.amount_paid)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -63,9 +62,47 @@ class Payment:
             'payment_id': self.payment_id,
             'invoice_no': self.invoice_no,
             'payment_method': self.payment_method,
-            'amount_paid': float(self.amount_paid),
-            'payment_date': str(self.payment_date)
+            'amount_paid': self._amount_f,
+            'payment_date': self.payment_date.isoformat() if self.payment_date else None
         }
+    
+    @staticmethod
+    def to_dicts(payments: List['Payment']) -> List[Dict[str, Any]]:
+        """
+        Convert many payments to dictionaries in one pass.
+        
+        Args:
+            payments: Payment objects to serialize
+        
+        Returns:
+            List of dicts in the same shape as Payment.to_dict()
+        """
+        return [
+            {
+                'payment_id': p.payment_id,
+                'invoice_no': p.invoice_no,
+                'payment_method': p.payment_method,
+                'amount_paid': p._amount_f,
+                'payment_date': p.payment_date.isoformat() if p.payment_date else None
+            }
+            for p in payments
+        ]
+
+
+# Generated once at import: positional constructor call, no per-row kwargs dict
+Payment.from_row = staticmethod(compile_row_factory(
+    Payment,
+    required=('Payment_ID', 'Invoice_No', 'Payment_Method', 'Amount_Paid', 'Payment_Date'),
+    converters={'Amount_Paid': lambda value: Decimal(str(value))}
+))
+
+
+# A missing invoice surfaces as SQL Server native error 547 (constraint
+# conflict) naming FK_PAYMENT_SALE. SQLSTATE 23000 alone is not enough: it
+# also covers duplicate keys and CHECK failures.
+FK_VIOLATION_NATIVE_CODE = '(547)'
+INVOICE_FK_NAME = 'FK_PAYMENT_SALE'
+_NOT_FOUND_RE = re.compile(r'invoice|not found', re.IGNORECASE)
 
 
 class PaymentRepository:
@@ -133,6 +170,21 @@ class PaymentRepository:
         payments = PaymentRepository.get_by_invoice(invoice_no)
         return sum((p.amount_paid for p in payments), Decimal('0'))
     
+    @staticmethod
+    def get_invoice_detail(invoice_no: str) -> Tuple[Optional[Any], List[Payment]]:
+        """
+        Retrieve an invoice header and its payments in a single round-trip.
+        
+        Args:
+            invoice_no: Invoice number to look up
+        
+        Returns:
+            Tuple of (sale row or None if not found, list of Payment objects)
+        """
+        sale_rows, payment_rows = db.call_procedure_multi('usp_GetInvoiceWithPayments', (invoice_no,))
+        sale_row = sale_rows[0] if sale_rows else None
+        return sale_row, [Payment.from_row(row) for row in payment_rows]
+    
     @staticmethod
     def get_balance_due(invoice_no: str) -> Decimal:
         """
@@ -142,18 +194,19 @@ class PaymentRepository:
             invoice_no: Invoice number
         
         Returns:
-            Balance due (invoice net amount - total payments)
+            Balance due (invoice net amount - total payments), or 0 if the
+            invoice does not exist
+        
+        Raises:
+            pyodbc.Error: On database errors other than a retried deadlock
         """
-        # Get invoice total from sale
-        sql = "EXEC usp_GetSaleById @InvoiceNo = ?"
-        try:
-            rows = db.call_procedure_with_result('usp_GetSaleById', (invoice_no,))
-            if rows:
-                net_amount = Decimal(str(rows[0].Net_Amount))
-                total_paid = PaymentRepository.get_total_paid(invoice_no)
-                return net_amount - total_paid
-        except Exception:
-            pass
+        sale_row, payments = db.retry_on_deadlock(
+            lambda: PaymentRepository.get_invoice_detail(invoice_no)
+        )
+        if sale_row:
+            net_amount = Decimal(str(sale_row.Net_Amount))
+            total_paid = sum((p.amount_paid for p in payments), Decimal('0'))
+            return net_amount - total_paid
         return Decimal('0')
     
     @staticmethod
@@ -172,14 +225,11 @@ class PaymentRepository:
             invoice_no: Invoice being paid
             payment_method: Payment method used
             amount_paid: Amount of payment
-            payment_date: Date/time of payment (default: now)
+            payment_date: Date/time of payment (default: now, assigned by the database)
         
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if payment_date is None:
-            payment_date = datetime.now()
-        
         try:
             result = db.call_procedure('usp_AddPayment', (
                 payment_id,
@@ -187,17 +237,21 @@ class PaymentRepository:
                 payment_method,
                 float(amount_paid),
                 payment_date
-            ), has_output=False)
+            ), has_output=False, raise_errors=True)
             
             if result:
                 return True, "Payment recorded successfully"
             else:
                 return False, "Failed to record payment"
-        except Exception as e:
+        except pyodbc.Error as e:
             error_msg = str(e)
-            if 'invoice' in error_msg.lower() or 'not found' in error_msg.lower():
+            if FK_VIOLATION_NATIVE_CODE in error_msg and INVOICE_FK_NAME in error_msg:
+                return False, "Invoice not found"
+            if _NOT_FOUND_RE.search(error_msg):
                 return False, "Invoice not found"
             return False, f"Failed to record payment: {error_msg}"
+        except Exception as e:
+            return False, f"Failed to record payment: {str(e)}"
     
     @staticmethod
     def delete(payment_id: str) -> tuple[bool, str]:
@@ -229,6 +283,50 @@ class PaymentRepository:
         """
         return db.call_procedure_scalar('usp_GetNextPaymentId', (), 'NextId')
     
+    @staticmethod
+    def get_next_ids(n: int) -> List[str]:
+        """
+        Allocate several payment IDs in a single round-trip.
+        
+        IDs come from the dbo.PaymentSeq sequence, so they are reserved
+        even if the caller ends up not using all of them.
+        
+        Args:
+            n: Number of IDs to allocate
+        
+        Returns:
+            List of n IDs in format 'PAY###', in ascending order
+        """
+        if n < 1:
+            return []
+        rows = db.call_procedure_with_result('usp_GetNextPaymentIds', (n,), commit=True)
+        return [row.NextId for row in rows]
+    
+    @staticmethod
+    def create_many(
+        payments: Iterable[Tuple[str, str, Decimal, Optional[datetime]]]
+    ) -> List[Tuple[str, bool, str]]:
+        """
+        Create several payments, allocating all IDs up front.
+        
+        Args:
+            payments: Iterable of (invoice_no, payment_method, amount_paid,
+                payment_date) tuples; payment_date may be None
+        
+        Returns:
+            List of (payment_id, success, message) tuples in input order
+        """
+        payments = list(payments)
+        payment_ids = PaymentRepository.get_next_ids(len(payments))
+        
+        results = []
+        for payment_id, (invoice_no, payment_method, amount_paid, payment_date) in zip(payment_ids, payments):
+            success, message = PaymentRepository.create(
+                payment_id, invoice_no, payment_method, amount_paid, payment_date
+            )
+            results.append((payment_id, success, message))
+        return results
+    
     @staticmethod
     def get_payment_summary_by_method(start_date=None, end_date=None) -> List[Dict[str, Any]]:
         """
@@ -17,24 +17,40 @@ Stored Procedures Used:
 - usp_UpdateProduct: Update existing product
 - usp_DeleteProduct: Delete product
 - usp_GetProductByCode: Get single product
+- usp_GetProductsByCodes: Get several products by code (TVP)
 - usp_ListProducts: Get all products
 - usp_GetProductsByCategory: Get products by category
 - usp_GetProductsBySubcategory: Get products by subcategory
 - usp_SearchProducts: Search with filters
 - usp_GetLowStockProducts: Get products below min stock
+- usp_GetStockColumns: Get code/stock/min-stock columns only
 - usp_GetNextProductCode: Generate next product code
 
 =============================================================================
 """
 
-from typing import List, Optional, Dict, Any, Tuple
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple, ClassVar, Iterator
+import asyncio
+from operator import attrgetter
+from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
 import db
+from repositories.field_mapper import from_cents, intern_str, to_cents
+from repositories.ttl_cache import TTLCache
 
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
 
-@dataclass
+# usp_SearchProducts columns used by get_for_autocomplete (the SP always returns them)
+_AUTOCOMPLETE_COLUMNS = attrgetter(
+    'Product_Code', 'Product_Name', 'Brand', 'Retail_Price', 'Current_Stock'
+)
+
+
+@dataclass(slots=True)
 class Product:
     """
     Data class representing a product.
@@ -45,8 +61,8 @@ class Product:
         product_name: Display name
         brand: Manufacturer/brand name
         description: Detailed description
-        cost_price: Purchase cost from supplier
-        retail_price: Selling price to customers
+        cost_price_cents: Purchase cost from supplier, in cents
+        retail_price_cents: Selling price to customers, in cents
         min_stock_level: Minimum stock before reorder alert
         date_added: Date product was added to system
         subcat_name: Subcategory name (joined)
@@ -58,72 +74,100 @@ class Product:
     product_name: str
     brand: Optional[str]
     description: Optional[str]
-    cost_price: Decimal
-    retail_price: Decimal
+    cost_price_cents: int
+    retail_price_cents: int
     min_stock_level: int
     date_added: date
     subcat_name: Optional[str] = None
     cat_name: Optional[str] = None
     current_stock: Optional[int] = None
+    _profit_margin_cents: int = field(init=False, repr=False, compare=False)
+    _low_stock: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Read on every row of list/dashboard renders; compute once
+        self._profit_margin_cents = self.retail_price_cents - self.cost_price_cents
+        self._low_stock = self.current_stock is None or self.current_stock < self.min_stock_level
     
     @classmethod
     def from_row(cls, row) -> 'Product':
         """Create a Product instance from a database row."""
         return cls(
             product_code=row.Product_Code,
-            subcat_id=row.Subcat_ID,
+            subcat_id=intern_str(row.Subcat_ID),
             product_name=row.Product_Name,
-            brand=getattr(row, 'Brand', None),
+            brand=intern_str(getattr(row, 'Brand', None)),
             description=getattr(row, 'Description', None),
-            cost_price=Decimal(str(row.Cost_Price)),
-            retail_price=Decimal(str(row.Retail_Price)),
+            cost_price_cents=to_cents(row.Cost_Price),
+            retail_price_cents=to_cents(row.Retail_Price),
             min_stock_level=row.Min_Stock_Level,
             date_added=row.Date_Added,
-            subcat_name=getattr(row, 'Subcat_Name', None),
-            cat_name=getattr(row, 'Cat_Name', None),
+            subcat_name=intern_str(getattr(row, 'Subcat_Name', None)),
+            cat_name=intern_str(getattr(row, 'Cat_Name', None)),
             current_stock=getattr(row, 'Current_Stock', None)
         )
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            'product_code': self.product_code,
-            'subcat_id': self.subcat_id,
-            'product_name': self.product_name,
-            'brand': self.brand,
-            'description': self.description,
-            'cost_price': float(self.cost_price),
-            'retail_price': float(self.retail_price),
-            'min_stock_level': self.min_stock_level,
-            'date_added': str(self.date_added),
-            'subcat_name': self.subcat_name,
-            'cat_name': self.cat_name,
-            'current_stock': self.current_stock
-        }
+    @classmethod
+    def _from_tuple(cls, tup, idx: Tuple[Optional[int], ...]) -> 'Product':
+        """
+        Create a Product from a positional row without per-column getattr.
+        
+        Args:
+            tup: Row from the cursor (indexable by position)
+            idx: Column positions in field order (see ProductRepository._positions);
+                 None for columns the procedure does not return
+        """
+        (i_code, i_subcat, i_name, i_brand, i_desc, i_cost, i_retail,
+         i_min, i_added, i_subcat_name, i_cat_name, i_stock) = idx
+        return cls(
+            tup[i_code],
+            intern_str(tup[i_subcat]),
+            tup[i_name],
+            intern_str(tup[i_brand]) if i_brand is not None else None,
+            tup[i_desc] if i_desc is not None else None,
+            to_cents(tup[i_cost]),
+            to_cents(tup[i_retail]),
+            tup[i_min],
+            tup[i_added],
+            intern_str(tup[i_subcat_name]) if i_subcat_name is not None else None,
+            intern_str(tup[i_cat_name]) if i_cat_name is not None else None,
+            tup[i_stock] if i_stock is not None else None
+        )
+    
+    @property
+    def cost_price(self) -> Decimal:
+        """Purchase cost as a 2-place Decimal."""
+        return from_cents(self.cost_price_cents)
+    
+    @property
+    def retail_price(self) -> Decimal:
+        """Selling price as a 2-place Decimal."""
+        return from_cents(self.retail_price_cents)
+    
+    @property
+    def profit_margin_cents(self) -> int:
+        """Profit margin per unit in cents (computed at construction)."""
+        return self._profit_margin_cents
     
     @property
     def profit_margin(self) -> Decimal:
-        """Calculate profit margin per unit."""
-        return self.retail_price - self.cost_price
+        """Profit margin per unit as a 2-place Decimal."""
+        return from_cents(self._profit_margin_cents)
     
     @property
     def is_low_stock(self) -> bool:
-        """Check if product is below minimum stock level."""
-        if self.current_stock is None:
-            return True
-        return self.current_stock < self.min_stock_level
+        """Whether product is below minimum stock level (computed at construction)."""
+        return self._low_stock
+    
+    # =========================================================================
+    # UI Compatibility Aliases
+    # =========================================================================
     
-    # Add property aliases for UI compatibility
     @property
     def product_id(self) -> str:
         """Alias for product_code."""
         return self.product_code
     
-    @property
-    def category_id(self) -> Optional[str]:
-        """Get category ID from subcategory."""
-        return None  # Would need join to get this
-    
     @property
     def category_name(self) -> Optional[str]:
         """Alias for cat_name."""
@@ -148,31 +192,21 @@ class Product:
     def price(self) -> Decimal:
         """Alias for retail_price."""
         return self.retail_price
-        return self.current_stock <= self.min_stock_level
     
-    # =========================================================================
-    # UI Compatibility Aliases
-    # =========================================================================
+    # Rarely-used aliases resolved in __getattr__ (None = not available without a join)
+    _ALIAS_MAP: ClassVar[Dict[str, Optional[str]]] = {
+        'sku': 'product_code',
+        'barcode': 'product_code',
+        'category_id': None,
+    }
     
-    @property
-    def product_id(self) -> str:
-        """Alias for product_code - UI compatibility."""
-        return self.product_code
-    
-    @property
-    def price(self) -> Decimal:
-        """Alias for retail_price - UI compatibility."""
-        return self.retail_price
-    
-    @property
-    def sku(self) -> Optional[str]:
-        """Alias - returns product_code as SKU."""
-        return self.product_code
-    
-    @property
-    def barcode(self) -> Optional[str]:
-        """Alias - returns product_code as barcode."""
-        return self.product_code
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal attribute lookup fails
+        try:
+            target = Product._ALIAS_MAP[name]
+        except KeyError:
+            raise AttributeError(f"'Product' object has no attribute '{name}'") from None
+        return getattr(self, target) if target is not None else None
 
 
 class ProductRepository:
@@ -181,6 +215,55 @@ class ProductRepository:
     Uses stored procedures for all database operations.
     """
     
+    # Single-product lookups (form loads, line items) keyed by product code.
+    # Entries are dropped on create/update/delete and on stock changes
+    # (InventoryRepository, sales, received purchases).
+    _cache = TTLCache(maxsize=2048, ttl=30)
+    
+    # Result-set columns in Product field order (consumed by Product._from_tuple)
+    _PRODUCT_COLUMNS = (
+        'Product_Code', 'Subcat_ID', 'Product_Name', 'Brand', 'Description',
+        'Cost_Price', 'Retail_Price', 'Min_Stock_Level', 'Date_Added',
+        'Subcat_Name', 'Cat_Name', 'Current_Stock'
+    )
+    
+    # Procedure name -> column positions, filled from cursor.description on first call
+    _COLUMN_INDEX: Dict[str, Tuple[Optional[int], ...]] = {}
+    
+    # ProductCode, SubcatId, ProductName, Brand, Description,
+    # CostPrice, RetailPrice, MinStockLevel, InitialStock
+    _ADD_PRODUCT = db.prepare('usp_AddProduct', (str, str, str, str, str, float, float, int, int))
+    
+    # usp_DeleteProduct RETURN code -> (success, message)
+    _DELETE_RESULTS = {
+        0: (True, "Product deleted successfully"),
+        1: (False, "Product not found"),
+        2: (False, "Cannot delete: Product has purchase records"),
+        3: (False, "Cannot delete: Product has sale records"),
+    }
+    
+    @staticmethod
+    def _positions(procedure_name: str, description) -> Tuple[Optional[int], ...]:
+        """Get (and cache) the Product column positions for a procedure's result set."""
+        positions = ProductRepository._COLUMN_INDEX.get(procedure_name)
+        if positions is None:
+            index = db.column_index(description)
+            positions = tuple(index.get(column) for column in ProductRepository._PRODUCT_COLUMNS)
+            ProductRepository._COLUMN_INDEX[procedure_name] = positions
+        return positions
+    
+    @staticmethod
+    def _fetch_products(procedure_name: str, params: Any = ()) -> List[Product]:
+        """Run a product-returning procedure and build Product objects column-wise."""
+        description, rows = db.call_procedure_with_result(
+            procedure_name, params, with_description=True
+        )
+        if not rows:
+            return []
+        idx = ProductRepository._positions(procedure_name, description)
+        from_tuple = Product._from_tuple
+        return [from_tuple(row, idx) for row in rows]
+    
     @staticmethod
     def get_all() -> List[Product]:
         """
@@ -189,8 +272,19 @@ class ProductRepository:
         Returns:
             List of Product objects ordered by Product_Code
         """
-        rows = db.call_procedure_with_result('usp_ListProducts', ())
-        return [Product.from_row(row) for row in rows]
+        return ProductRepository._fetch_products('usp_ListProducts')
+    
+    @staticmethod
+    def iter_all() -> Iterator[Product]:
+        """
+        Stream all products without building the full list.
+        
+        Yields:
+            Product objects ordered by Product_Code, as rows arrive
+        """
+        from_row = Product.from_row
+        for row in db.iter_procedure('usp_ListProducts'):
+            yield from_row(row)
     
     @staticmethod
     def get_by_id(product_code: str) -> Optional[Product]:
@@ -203,8 +297,63 @@ class ProductRepository:
         Returns:
             Product object if found, None otherwise
         """
+        product = ProductRepository._cache.get(product_code)
+        if product is not None:
+            return product
+        
         rows = db.call_procedure_with_result('usp_GetProductByCode', (product_code,))
-        return Product.from_row(rows[0]) if rows else None
+        if not rows:
+            return None
+        product = Product.from_row(rows[0])
+        ProductRepository._cache.set(product_code, product)
+        return product
+    
+    @staticmethod
+    def get_by_ids(product_codes: List[str]) -> List[Product]:
+        """
+        Retrieve several products, serving cached ones without a DB call.
+        
+        Codes not in the cache are fetched together in one call to
+        usp_GetProductsByCodes.
+        
+        Args:
+            product_codes: Product codes to look up
+        
+        Returns:
+            List of Product objects in the order requested;
+            codes that do not exist are skipped
+        """
+        cache = ProductRepository._cache
+        found = {}
+        misses = []
+        for code in dict.fromkeys(product_codes):
+            product = cache.get(code)
+            if product is None:
+                misses.append(code)
+            else:
+                found[code] = product
+        
+        if misses:
+            for product in ProductRepository._fetch_products(
+                'usp_GetProductsByCodes', ([(code,) for code in misses],)
+            ):
+                cache.set(product.product_code, product)
+                found[product.product_code] = product
+        
+        return [found[code] for code in dict.fromkeys(product_codes) if code in found]
+    
+    @staticmethod
+    def invalidate(product_code: Optional[str] = None) -> None:
+        """
+        Drop cached products after a change made outside this repository.
+        
+        Args:
+            product_code: Product to drop, or None to clear the whole cache
+        """
+        if product_code is None:
+            ProductRepository._cache.clear()
+        else:
+            ProductRepository._cache.pop(product_code, None)
     
     @staticmethod
     def get_by_subcategory(subcat_id: str) -> List[Product]:
@@ -217,8 +366,7 @@ class ProductRepository:
         Returns:
             List of Product objects
         """
-        rows = db.call_procedure_with_result('usp_GetProductsBySubcategory', (subcat_id,))
-        return [Product.from_row(row) for row in rows]
+        return ProductRepository._fetch_products('usp_GetProductsBySubcategory', (subcat_id,))
     
     @staticmethod
     def get_by_category(cat_id: str) -> List[Product]:
@@ -231,8 +379,7 @@ class ProductRepository:
         Returns:
             List of Product objects
         """
-        rows = db.call_procedure_with_result('usp_GetProductsByCategory', (cat_id,))
-        return [Product.from_row(row) for row in rows]
+        return ProductRepository._fetch_products('usp_GetProductsByCategory', (cat_id,))
     
     @staticmethod
     def search(
@@ -257,20 +404,23 @@ class ProductRepository:
         Returns:
             Tuple of (list of products, total count)
         """
-        rows = db.call_procedure_with_result('usp_SearchProducts', (
+        # Page rows and total match count come back as two result sets
+        (description, rows), (_, count_rows) = db.call_procedure_multi('usp_SearchProducts', (
             search_term if search_term else None,
             cat_id,
             subcat_id,
             1 if low_stock_only else 0,
             page,
             page_size
-        ))
-        products = [Product.from_row(row) for row in rows]
+        ), with_description=True)
         
-        # For total count estimation: if full page, there may be more
-        total = len(products) if len(products) < page_size else page * page_size + 1
+        total = count_rows[0].Total if count_rows else 0
+        if not rows:
+            return [], total
         
-        return products, total
+        idx = ProductRepository._positions('usp_SearchProducts', description)
+        from_tuple = Product._from_tuple
+        return [from_tuple(row, idx) for row in rows], total
     
     @staticmethod
     def get_low_stock() -> List[Product]:
@@ -280,8 +430,65 @@ class ProductRepository:
         Returns:
             List of Product objects needing restock
         """
-        rows = db.call_procedure_with_result('usp_GetLowStockProducts', ())
-        return [Product.from_row(row) for row in rows]
+        return ProductRepository._fetch_products('usp_GetLowStockProducts')
+    
+    @staticmethod
+    def get_stock_columns() -> Tuple[Any, Any, Any]:
+        """
+        Retrieve product codes, current stock and minimum stock as columns.
+        
+        Uses usp_GetStockColumns, which returns only these three columns,
+        so threshold checks do not need full Product objects.
+        
+        Returns:
+            Tuple of (codes, current_stock, min_stock). These are numpy arrays
+            when numpy is installed, otherwise plain lists.
+        """
+        rows = db.call_procedure_with_result('usp_GetStockColumns', ())
+        codes = [row[0] for row in rows]
+        stock = [row[1] for row in rows]
+        min_stock = [row[2] for row in rows]
+        if np is None:
+            return codes, stock, min_stock
+        return (
+            np.array(codes, dtype=object),
+            np.fromiter(stock, dtype=np.int32, count=len(stock)),
+            np.fromiter(min_stock, dtype=np.int32, count=len(min_stock))
+        )
+    
+    @staticmethod
+    def get_below_stock_ratio(ratio: float = 1.0) -> List[Product]:
+        """
+        Retrieve products whose stock is below ratio * min_stock_level.
+        
+        The comparison runs on the stock columns (vectorized when numpy is
+        installed); only the matching products are hydrated via get_by_ids.
+        
+        Args:
+            ratio: Multiplier applied to each product's minimum stock level
+        
+        Returns:
+            List of Product objects, ordered by product code
+        """
+        codes, stock, min_stock = ProductRepository.get_stock_columns()
+        if np is not None:
+            low_codes = codes[stock < ratio * min_stock].tolist()
+        else:
+            low_codes = [
+                code for code, qty, minimum in zip(codes, stock, min_stock)
+                if qty < ratio * minimum
+            ]
+        return ProductRepository.get_by_ids(low_codes)
+    
+    @staticmethod
+    async def get_all_async() -> List[Product]:
+        """Awaitable get_all(); runs on a worker thread so calls can overlap."""
+        return await asyncio.to_thread(ProductRepository.get_all)
+    
+    @staticmethod
+    async def get_low_stock_async() -> List[Product]:
+        """Awaitable get_low_stock(); runs on a worker thread so calls can overlap."""
+        return await asyncio.to_thread(ProductRepository.get_low_stock)
     
     @staticmethod
     def create(
@@ -315,9 +522,7 @@ class ProductRepository:
             True if created successfully
         """
         try:
-            # Stored procedure params: ProductCode, SubcatId, ProductName, Brand, 
-            # Description, CostPrice, RetailPrice, MinStockLevel, InitialStock
-            result = db.call_procedure('usp_AddProduct', (
+            result = ProductRepository._ADD_PRODUCT(
                 product_code,
                 subcat_id,
                 product_name,
@@ -327,7 +532,8 @@ class ProductRepository:
                 float(retail_price),
                 min_stock_level,
                 initial_stock  # Not date_added - SP uses GETDATE() internally
-            ), has_output=False)
+            )
+            ProductRepository._cache.pop(product_code, None)
             return result
         except Exception as e:
             print(f"ERROR creating product: {e}")
@@ -360,10 +566,15 @@ class ProductRepository:
             min_stock_level: New minimum stock level
         
         Returns:
-            True if updated successfully
+            True if updated, False if the product does not exist
+        
+        Raises:
+            pyodbc.Error: On database errors (e.g. invalid subcategory)
         """
+        # Drop the entry after the write as well, so a reader that ran
+        # during the update cannot leave the old row cached.
         try:
-            return db.call_procedure('usp_UpdateProduct', (
+            return db.call_procedure_status('usp_UpdateProduct', (
                 product_code,
                 subcat_id,
                 product_name,
@@ -372,9 +583,9 @@ class ProductRepository:
                 float(cost_price),
                 float(retail_price),
                 min_stock_level
-            ), has_output=False)
-        except Exception:
-            return False
+            )) == 0
+        finally:
+            ProductRepository._cache.pop(product_code, None)
     
     @staticmethod
     def delete(product_code: str) -> Tuple[bool, str]:
@@ -388,20 +599,17 @@ class ProductRepository:
         
         Returns:
             Tuple of (success: bool, message: str)
+        
+        Raises:
+            pyodbc.Error: On unexpected database errors
         """
         try:
-            result = db.call_procedure('usp_DeleteProduct', (product_code,), has_output=False)
-            if result:
-                return True, "Product deleted successfully"
-            else:
-                return False, "Product not found or could not be deleted"
-        except Exception as e:
-            error_msg = str(e)
-            if 'purchase' in error_msg.lower():
-                return False, "Cannot delete: Product has purchase records"
-            elif 'sale' in error_msg.lower():
-                return False, "Cannot delete: Product has sale records"
-            return False, f"Delete failed: {error_msg}"
+            code = db.call_procedure_status('usp_DeleteProduct', (product_code,))
+        finally:
+            ProductRepository._cache.pop(product_code, None)
+        return ProductRepository._DELETE_RESULTS.get(
+            code, (False, "Product could not be deleted")
+        )
     
     @staticmethod
     def get_next_id() -> str:
@@ -437,11 +645,11 @@ class ProductRepository:
         
         return [
             {
-                'product_code': row.Product_Code,
-                'product_name': row.Product_Name,
-                'brand': getattr(row, 'Brand', None),
-                'retail_price': float(row.Retail_Price) if hasattr(row, 'Retail_Price') and row.Retail_Price else 0.0,
-                'current_stock': getattr(row, 'Current_Stock', 0) or 0
+                'product_code': code,
+                'product_name': name,
+                'brand': brand,
+                'retail_price': float(price) if price else 0.0,
+                'current_stock': stock or 0
             }
-            for row in rows
+            for code, name, brand, price, stock in map(_AUTOCOMPLETE_COLUMNS, rows)
         ]
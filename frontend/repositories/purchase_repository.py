@@ -19,6 +19,7 @@ Stored Procedures Used:
 - usp_GetPurchasesBySupplier: Get purchases by supplier
 - usp_GetPurchasesByDateRange: Get purchases in date range
 - usp_GetPurchaseDetails: Get purchase line items
+- usp_GetPurchasesWithDetails: Get several purchases with their line items
 - usp_MarkPurchaseReceived: Mark as received and update inventory
 - usp_UpdatePurchaseStatus: Update payment status
 - usp_GetNextPurchaseNo: Generate next purchase number
@@ -26,14 +27,19 @@ Stored Procedures Used:
 =============================================================================
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Iterator
+from collections import defaultdict
+import asyncio
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 import db
+from repositories.field_mapper import from_cents, intern_str, to_cents, to_decimal
+from repositories.inventory_repository import InventoryRepository
+from repositories.supplier_repository import SupplierRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class PurchaseDetail:
     """
     Data class representing a purchase line item.
@@ -42,15 +48,15 @@ class PurchaseDetail:
         purchase_no: Parent purchase number
         product_code: Product being purchased
         quantity: Number of units
-        unit_price: Price per unit from supplier
-        line_total: quantity * unit_price
+        unit_price_cents: Price per unit from supplier, in cents
+        line_total_cents: quantity * unit price, in cents
         product_name: Product name (joined)
     """
     purchase_no: str
     product_code: str
     quantity: int
-    unit_price: Decimal
-    line_total: Decimal
+    unit_price_cents: int
+    line_total_cents: int
     product_name: Optional[str] = None
     
     @classmethod
@@ -60,13 +66,23 @@ class PurchaseDetail:
             purchase_no=row.Purchase_No,
             product_code=row.Product_Code,
             quantity=row.Quantity,
-            unit_price=Decimal(str(row.Unit_Price)),
-            line_total=Decimal(str(row.Line_Total)),
+            unit_price_cents=to_cents(row.Unit_Price),
+            line_total_cents=to_cents(row.Line_Total),
             product_name=getattr(row, 'Product_Name', None)
         )
+    
+    @property
+    def unit_price(self) -> Decimal:
+        """Unit price as a 2-place Decimal."""
+        return from_cents(self.unit_price_cents)
+    
+    @property
+    def line_total(self) -> Decimal:
+        """Line total as a 2-place Decimal."""
+        return from_cents(self.line_total_cents)
 
 
-@dataclass
+@dataclass(slots=True)
 class Purchase:
     """
     Data class representing a purchase order.
@@ -95,39 +111,13 @@ class Purchase:
         """Create a Purchase instance from a database row."""
         return cls(
             purchase_no=row.Purchase_No,
-            supplier_id=row.Supplier_ID,
+            supplier_id=intern_str(row.Supplier_ID),
             purchase_date=row.Purchase_Date,
-            total_amount=Decimal(str(row.Total_Amount)),
-            payment_status=row.Payment_Status,
+            total_amount=to_decimal(row.Total_Amount),
+            payment_status=intern_str(row.Payment_Status),
             notes=getattr(row, 'Notes', None),
-            supplier_name=getattr(row, 'Supplier_Name', None)
+            supplier_name=intern_str(getattr(row, 'Supplier_Name', None))
         )
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        result = {
-            'purchase_no': self.purchase_no,
-            'supplier_id': self.supplier_id,
-            'purchase_date': str(self.purchase_date),
-            'total_amount': float(self.total_amount),
-            'payment_status': self.payment_status,
-            'notes': self.notes,
-            'supplier_name': self.supplier_name
-        }
-        
-        if self.details:
-            result['details'] = [
-                {
-                    'product_code': d.product_code,
-                    'product_name': d.product_name,
-                    'quantity': d.quantity,
-                    'unit_price': float(d.unit_price),
-                    'line_total': float(d.line_total)
-                }
-                for d in self.details
-            ]
-        
-        return result
 
 
 class PurchaseRepository:
@@ -139,6 +129,19 @@ class PurchaseRepository:
     which handles transaction management and inventory updates.
     """
     
+    # usp_MarkPurchaseReceived / usp_CancelPurchase RETURN code -> (success, message)
+    _RECEIVE_RESULTS = {
+        0: (True, "Purchase marked as received. Inventory updated."),
+        1: (False, "Purchase not found"),
+        2: (False, "Purchase already marked as received"),
+    }
+    
+    _CANCEL_RESULTS = {
+        0: (True, "Purchase order cancelled successfully."),
+        1: (False, "Purchase not found"),
+        2: (False, "Cannot cancel a received purchase"),
+    }
+    
     @staticmethod
     def get_all() -> List[Purchase]:
         """
@@ -150,6 +153,22 @@ class PurchaseRepository:
         rows = db.call_procedure_with_result('usp_ListPurchases', ())
         return [Purchase.from_row(row) for row in rows]
     
+    @staticmethod
+    def iter_all() -> Iterator[Purchase]:
+        """
+        Stream all purchases (without details) without building the full list.
+        
+        Yields:
+            Purchase objects ordered by Purchase_Date DESC, as rows arrive
+        """
+        for row in db.iter_procedure('usp_ListPurchases', ()):
+            yield Purchase.from_row(row)
+    
+    @staticmethod
+    async def get_all_async() -> List[Purchase]:
+        """Awaitable get_all(); runs on a worker thread so calls can overlap."""
+        return await asyncio.to_thread(PurchaseRepository.get_all)
+    
     @staticmethod
     def get_by_id(purchase_no: str) -> Optional[Purchase]:
         """
@@ -161,19 +180,40 @@ class PurchaseRepository:
         Returns:
             Purchase object with details if found, None otherwise
         """
-        # Get header
-        rows = db.call_procedure_with_result('usp_GetPurchaseById', (purchase_no,))
+        purchases = PurchaseRepository.get_by_ids([purchase_no])
+        return purchases[0] if purchases else None
+    
+    @staticmethod
+    def get_by_ids(purchase_nos: List[str]) -> List[Purchase]:
+        """
+        Retrieve several purchases with their details in one round-trip.
+        
+        Args:
+            purchase_nos: Purchase numbers to look up
         
-        if not rows:
-            return None
+        Returns:
+            List of Purchase objects (with details) in the order requested;
+            numbers that do not exist are skipped
+        """
+        unique_nos = list(dict.fromkeys(purchase_nos))
+        if not unique_nos:
+            return []
         
-        purchase = Purchase.from_row(rows[0])
+        header_rows, detail_rows = db.call_procedure_multi(
+            'usp_GetPurchasesWithDetails', ([(no,) for no in unique_nos],)
+        )
         
-        # Get details
-        detail_rows = db.call_procedure_with_result('usp_GetPurchaseDetails', (purchase_no,))
-        purchase.details = [PurchaseDetail.from_row(r) for r in detail_rows]
+        details_by_no = defaultdict(list)
+        for row in detail_rows:
+            details_by_no[row.Purchase_No].append(PurchaseDetail.from_row(row))
         
-        return purchase
+        purchases = {}
+        for row in header_rows:
+            purchase = Purchase.from_row(row)
+            purchase.details = details_by_no.get(purchase.purchase_no, [])
+            purchases[purchase.purchase_no] = purchase
+        
+        return [purchases[no] for no in unique_nos if no in purchases]
     
     @staticmethod
     def get_by_supplier(supplier_id: str) -> List[Purchase]:
@@ -240,7 +280,11 @@ class PurchaseRepository:
                 ]
             )
         """
-        return db.call_create_purchase(purchase_no, supplier_id, notes, details)
+        result = db.call_create_purchase(purchase_no, supplier_id, notes, details)
+        if result.success:
+            # Supplier list shows purchase counts/totals
+            SupplierRepository.invalidate()
+        return result
     
     @staticmethod
     def update_payment_status(purchase_no: str, status: str) -> bool:
@@ -252,14 +296,9 @@ class PurchaseRepository:
             status: New status ('Pending', 'Paid', 'Partial')
         
         Returns:
-            True if updated successfully
+            True if updated, False if the purchase does not exist
         """
-        try:
-            return db.call_procedure('usp_UpdatePurchaseStatus', (
-                purchase_no, status
-            ), has_output=False)
-        except Exception:
-            return False
+        return db.call_procedure_status('usp_UpdatePurchaseStatus', (purchase_no, status)) == 0
     
     @staticmethod
     def create_with_product(
@@ -291,13 +330,11 @@ class PurchaseRepository:
         if purchase_date is None:
             purchase_date = date.today()
         
-        # Generate purchase number
-        purchase_no = PurchaseRepository.get_next_id()
-        
-        # Use usp_CreatePurchaseOrder which creates Pending purchase
-        # (does NOT update inventory - that happens when marked Received)
+        # usp_CreatePurchaseOrder creates a Pending purchase (does NOT update
+        # inventory - that happens when marked Received). A NULL purchase
+        # number makes the procedure allocate it inside its own transaction.
         result = db.call_procedure_with_result('usp_CreatePurchaseOrder', (
-            purchase_no,
+            None,
             supplier_id,
             product_code,
             quantity,
@@ -306,7 +343,10 @@ class PurchaseRepository:
         ), commit=True)
         
         # Result returns [(1, 'PURxxx')] on success
-        return result is not None and len(result) > 0 and result[0][0] == 1
+        success = result is not None and len(result) > 0 and result[0][0] == 1
+        if success:
+            SupplierRepository.invalidate()
+        return success
     
     @staticmethod
     def get_next_id() -> str:
@@ -329,19 +369,13 @@ class PurchaseRepository:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        try:
-            result = db.call_procedure('usp_MarkPurchaseReceived', (purchase_no,), has_output=False)
-            if result:
-                return True, "Purchase marked as received. Inventory updated."
-            else:
-                return False, "Purchase not found or already received"
-        except Exception as e:
-            error_msg = str(e)
-            if 'not found' in error_msg.lower():
-                return False, "Purchase not found"
-            elif 'already' in error_msg.lower():
-                return False, "Purchase already marked as received"
-            return False, f"Error: {error_msg}"
+        code = db.call_procedure_status('usp_MarkPurchaseReceived', (purchase_no,))
+        if code == 0:
+            # Clear the whole product cache rather than look up the lines again
+            InventoryRepository.invalidate()
+        return PurchaseRepository._RECEIVE_RESULTS.get(
+            code, (False, "Purchase could not be marked as received")
+        )
     
     @staticmethod
     def cancel_purchase(purchase_no: str) -> tuple:
@@ -355,17 +389,12 @@ class PurchaseRepository:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        try:
-            result = db.call_procedure('usp_CancelPurchase', (purchase_no,), has_output=False)
-            if result:
-                return True, "Purchase order cancelled successfully."
-            else:
-                return False, "Purchase not found or cannot be cancelled"
-        except Exception as e:
-            error_msg = str(e)
-            if 'received' in error_msg.lower():
-                return False, "Cannot cancel a received purchase"
-            return False, f"Error: {error_msg}"
+        code = db.call_procedure_status('usp_CancelPurchase', (purchase_no,))
+        if code == 0:
+            SupplierRepository.invalidate()
+        return PurchaseRepository._CANCEL_RESULTS.get(
+            code, (False, "Purchase could not be cancelled")
+        )
     
     @staticmethod
     def get_summary_by_supplier() -> List[Dict[str, Any]]:
@@ -385,3 +414,8 @@ class PurchaseRepository:
             }
             for row in rows
         ]
+    
+    @staticmethod
+    async def get_summary_by_supplier_async() -> List[Dict[str, Any]]:
+        """Awaitable get_summary_by_supplier(); runs on a worker thread."""
+        return await asyncio.to_thread(PurchaseRepository.get_summary_by_supplier)
@@ -21,22 +21,40 @@ Stored Procedures Used:
 - usp_GetSalesByEmployee: Get sales by employee
 - usp_GetSalesByDateRange: Get sales in date range
 - usp_GetSaleDetails: Get sale line items
-- usp_GetNextInvoiceNo: Generate next invoice number
+- usp_GetSaleWithDetails: Get sale header and line items (two result sets)
+- usp_GetSaleDetailsForInvoices: Get line items for several invoices (TVP)
+- usp_GetSalesToday: Get today's sales
+- usp_ReserveInvoiceRange: Reserve a block of invoice numbers (dbo.InvoiceSeq)
+- usp_GetNextInvoiceNo: Generate next invoice number (fallback)
 - usp_GetDailySalesSummary: Get daily sales summary
 - usp_GetTopSellingProducts: Get best sellers
 - usp_GetSalesByCategory: Get sales grouped by category
+- usp_CreateSalesBulk: Create many sales at once (TVPs)
+- usp_Get*Json: The summary/top-seller/category aggregations as JSON (exports)
 
 =============================================================================
 """
 
-from typing import List, Optional, Dict, Any, Tuple
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple, Iterator
+from collections import defaultdict
+import asyncio
+from dataclasses import dataclass, field
 from datetime import date, time, datetime
 from decimal import Decimal
+import pyodbc
 import db
+from repositories.field_mapper import to_cents, from_cents
+from repositories.id_pool import IdPool
+from repositories.inventory_repository import InventoryRepository
 
 
-@dataclass
+def _reserve_invoice_range(count: int) -> List[str]:
+    """Reserve count consecutive invoice numbers with one procedure call."""
+    first = db.call_procedure_scalar('usp_ReserveInvoiceRange', (count,), 'FirstNo')
+    return [f"INV{n:03d}" for n in range(first, first + count)]
+
+
+@dataclass(slots=True)
 class SaleDetail:
     """
     Data class representing a sale line item.
@@ -45,31 +63,44 @@ class SaleDetail:
         invoice_no: Parent invoice number
         product_code: Product sold
         quantity: Number of units sold
-        unit_price: Price per unit
-        line_total: quantity * unit_price
+        unit_price_cents: Price per unit, in cents
+        line_total_cents: quantity * unit_price, in cents
         product_name: Product name (joined)
     """
     invoice_no: str
     product_code: str
     quantity: int
-    unit_price: Decimal
-    line_total: Decimal
+    unit_price_cents: int = field(metadata={'column': 'Unit_Price'})
+    line_total_cents: int = field(metadata={'column': 'Line_Total'})
     product_name: Optional[str] = None
     
     @classmethod
     def from_row(cls, row) -> 'SaleDetail':
-        """Create a SaleDetail instance from a database row."""
+        """
+        Create a SaleDetail instance from a database row.
+        
+        Unpacks positionally: every line-item procedure (usp_GetSaleDetails,
+        usp_GetSaleWithDetails, usp_GetSaleDetailsForInvoices) returns
+        Invoice_No, Product_Code, Quantity, Unit_Price, Line_Total, Product_Name.
+        """
+        invoice_no, product_code, quantity, unit_price, line_total, product_name = row
         return cls(
-            invoice_no=row.Invoice_No,
-            product_code=row.Product_Code,
-            quantity=row.Quantity,
-            unit_price=Decimal(str(row.Unit_Price)),
-            line_total=Decimal(str(row.Line_Total)),
-            product_name=getattr(row, 'Product_Name', None)
+            invoice_no, product_code, quantity,
+            to_cents(unit_price), to_cents(line_total), product_name
         )
+    
+    @property
+    def unit_price(self) -> Decimal:
+        """Price per unit as a 2-place Decimal."""
+        return from_cents(self.unit_price_cents)
+    
+    @property
+    def line_total(self) -> Decimal:
+        """Line total as a 2-place Decimal."""
+        return from_cents(self.line_total_cents)
 
 
-@dataclass
+@dataclass(slots=True)
 class Sale:
     """
     Data class representing a sale/invoice.
@@ -80,9 +111,9 @@ class Sale:
         employee_id: Employee who processed sale (foreign key)
         sale_date: Date of sale
         sale_time: Time of sale
-        total_amount: Sum of all line totals before discount
-        discount: Discount amount applied
-        net_amount: total_amount - discount
+        total_amount_cents: Sum of all line totals before discount, in cents
+        discount_cents: Discount amount applied, in cents
+        net_amount_cents: total_amount - discount, in cents
         customer_name: Customer name (joined)
         employee_name: Employee name (joined)
         details: List of line items
@@ -92,57 +123,53 @@ class Sale:
     employee_id: str
     sale_date: date
     sale_time: time
-    total_amount: Decimal
-    discount: Decimal
-    net_amount: Decimal
+    total_amount_cents: int = field(metadata={'column': 'Total_Amount'})
+    discount_cents: int = field(metadata={'column': 'Discount'})
+    net_amount_cents: int = field(metadata={'column': 'Net_Amount'})
     customer_name: Optional[str] = None
     employee_name: Optional[str] = None
     details: Optional[List[SaleDetail]] = None
     
     @classmethod
     def from_row(cls, row) -> 'Sale':
-        """Create a Sale instance from a database row."""
+        """
+        Create a Sale instance from a database row.
+        
+        Unpacks positionally: every sale procedure (usp_ListSales,
+        usp_GetSalesBy*, usp_GetSaleWithDetails) returns the SALE columns in
+        table order followed by Customer_Name and Employee_Name.
+        """
+        (invoice_no, customer_id, employee_id, sale_date, sale_time,
+         total_amount, discount, net_amount, customer_name, employee_name) = row
         return cls(
-            invoice_no=row.Invoice_No,
-            customer_id=row.Customer_ID,
-            employee_id=row.Employee_ID,
-            sale_date=row.Sale_Date,
-            sale_time=row.Sale_Time,
-            total_amount=Decimal(str(row.Total_Amount)),
-            discount=Decimal(str(row.Discount)),
-            net_amount=Decimal(str(row.Net_Amount)),
-            customer_name=getattr(row, 'Customer_Name', None),
-            employee_name=getattr(row, 'Employee_Name', None)
+            invoice_no, customer_id, employee_id, sale_date, sale_time,
+            to_cents(total_amount), to_cents(discount), to_cents(net_amount),
+            customer_name, employee_name
         )
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        result = {
-            'invoice_no': self.invoice_no,
-            'customer_id': self.customer_id,
-            'employee_id': self.employee_id,
-            'sale_date': str(self.sale_date),
-            'sale_time': str(self.sale_time),
-            'total_amount': float(self.total_amount),
-            'discount': float(self.discount),
-            'net_amount': float(self.net_amount),
-            'customer_name': self.customer_name,
-            'employee_name': self.employee_name
-        }
-        
-        if self.details:
-            result['details'] = [
-                {
-                    'product_code': d.product_code,
-                    'product_name': d.product_name,
-                    'quantity': d.quantity,
-                    'unit_price': float(d.unit_price),
-                    'line_total': float(d.line_total)
-                }
-                for d in self.details
-            ]
-        
-        return result
+    @property
+    def total_amount(self) -> Decimal:
+        """Total before discount as a 2-place Decimal."""
+        return from_cents(self.total_amount_cents)
+    
+    @property
+    def discount(self) -> Decimal:
+        """Discount as a 2-place Decimal."""
+        return from_cents(self.discount_cents)
+    
+    @property
+    def net_amount(self) -> Decimal:
+        """Net amount as a 2-place Decimal."""
+        return from_cents(self.net_amount_cents)
+
+
+# Column conversions for db.call_procedure_materialized
+_DETAIL_CONVERTERS = {'unit_price_cents': to_cents, 'line_total_cents': to_cents}
+_SALE_CONVERTERS = {
+    'total_amount_cents': to_cents,
+    'discount_cents': to_cents,
+    'net_amount_cents': to_cents
+}
 
 
 class SaleRepository:
@@ -154,6 +181,13 @@ class SaleRepository:
     which handles stock validation, transaction management, and inventory updates.
     """
     
+    # Invoice numbers reserved 50 at a time; None once the server is found
+    # not to have usp_ReserveInvoiceRange
+    _invoice_ids: Optional[IdPool] = IdPool(_reserve_invoice_range, batch_size=50)
+    
+    # Cleared once the server is found not to have usp_GetSalesToday
+    _has_sales_today = True
+    
     @staticmethod
     def get_all(limit: int = 100) -> List[Sale]:
         """
@@ -165,8 +199,21 @@ class SaleRepository:
         Returns:
             List of Sale objects ordered by Sale_Date DESC
         """
-        rows = db.call_procedure_with_result('usp_ListSales', (limit,))
-        return [Sale.from_row(row) for row in rows]
+        return list(SaleRepository.iter_all(limit))
+    
+    @staticmethod
+    def iter_all(limit: int = 100) -> Iterator[Sale]:
+        """
+        Stream recent sales without building the full list.
+        
+        Args:
+            limit: Maximum number of sales to yield (default: 100)
+        
+        Yields:
+            Sale objects ordered by Sale_Date DESC, as rows arrive
+        """
+        for row in db.iter_procedure('usp_ListSales', (limit,)):
+            yield Sale.from_row(row)
     
     @staticmethod
     def get_by_id(invoice_no: str) -> Optional[Sale]:
@@ -179,20 +226,58 @@ class SaleRepository:
         Returns:
             Sale object with details if found, None otherwise
         """
-        # Get header
-        rows = db.call_procedure_with_result('usp_GetSaleById', (invoice_no,))
+        # Header and details come back as two result sets of one call
+        header_rows, detail_rows = db.call_procedure_multi('usp_GetSaleWithDetails', (invoice_no,))
         
-        if not rows:
+        if not header_rows:
             return None
         
-        sale = Sale.from_row(rows[0])
-        
-        # Get details
-        detail_rows = db.call_procedure_with_result('usp_GetSaleDetails', (invoice_no,))
+        sale = Sale.from_row(header_rows[0])
         sale.details = [SaleDetail.from_row(r) for r in detail_rows]
         
         return sale
     
+    @staticmethod
+    def get_details_for_invoices(invoice_nos: List[str]) -> Dict[str, List[SaleDetail]]:
+        """
+        Retrieve the line items of several invoices in one round-trip.
+        
+        Args:
+            invoice_nos: Invoice numbers to look up
+        
+        Returns:
+            Dict mapping invoice number -> list of SaleDetail objects;
+            invoices without line items are absent
+        """
+        unique_nos = list(dict.fromkeys(invoice_nos))
+        if not unique_nos:
+            return {}
+        
+        details = db.call_procedure_materialized(
+            'usp_GetSaleDetailsForInvoices', ([(no,) for no in unique_nos],),
+            SaleDetail, _DETAIL_CONVERTERS
+        )
+        details_by_invoice = defaultdict(list)
+        for detail in details:
+            details_by_invoice[detail.invoice_no].append(detail)
+        return dict(details_by_invoice)
+    
+    @staticmethod
+    def attach_details(sales: List[Sale]) -> List[Sale]:
+        """
+        Load line items for every sale in the list with a single call.
+        
+        Args:
+            sales: Sale objects (e.g. from get_all or get_by_customer)
+        
+        Returns:
+            The same list, with each sale's details populated
+        """
+        details = SaleRepository.get_details_for_invoices([sale.invoice_no for sale in sales])
+        for sale in sales:
+            sale.details = details.get(sale.invoice_no, [])
+        return sales
+    
     @staticmethod
     def get_by_customer(customer_id: str) -> List[Sale]:
         """
@@ -204,8 +289,9 @@ class SaleRepository:
         Returns:
             List of Sale objects
         """
-        rows = db.call_procedure_with_result('usp_GetSalesByCustomer', (customer_id,))
-        return [Sale.from_row(row) for row in rows]
+        return db.call_procedure_materialized(
+            'usp_GetSalesByCustomer', (customer_id,), Sale, _SALE_CONVERTERS
+        )
     
     @staticmethod
     def get_by_employee(employee_id: str) -> List[Sale]:
@@ -218,8 +304,9 @@ class SaleRepository:
         Returns:
             List of Sale objects
         """
-        rows = db.call_procedure_with_result('usp_GetSalesByEmployee', (employee_id,))
-        return [Sale.from_row(row) for row in rows]
+        return db.call_procedure_materialized(
+            'usp_GetSalesByEmployee', (employee_id,), Sale, _SALE_CONVERTERS
+        )
     
     @staticmethod
     def get_by_date_range(start_date: date, end_date: date) -> List[Sale]:
@@ -233,8 +320,22 @@ class SaleRepository:
         Returns:
             List of Sale objects
         """
-        rows = db.call_procedure_with_result('usp_GetSalesByDateRange', (start_date, end_date))
-        return [Sale.from_row(row) for row in rows]
+        return list(SaleRepository.iter_by_date_range(start_date, end_date))
+    
+    @staticmethod
+    def iter_by_date_range(start_date: date, end_date: date) -> Iterator[Sale]:
+        """
+        Stream sales within a date range without building the full list.
+        
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+        
+        Yields:
+            Sale objects, as rows arrive
+        """
+        for row in db.iter_procedure('usp_GetSalesByDateRange', (start_date, end_date)):
+            yield Sale.from_row(row)
     
     @staticmethod
     def get_today_sales() -> List[Sale]:
@@ -244,6 +345,16 @@ class SaleRepository:
         Returns:
             List of Sale objects from today
         """
+        if SaleRepository._has_sales_today:
+            try:
+                return db.call_procedure_materialized(
+                    'usp_GetSalesToday', None, Sale, _SALE_CONVERTERS
+                )
+            except pyodbc.ProgrammingError as e:
+                if not db.is_missing_procedure(e):
+                    raise
+                # Older database without the procedure
+                SaleRepository._has_sales_today = False
         today = date.today()
         return SaleRepository.get_by_date_range(today, today)
     
@@ -287,16 +398,94 @@ class SaleRepository:
                 ]
             )
         """
-        return db.call_create_sale(invoice_no, customer_id, employee_id, discount, details)
+        result = db.call_create_sale(invoice_no, customer_id, employee_id, discount, details)
+        if result.success:
+            InventoryRepository.invalidate(line['Product_Code'] for line in details)
+        return result
+    
+    # RETURN codes of usp_CreateSalesBulk
+    _BULK_RESULTS = {
+        0: (True, "Sales created successfully"),
+        1: (False, "No sales to create"),
+        2: (False, "Every sale needs at least one line item"),
+        3: (False, "Unknown customer or employee"),
+        4: (False, "An invoice number already exists"),
+        5: (False, "Insufficient stock"),
+    }
+    
+    @staticmethod
+    def create_sales_bulk(sales: List[Sale]) -> Tuple[bool, str]:
+        """
+        Create many sales (e.g. a data import) in one call to usp_CreateSalesBulk.
+        
+        Headers and line items go to the server as two table-valued
+        parameters; stock is checked and decremented set-based, and either
+        all sales are created or none are. Sales without an invoice_no are
+        given one from get_next_id() (written back onto the Sale). A
+        sale_date/sale_time of None means "now".
+        
+        Args:
+            sales: Sale objects with details (SaleDetail) populated;
+                   line totals and sale totals are computed by the server
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        
+        Raises:
+            pyodbc.Error: On unexpected database errors
+        """
+        headers = []
+        lines: Dict[Tuple[str, str], List[Any]] = {}
+        for sale in sales:
+            if not sale.invoice_no:
+                sale.invoice_no = SaleRepository.get_next_id()
+            headers.append((
+                sale.invoice_no, sale.customer_id, sale.employee_id,
+                sale.sale_date, sale.sale_time, from_cents(sale.discount_cents)
+            ))
+            # Repeated products within an invoice are merged (SaleLineType key);
+            # they must share a price, or a line would be silently repriced
+            for detail in sale.details or ():
+                key = (sale.invoice_no, detail.product_code)
+                if key in lines:
+                    if detail.unit_price != lines[key][3]:
+                        return False, (
+                            f"Product {detail.product_code} is listed twice on "
+                            f"{sale.invoice_no} with different unit prices"
+                        )
+                    lines[key][2] += detail.quantity
+                else:
+                    lines[key] = [sale.invoice_no, detail.product_code,
+                                  detail.quantity, detail.unit_price]
+        
+        code = db.call_procedure_status(
+            'usp_CreateSalesBulk', (headers, [tuple(line) for line in lines.values()])
+        )
+        if code == 0:
+            InventoryRepository.invalidate({line[1] for line in lines.values()})
+        return SaleRepository._BULK_RESULTS.get(code, (False, "Sales could not be created"))
     
     @staticmethod
     def get_next_id() -> str:
         """
-        Generate the next available invoice number using stored procedure.
+        Hand out the next invoice number.
+        
+        Numbers come from a locally held range reserved from dbo.InvoiceSeq,
+        so only one call in 50 reaches the server. Falls back to
+        usp_GetNextInvoiceNo on databases without usp_ReserveInvoiceRange.
         
         Returns:
             Next ID in format 'INV###' (e.g., 'INV002')
         """
+        pool = SaleRepository._invoice_ids
+        if pool is not None:
+            try:
+                return pool.next()
+            except pyodbc.ProgrammingError as e:
+                if not db.is_missing_procedure(e):
+                    raise
+                # Procedure not installed; stop trying
+                SaleRepository._invoice_ids = None
         return db.call_procedure_scalar('usp_GetNextInvoiceNo', (), 'NextNo')
     
     @staticmethod
@@ -313,8 +502,20 @@ class SaleRepository:
         if target_date is None:
             target_date = date.today()
         
-        rows = db.call_procedure_with_result('usp_GetDailySalesSummary', (target_date,))
-        
+        rows = db.singleflight_call('usp_GetDailySalesSummary', (target_date,))
+        return SaleRepository._daily_summary_dict(target_date, rows)
+    
+    @staticmethod
+    async def get_daily_summary_async(target_date: date = None) -> Dict[str, Any]:
+        """Awaitable get_daily_summary() (see db.call_procedure_async)."""
+        if target_date is None:
+            target_date = date.today()
+        rows = await db.call_procedure_async('usp_GetDailySalesSummary', (target_date,))
+        return SaleRepository._daily_summary_dict(target_date, rows)
+    
+    @staticmethod
+    def _daily_summary_dict(target_date: date, rows) -> Dict[str, Any]:
+        """Map the usp_GetDailySalesSummary result to the summary dict."""
         if rows:
             row = rows[0]
             return {
@@ -345,17 +546,25 @@ class SaleRepository:
         Returns:
             List of dicts with product info and total quantity sold
         """
-        rows = db.call_procedure_with_result('usp_GetTopSellingProducts', (limit, start_date, end_date))
-        return [
-            {
-                'product_code': row.Product_Code,
-                'product_name': row.Product_Name,
-                'brand': getattr(row, 'Brand', None),
-                'total_quantity': getattr(row, 'Total_Quantity', 0) or 0,
-                'total_revenue': float(getattr(row, 'Total_Revenue', 0) or 0)
-            }
-            for row in rows
-        ]
+        rows = db.singleflight_call('usp_GetTopSellingProducts', (limit, start_date, end_date))
+        return [SaleRepository._top_product_dict(row) for row in rows]
+    
+    @staticmethod
+    async def get_top_selling_products_async(limit: int = 10, start_date: date = None, end_date: date = None) -> List[Dict[str, Any]]:
+        """Awaitable get_top_selling_products() (see db.call_procedure_async)."""
+        rows = await db.call_procedure_async('usp_GetTopSellingProducts', (limit, start_date, end_date))
+        return [SaleRepository._top_product_dict(row) for row in rows]
+    
+    @staticmethod
+    def _top_product_dict(row) -> Dict[str, Any]:
+        """Map a top-selling-product row to the dict used by the report view."""
+        return {
+            'product_code': row.Product_Code,
+            'product_name': row.Product_Name,
+            'brand': row.Brand,
+            'total_quantity': row.Total_Quantity,
+            'total_revenue': float(row.Total_Revenue)
+        }
     
     @staticmethod
     def get_sales_by_category(start_date: date = None, end_date: date = None) -> List[Dict[str, Any]]:
@@ -369,17 +578,73 @@ class SaleRepository:
         Returns:
             List of dicts with category info and totals
         """
-        rows = db.call_procedure_with_result('usp_GetSalesByCategory', (start_date, end_date))
-        return [
-            {
-                'cat_id': row.Cat_ID,
-                'cat_name': row.Cat_Name,
-                'sale_count': getattr(row, 'Sale_Count', 0) or 0,
-                'total_quantity': getattr(row, 'Total_Quantity', 0) or 0,
-                'total_revenue': float(getattr(row, 'Total_Revenue', 0) or 0)
-            }
-            for row in rows
-        ]
+        rows = db.singleflight_call('usp_GetSalesByCategory', (start_date, end_date))
+        return [SaleRepository._category_sales_dict(row) for row in rows]
+    
+    @staticmethod
+    async def get_sales_by_category_async(start_date: date = None, end_date: date = None) -> List[Dict[str, Any]]:
+        """Awaitable get_sales_by_category() (see db.call_procedure_async)."""
+        rows = await db.call_procedure_async('usp_GetSalesByCategory', (start_date, end_date))
+        return [SaleRepository._category_sales_dict(row) for row in rows]
+    
+    @staticmethod
+    def _category_sales_dict(row) -> Dict[str, Any]:
+        """Map a sales-by-category row to the dict used by the report view."""
+        return {
+            'cat_id': row.Cat_ID,
+            'cat_name': row.Cat_Name,
+            'sale_count': row.Sale_Count,
+            'total_quantity': row.Total_Quantity,
+            'total_revenue': float(row.Total_Revenue)
+        }
+    
+    @staticmethod
+    def get_daily_summary_json(target_date: date = None) -> bytes:
+        """
+        get_daily_summary() as a JSON document built by SQL Server.
+        
+        Same keys as the dict form; amounts are exact JSON numbers.
+        """
+        return db.call_procedure_json('usp_GetDailySalesSummaryJson', (target_date,))
+    
+    @staticmethod
+    def get_top_selling_products_json(limit: int = 10, start_date: date = None, end_date: date = None) -> bytes:
+        """get_top_selling_products() as a JSON array built by SQL Server."""
+        return db.call_procedure_json('usp_GetTopSellingProductsJson', (limit, start_date, end_date))
+    
+    @staticmethod
+    def get_sales_by_category_json(start_date: date = None, end_date: date = None) -> bytes:
+        """get_sales_by_category() as a JSON array built by SQL Server."""
+        return db.call_procedure_json('usp_GetSalesByCategoryJson', (start_date, end_date))
+    
+    @staticmethod
+    async def get_dashboard_bundle(start_date: date, end_date: date) -> Dict[str, Any]:
+        """
+        Load the daily summary, top products, category sales and sales report
+        concurrently, each on its own connection.
+        
+        Args:
+            start_date: Range start (top products, category sales, report)
+            end_date: Range end; also the day used for the daily summary
+        
+        Returns:
+            Dict with 'daily_summary', 'top_products', 'category_sales', 'report'
+        """
+        # The aioodbc pool is closed again before the caller's loop ends
+        async with db.aio_pool_scope():
+            daily_summary, top_products, category_sales, report = await asyncio.gather(
+                SaleRepository.get_daily_summary_async(end_date),
+                SaleRepository.get_top_selling_products_async(10, start_date, end_date),
+                SaleRepository.get_sales_by_category_async(start_date, end_date),
+                # Multi-result-set procedure; stays on a pooled pyodbc connection
+                db.run_pooled(SaleRepository.get_sales_report, start_date, end_date)
+            )
+        return {
+            'daily_summary': daily_summary,
+            'top_products': top_products,
+            'category_sales': category_sales,
+            'report': report
+        }
     
     @staticmethod
     def get_sales_report(start_date: date, end_date: date) -> Dict[str, Any]:
@@ -397,10 +662,14 @@ class SaleRepository:
             end_date: Report end date
         
         Returns:
-            Dict with summary, daily_breakdown, top_products, category_sales
+            Dict with the summary totals (total_sales, total_units_sold,
+            total_revenue, total_cost, gross_profit) plus 'daily_breakdown',
+            'top_products' (top 10) and 'category_sales' lists
         """
-        # For now, we call the procedure and get the first result set (summary)
-        rows = db.call_procedure_with_result('usp_GetSalesReport', (start_date, end_date))
+        # All four result sets are read from a single call
+        rows, daily_rows, top_rows, category_rows = db.call_procedure_multi(
+            'usp_GetSalesReport', (start_date, end_date)
+        )
         
         summary = {
             'total_sales': 0,
@@ -420,4 +689,15 @@ class SaleRepository:
                 'gross_profit': float(getattr(row, 'Gross_Profit', 0) or 0)
             }
         
+        summary['daily_breakdown'] = [
+            {
+                'sale_date': row.Sale_Date,
+                'sale_count': row.Sale_Count or 0,
+                'total_revenue': float(row.Total_Revenue or 0)
+            }
+            for row in daily_rows
+        ]
+        summary['top_products'] = [SaleRepository._top_product_dict(row) for row in top_rows]
+        summary['category_sales'] = [SaleRepository._category_sales_dict(row) for row in category_rows]
+        
         return summary
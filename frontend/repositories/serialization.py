@@ -0,0 +1,96 @@
+"""
+=============================================================================
+Serialization
+=============================================================================
+JSON encoding for repository objects (Product, Purchase, Payment, ...).
+
+dumps() hands dataclass instances straight to the encoder; the models do not
+build intermediate dicts. Decimal amounts are written as strings (no float
+rounding) and dates and times in ISO format. Money kept as integer cents
+(`*_cents` fields, e.g. Sale.total_amount_cents) is written under the
+Decimal name (`total_amount`), like every other amount.
+
+orjson is used when installed; otherwise the standard json module is used
+with the same default handler, so the output is equivalent either way.
+
+Usage:
+    from repositories.serialization import dumps
+
+    payload = dumps(PurchaseRepository.get_all())
+
+=============================================================================
+"""
+
+import dataclasses
+import json
+from functools import lru_cache
+from datetime import date, time
+from decimal import Decimal
+from typing import Any
+
+from repositories.field_mapper import from_cents
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def _json_fields(cls: type) -> tuple:
+    """
+    (json key, attribute, is cents) for each public field of a dataclass.
+    
+    `price_cents` is emitted as `price` (a Decimal, so a string in JSON);
+    fields starting with '_' are skipped.
+    """
+    return tuple(
+        (f.name[:-len('_cents')], f.name, True) if f.name.endswith('_cents')
+        else (f.name, f.name, False)
+        for f in dataclasses.fields(cls)
+        if not f.name.startswith('_')
+    )
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Encode values the JSON encoder does not handle natively.
+
+    Args:
+        obj: Value being serialized
+
+    Returns:
+        JSON-compatible replacement for obj
+
+    Raises:
+        TypeError: If obj has no JSON representation
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Works for slots dataclasses too (no __dict__)
+        result = {}
+        for key, name, in_cents in _json_fields(type(obj)):
+            value = getattr(obj, name)
+            if in_cents and value is not None:
+                value = from_cents(value)
+            result[key] = value
+        return result
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize repository objects (or lists/dicts of them) to UTF-8 JSON.
+
+    Args:
+        obj: Dataclass instance, list, dict, or plain value
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=json_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(obj, default=json_default, separators=(',', ':')).encode('utf-8')
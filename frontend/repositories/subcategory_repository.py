@@ -13,7 +13,10 @@ Table Schema:
 Changes Applied:
 - MIGRATED TO STORED PROCEDURES for all CRUD operations
 - Uses usp_AddSubcategory, usp_UpdateSubcategory, usp_DeleteSubcategory
+- Uses usp_UpdateSubcategoryName for single-column renames
 - Uses usp_GetSubcategoryById, usp_ListSubcategories, usp_GetNextSubcategoryId
+- Caches lookups for 60s (reference data); writes clear the cache
+- Per-category lookups use one grouped usp_ListSubcategories listing
 - Maintains backward-compatible interface for existing UI code
 
 =============================================================================
@@ -21,8 +24,9 @@ Changes Applied:
 
 from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
+import pyodbc
 import db
-from repositories.field_mapper import map_subcategory
+from repositories.ttl_cache import TTLCache
 
 
 @dataclass
@@ -88,6 +92,23 @@ class SubcategoryRepository:
     NOW USES STORED PROCEDURES for all database operations.
     """
     
+    # Subcategories change rarely but are read on every product list/form
+    # load. Keys: subcat_id -> Subcategory, ('all',) -> list, ('grouped',)
+    # -> cat_id -> list. Any write clears the whole cache (moves between
+    # categories touch several lists).
+    _cache = TTLCache(maxsize=512, ttl=60)
+    
+    # RETURN codes of usp_AddSubcategory / usp_DeleteSubcategory
+    _CREATE_RESULTS = {
+        1: (False, "A subcategory with this ID already exists"),
+        2: (False, "Parent category not found"),
+    }
+    _DELETE_RESULTS = {
+        0: (True, "Subcategory deleted successfully"),
+        1: (False, "Subcategory not found"),
+        2: (False, "Cannot delete: Products exist in this subcategory"),
+    }
+    
     @staticmethod
     def get_all() -> List[Subcategory]:
         """
@@ -97,8 +118,12 @@ class SubcategoryRepository:
         Returns:
             List of Subcategory objects ordered by Cat_ID, Subcat_ID
         """
-        rows = db.call_procedure_with_result('usp_ListSubcategories')
-        return [Subcategory.from_row(row) for row in rows]
+        subcategories = SubcategoryRepository._cache.get(('all',))
+        if subcategories is None:
+            rows = db.singleflight_call('usp_ListSubcategories')
+            subcategories = [Subcategory.from_row(row) for row in rows]
+            SubcategoryRepository._cache.set(('all',), subcategories)
+        return list(subcategories)
     
     @staticmethod
     def get_by_id(subcat_id: str) -> Optional[Subcategory]:
@@ -112,14 +137,51 @@ class SubcategoryRepository:
         Returns:
             Subcategory object if found, None otherwise
         """
+        subcategory = SubcategoryRepository._cache.get(subcat_id)
+        if subcategory is not None:
+            return subcategory
+        
         rows = db.call_procedure_with_result('usp_GetSubcategoryById', {'Subcat_ID': subcat_id})
-        return Subcategory.from_row(rows[0]) if rows else None
+        if not rows:
+            return None
+        subcategory = Subcategory.from_row(rows[0])
+        SubcategoryRepository._cache.set(subcat_id, subcategory)
+        return subcategory
+    
+    @staticmethod
+    def _grouped() -> Dict[str, List[Subcategory]]:
+        """Cached cat_id -> subcategories index built from one get_all() call."""
+        grouped = SubcategoryRepository._cache.get(('grouped',))
+        if grouped is None:
+            grouped = {}
+            for subcategory in SubcategoryRepository.get_all():
+                grouped.setdefault(subcategory.cat_id, []).append(subcategory)
+            SubcategoryRepository._cache.set(('grouped',), grouped)
+        return grouped
+    
+    @staticmethod
+    def get_all_grouped_by_category() -> Dict[str, List[Subcategory]]:
+        """
+        Retrieve all subcategories grouped by parent category.
+        Uses: usp_ListSubcategories (one call for every category)
+        
+        Returns:
+            Dict of cat_id -> Subcategory list ordered by Subcat_Name;
+            categories without subcategories are absent
+        """
+        return {
+            cat_id: list(items)
+            for cat_id, items in SubcategoryRepository._grouped().items()
+        }
     
     @staticmethod
     def get_by_category(cat_id: str) -> List[Subcategory]:
         """
         Retrieve all subcategories for a specific category.
-        Uses: usp_GetSubcategoriesByCategory
+        Uses: usp_ListSubcategories (via the grouped index)
+        
+        Switching between categories in a form reuses the one grouped
+        listing instead of querying per category.
         
         Args:
             cat_id: Parent category ID
@@ -127,8 +189,12 @@ class SubcategoryRepository:
         Returns:
             List of Subcategory objects for the specified category
         """
-        rows = db.call_procedure_with_result('usp_GetSubcategoriesByCategory', (cat_id,))
-        return [Subcategory.from_row(row) for row in rows]
+        return list(SubcategoryRepository._grouped().get(cat_id, ()))
+    
+    @staticmethod
+    def invalidate() -> None:
+        """Drop all cached subcategories (after a change to SUBCATEGORY)."""
+        SubcategoryRepository._cache.clear()
     
     @staticmethod
     def create(subcat_id: str, cat_id: str, subcat_name: str, 
@@ -144,9 +210,11 @@ class SubcategoryRepository:
             description: Optional description
         
         Returns:
-            True if created successfully
+            True if created, False if the ID exists or the category is missing
         """
-        return db.call_procedure('usp_AddSubcategory', (subcat_id, cat_id, subcat_name, description), has_output=False)
+        result = db.call_procedure_status('usp_AddSubcategory', (subcat_id, cat_id, subcat_name, description)) == 0
+        SubcategoryRepository.invalidate()
+        return result
     
     @staticmethod
     def update(subcat_id: str, cat_id: str, subcat_name: str,
@@ -164,7 +232,9 @@ class SubcategoryRepository:
         Returns:
             True if updated successfully
         """
-        return db.call_procedure('usp_UpdateSubcategory', (subcat_id, cat_id, subcat_name, description), has_output=False)
+        result = db.call_procedure('usp_UpdateSubcategory', (subcat_id, cat_id, subcat_name, description), has_output=False)
+        SubcategoryRepository.invalidate()
+        return result
     
     @staticmethod
     def delete(subcat_id: str) -> tuple[bool, str]:
@@ -179,15 +249,15 @@ class SubcategoryRepository:
         
         Returns:
             Tuple of (success: bool, message: str)
+        
+        Raises:
+            pyodbc.Error: On unexpected database errors
         """
-        try:
-            success = db.call_procedure('usp_DeleteSubcategory', (subcat_id,), has_output=False)
-            if success:
-                return True, "Subcategory deleted successfully"
-            else:
-                return False, "Delete failed"
-        except Exception as e:
-            return False, str(e)
+        code = db.call_procedure_status('usp_DeleteSubcategory', (subcat_id,))
+        SubcategoryRepository.invalidate()
+        return SubcategoryRepository._DELETE_RESULTS.get(
+            code, (False, "Subcategory could not be deleted")
+        )
     
     @staticmethod
     def delete_by_category(cat_id: str) -> bool:
@@ -199,38 +269,32 @@ class SubcategoryRepository:
             cat_id: Category ID whose subcategories to delete
         
         Returns:
-            True if deleted successfully (or no subcategories exist)
+            True if deleted successfully (or no subcategories exist),
+            False if any of them still has products
+        
+        Raises:
+            pyodbc.Error: On unexpected database errors
         """
-        try:
-            db.call_procedure('usp_DeleteSubcategoriesByCategory', (cat_id,), has_output=False)
-            return True
-        except Exception:
-            return False
+        code = db.call_procedure_status('usp_DeleteSubcategoriesByCategory', (cat_id,))
+        SubcategoryRepository.invalidate()
+        return code == 0
     
     @staticmethod
     def update_name(subcat_id: str, subcat_name: str) -> bool:
         """
         Update just the subcategory name.
-        Uses: usp_UpdateSubcategory (gets current data first)
+        Uses: usp_UpdateSubcategoryName
         
         Args:
             subcat_id: Subcategory ID to update
             subcat_name: New name
         
         Returns:
-            True if updated successfully
+            True if updated, False if the subcategory does not exist
         """
-        # Get current subcategory to preserve other fields
-        current = SubcategoryRepository.get_by_id(subcat_id)
-        if not current:
-            return False
-        
-        return SubcategoryRepository.update(
-            subcat_id=subcat_id,
-            cat_id=current.cat_id,
-            subcat_name=subcat_name,
-            description=current.description
-        )
+        result = db.call_procedure_status('usp_UpdateSubcategoryName', (subcat_id, subcat_name)) == 0
+        SubcategoryRepository.invalidate()
+        return result
     
     @staticmethod
     def get_next_id() -> str:
@@ -280,10 +344,13 @@ class SubcategoryRepository:
         subcat_id = SubcategoryRepository.get_next_id()
         
         try:
-            success = db.call_procedure('usp_AddSubcategory', (subcat_id, cat_id, subcat_name.strip(), description), has_output=False)
-            if success:
-                return True, f"Subcategory '{subcat_name}' created successfully", subcat_id
-            else:
-                return False, "Failed to create subcategory", None
-        except Exception as e:
-            return False, str(e), None
+            code = db.call_procedure_status('usp_AddSubcategory', (subcat_id, cat_id, subcat_name.strip(), description))
+        except pyodbc.Error as e:
+            return False, db.error_message(e), None
+        SubcategoryRepository.invalidate()
+        if code == 0:
+            return True, f"Subcategory '{subcat_name}' created successfully", subcat_id
+        success, message = SubcategoryRepository._CREATE_RESULTS.get(
+            code, (False, "Failed to create subcategory")
+        )
+        return success, message, None
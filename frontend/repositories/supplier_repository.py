@@ -8,22 +8,30 @@ Suppliers are vendors from whom we purchase products for the store.
 
 Table Schema:
     SUPPLIER(Supplier_ID, Supplier_Name, Contact_Person, Phone, Email, Address, City)
+    SUPPLIER_STATS(Supplier_ID, Total_Purchases, Total_Purchase_Value)
 
 Changes Applied:
 - MIGRATED TO STORED PROCEDURES for all CRUD operations
 - Uses usp_AddSupplier, usp_UpdateSupplier, usp_DeleteSupplier
 - Uses usp_GetSupplierById, usp_ListSuppliers, usp_GetNextSupplierId
+- Uses usp_CreateSupplierAutoId to allocate the ID and insert in one call
+- Hands out get_next_id() values from ranges reserved via usp_ReserveSupplierIdRange
+- Uses usp_AddSuppliersBulk (table-valued parameter) for bulk imports
+- Caches the supplier list/dropdown for 30s; writes clear the cache
 - Maintains backward-compatible interface for existing UI code
 
 =============================================================================
 """
 
-from typing import List, Optional, Dict, Any, Tuple
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple, Iterator, NamedTuple
+from dataclasses import dataclass, field
+import pyodbc
 import db
+from repositories.ttl_cache import TTLCache
+from repositories.id_pool import IdPool
 
 
-@dataclass
+@dataclass(slots=True)
 class Supplier:
     """
     Data class representing a supplier/vendor.
@@ -36,6 +44,8 @@ class Supplier:
         email: Contact email address
         address: Street address
         city: City location
+        contact_name: Copy of contact_person (UI compatibility)
+        phone_number: Copy of phone (UI compatibility)
     """
     supplier_id: str
     supplier_name: str
@@ -46,6 +56,15 @@ class Supplier:
     city: Optional[str] = None
     total_purchases: int = 0
     total_purchase_value: float = 0.0
+    # UI aliases, stored rather than computed: the supplier table reads them
+    # for every row on each refresh and search keystroke
+    contact_name: Optional[str] = field(init=False, repr=False, compare=False)
+    phone_number: Optional[str] = field(init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.contact_name = self.contact_person
+        self.phone_number = self.phone
     
     @classmethod
     def from_row(cls, row) -> 'Supplier':
@@ -63,28 +82,41 @@ class Supplier:
         )
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            'supplier_id': self.supplier_id,
-            'supplier_name': self.supplier_name,
-            'contact_person': self.contact_person,
-            'phone': self.phone,
-            'email': self.email,
-            'address': self.address,
-            'city': self.city,
-            'total_purchases': self.total_purchases,
-            'total_purchase_value': self.total_purchase_value
-        }
-    
-    @property
-    def contact_name(self) -> Optional[str]:
-        """Alias for contact_person - UI compatibility."""
-        return self.contact_person
-    
-    @property
-    def phone_number(self) -> Optional[str]:
-        """Alias for phone - UI compatibility."""
-        return self.phone
+        """Convert to dictionary for serialization (built once, then reused)."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'supplier_id': self.supplier_id,
+                'supplier_name': self.supplier_name,
+                'contact_person': self.contact_person,
+                'phone': self.phone,
+                'email': self.email,
+                'address': self.address,
+                'city': self.city,
+                'total_purchases': self.total_purchases,
+                'total_purchase_value': self.total_purchase_value
+            }
+        return self._dict_cache
+
+
+class SupplierChoice(NamedTuple):
+    """Dropdown entry: supplier ID (item data) and name (display text)."""
+    id: str
+    name: str
+
+
+# Column conversions for db.call_procedure_materialized; the purchase totals
+# come from SUPPLIER_STATS, which a trigger on PURCHASE keeps up to date
+_SUPPLIER_CONVERTERS = {
+    'total_purchases': lambda value: value or 0,
+    'total_purchase_value': lambda value: float(value or 0)
+}
+
+
+
+def _reserve_supplier_range(count: int) -> List[str]:
+    """Reserve count consecutive supplier IDs with one procedure call."""
+    first = db.call_procedure_scalar('usp_ReserveSupplierIdRange', (count,), 'FirstNo')
+    return [f"SUP{n:03d}" for n in range(first, first + count)]
 
 
 class SupplierRepository:
@@ -93,15 +125,49 @@ class SupplierRepository:
     NOW USES STORED PROCEDURES for all database operations.
     """
     
+    # usp_ListSuppliers results, keyed by shape ('all' -> Supplier objects,
+    # 'dropdown' -> SupplierChoice tuples). Cleared on supplier writes and by
+    # PurchaseRepository when purchase totals change.
+    _cache = TTLCache(maxsize=4, ttl=30)
+    
+    # SupplierId, SupplierName, ContactPerson, Phone, Email, Address, City;
+    # sizes match the procedure parameters so every call shares one cached plan
+    _SUPPLIER_PARAMS = (
+        (pyodbc.SQL_WVARCHAR, 10, 0),
+        (pyodbc.SQL_WVARCHAR, 100, 0),
+        (pyodbc.SQL_WVARCHAR, 100, 0),
+        (pyodbc.SQL_WVARCHAR, 20, 0),
+        (pyodbc.SQL_WVARCHAR, 100, 0),
+        (pyodbc.SQL_WVARCHAR, 200, 0),
+        (pyodbc.SQL_WVARCHAR, 50, 0),
+    )
+    _ADD_SUPPLIER = db.prepare('usp_AddSupplier', _SUPPLIER_PARAMS)
+    _UPDATE_SUPPLIER = db.prepare('usp_UpdateSupplier', _SUPPLIER_PARAMS)
+    
+    # Set to None once the server is found not to have usp_ReserveSupplierIdRange
+    _supplier_ids: Optional[IdPool] = IdPool(_reserve_supplier_range, batch_size=100)
+    
     @staticmethod
     def get_next_id() -> str:
         """
-        Generate the next available supplier ID.
-        Uses: usp_GetNextSupplierId
+        Hand out the next supplier ID.
+        
+        IDs come from a locally held range reserved from dbo.SupplierIdSeq,
+        so bulk imports make one server call per 100 suppliers. Falls back
+        to usp_GetNextSupplierId on databases without the range procedure.
         
         Returns:
             Next ID in format 'SUP###' (e.g., 'SUP001')
         """
+        pool = SupplierRepository._supplier_ids
+        if pool is not None:
+            try:
+                return pool.next()
+            except pyodbc.ProgrammingError as e:
+                if not db.is_missing_procedure(e):
+                    raise
+                # Procedure not installed; stop trying
+                SupplierRepository._supplier_ids = None
         next_id = db.call_procedure_scalar('usp_GetNextSupplierId', column_name='NextId')
         return next_id or 'SUP001'
     
@@ -114,8 +180,37 @@ class SupplierRepository:
         Returns:
             List of Supplier objects ordered by Supplier_Name
         """
-        rows = db.call_procedure_with_result('usp_ListSuppliers')
-        return [Supplier.from_row(row) for row in rows]
+        suppliers = SupplierRepository._cache.get('all')
+        if suppliers is None:
+            suppliers = db.call_procedure_materialized(
+                'usp_ListSuppliers', None, Supplier, _SUPPLIER_CONVERTERS
+            )
+            SupplierRepository._cache.set('all', suppliers)
+        return list(suppliers)
+    
+    @staticmethod
+    def iter_all() -> Iterator[Supplier]:
+        """
+        Stream all suppliers without building the full list.
+        Uses: usp_ListSuppliers
+        
+        Serves the cached list when get_all() has one; otherwise rows are
+        fetched in batches and converted as they arrive (not cached).
+        
+        Yields:
+            Supplier objects ordered by Supplier_Name
+        """
+        suppliers = SupplierRepository._cache.get('all')
+        if suppliers is not None:
+            yield from suppliers
+            return
+        for row in db.iter_procedure('usp_ListSuppliers'):
+            yield Supplier.from_row(row)
+    
+    @staticmethod
+    def invalidate() -> None:
+        """Drop the cached supplier lists (after a supplier or purchase change)."""
+        SupplierRepository._cache.clear()
     
     @staticmethod
     def get_by_id(supplier_id: str) -> Optional[Supplier]:
@@ -129,14 +224,18 @@ class SupplierRepository:
         Returns:
             Supplier object if found, None otherwise
         """
-        rows = db.call_procedure_with_result('usp_GetSupplierById', {'Supplier_ID': supplier_id})
+        rows = db.call_procedure_with_result('usp_GetSupplierById', (supplier_id,))
         return Supplier.from_row(rows[0]) if rows else None
     
     @staticmethod
     def search(search_term: str) -> List[Supplier]:
         """
         Search suppliers by name, contact person, or city.
-        Note: Uses direct SQL as no search procedure exists.
+        Uses: usp_SearchSuppliers
+        
+        Terms of 3+ characters match any word starting with the term
+        (full-text index); shorter terms, or servers without Full-Text
+        Search, match anywhere in the column.
         
         Args:
             search_term: Text to search for
@@ -144,9 +243,9 @@ class SupplierRepository:
         Returns:
             List of matching Supplier objects
         """
-        # Uses: usp_SearchSuppliers
-        rows = db.call_procedure_with_result('usp_SearchSuppliers', (search_term,))
-        return [Supplier.from_row(row) for row in rows]
+        return db.call_procedure_materialized(
+            'usp_SearchSuppliers', (search_term,), Supplier, _SUPPLIER_CONVERTERS
+        )
     
     @staticmethod
     def create(
@@ -174,16 +273,47 @@ class SupplierRepository:
         Returns:
             True if created successfully
         """
-        result = db.call_procedure('usp_AddSupplier', {
-            'Supplier_ID': supplier_id,
-            'Supplier_Name': supplier_name,
-            'Contact_Person': contact_person,
-            'Phone': phone,
-            'Email': email,
-            'Address': address,
-            'City': city
-        })
-        return result.success
+        success = SupplierRepository._ADD_SUPPLIER(
+            supplier_id, supplier_name, contact_person, phone, email, address, city
+        )
+        if success:
+            SupplierRepository.invalidate()
+        return success
+    
+    @staticmethod
+    def create_bulk(suppliers: List[Supplier]) -> int:
+        """
+        Insert many suppliers (e.g. an import) in one call.
+        Uses: usp_AddSuppliersBulk
+        
+        The rows go to the server as a single table-valued parameter, and
+        either all are inserted or none are. Suppliers without a
+        supplier_id are given one from get_next_id() (written back onto
+        the Supplier).
+        
+        Args:
+            suppliers: Supplier objects to insert
+        
+        Returns:
+            Number of suppliers inserted
+        
+        Raises:
+            pyodbc.Error: If the insert fails (e.g. a duplicate Supplier_ID)
+        """
+        if not suppliers:
+            return 0
+        rows = []
+        for supplier in suppliers:
+            if not supplier.supplier_id:
+                supplier.supplier_id = SupplierRepository.get_next_id()
+            rows.append((
+                supplier.supplier_id, supplier.supplier_name, supplier.contact_person,
+                supplier.phone, supplier.email, supplier.address, supplier.city
+            ))
+        
+        result = db.call_procedure_with_result('usp_AddSuppliersBulk', (rows,), commit=True)
+        SupplierRepository.invalidate()
+        return result[0].Inserted if result else 0
     
     @staticmethod
     def update(
@@ -211,16 +341,12 @@ class SupplierRepository:
         Returns:
             True if updated successfully
         """
-        result = db.call_procedure('usp_UpdateSupplier', {
-            'Supplier_ID': supplier_id,
-            'Supplier_Name': supplier_name,
-            'Contact_Person': contact_person,
-            'Phone': phone,
-            'Email': email,
-            'Address': address,
-            'City': city
-        })
-        return result.success
+        success = SupplierRepository._UPDATE_SUPPLIER(
+            supplier_id, supplier_name, contact_person, phone, email, address, city
+        )
+        if success:
+            SupplierRepository.invalidate()
+        return success
     
     @staticmethod
     def delete(supplier_id: str) -> Tuple[bool, str]:
@@ -236,24 +362,32 @@ class SupplierRepository:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        result = db.call_procedure('usp_DeleteSupplier', {'Supplier_ID': supplier_id})
-        
-        if result.success:
-            return True, "Supplier deleted successfully"
-        else:
-            return False, result.error_message or "Delete failed"
+        try:
+            db.call_procedure('usp_DeleteSupplier', (supplier_id,), has_output=False, raise_errors=True)
+        except pyodbc.Error as e:
+            return False, db.error_message(e) or "Delete failed"
+        SupplierRepository.invalidate()
+        return True, "Supplier deleted successfully"
     
     @staticmethod
-    def get_for_dropdown() -> List[Dict[str, str]]:
+    def get_for_dropdown() -> List[SupplierChoice]:
         """
         Get suppliers for dropdown/combo box.
         Uses: usp_ListSuppliers
         
         Returns:
-            List of dicts with 'id' and 'name' keys
+            List of SupplierChoice (id, name) tuples
+        
+        Example:
+            for supplier_id, name in SupplierRepository.get_for_dropdown():
+                combo.addItem(name, supplier_id)
         """
-        rows = db.call_procedure_with_result('usp_ListSuppliers')
-        return [{'id': row.Supplier_ID, 'name': row.Supplier_Name} for row in rows]
+        options = SupplierRepository._cache.get('dropdown')
+        if options is None:
+            rows = db.call_procedure_with_result('usp_ListSuppliers')
+            options = [SupplierChoice(row.Supplier_ID, row.Supplier_Name) for row in rows]
+            SupplierRepository._cache.set('dropdown', options)
+        return list(options)
     
     @staticmethod
     def create_supplier(
@@ -266,7 +400,7 @@ class SupplierRepository:
     ) -> Tuple[bool, str, Optional[str]]:
         """
         Create a new supplier with auto-generated ID.
-        Uses: usp_GetNextSupplierId, usp_AddSupplier
+        Uses: usp_CreateSupplierAutoId (ID allocated server-side, one call)
         
         Args:
             supplier_name: Company name (required)
@@ -282,20 +416,19 @@ class SupplierRepository:
         if not supplier_name or not supplier_name.strip():
             return False, "Supplier name is required", None
         
-        # Generate next ID using stored procedure
-        supplier_id = SupplierRepository.get_next_id()
-        
-        result = db.call_procedure('usp_AddSupplier', {
-            'Supplier_ID': supplier_id,
-            'Supplier_Name': supplier_name.strip(),
-            'Contact_Person': contact_person,
-            'Phone': phone,
-            'Email': email,
-            'Address': address,
-            'City': city
-        })
+        try:
+            rows = db.call_procedure_with_result('usp_CreateSupplierAutoId', (
+                supplier_name.strip(),
+                contact_person,
+                phone,
+                email,
+                address,
+                city
+            ), commit=True)
+        except pyodbc.Error as e:
+            return False, db.error_message(e), None
         
-        if result.success:
-            return True, f"Supplier '{supplier_name}' created successfully", result.created_key or supplier_id
-        else:
-            return False, result.error_message or "Failed to create supplier", None
+        if rows and rows[0].NewId:
+            SupplierRepository.invalidate()
+            return True, f"Supplier '{supplier_name}' created successfully", rows[0].NewId
+        return False, "Failed to create supplier", None
@@ -0,0 +1,82 @@
+"""
+=============================================================================
+TTL Cache
+=============================================================================
+Small thread-safe cache with per-entry expiry, used by the repositories to
+avoid repeating identical stored procedure calls within a short window.
+
+Entries expire after `ttl` seconds; once `maxsize` is reached the oldest
+entry is evicted. Repositories clear or pop entries whenever they change
+the underlying rows, so the TTL only bounds staleness from other clients.
+
+Usage:
+    _cache = TTLCache(maxsize=2048, ttl=30)
+
+    product = _cache.get(code)
+    if product is None:
+        product = load(code)
+        _cache.set(code, product)
+
+=============================================================================
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire after a fixed number of seconds.
+    
+    Attributes:
+        maxsize: Maximum number of entries kept
+        ttl: Lifetime of each entry in seconds
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (or default)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[1] if entry is not None else default
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
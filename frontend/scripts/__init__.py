@@ -0,0 +1,7 @@
+"""
+Maintenance and smoke-test scripts.
+
+Run from frontend/ with python -m scripts.<name>; running a script as a file
+(python scripts/<name>.py) also works. Every script imports _bootstrap first
+to put frontend/ on sys.path.
+"""
@@ -0,0 +1,22 @@
+"""
+Common start-up for the smoke scripts.
+Puts frontend/ on sys.path and loads the database and employee modules once,
+so scripts run in the same interpreter (see run_all_smoke.py) find them
+already in sys.modules.
+
+Usage (first import in a script, so it works both with python -m and as a file):
+    if __package__:
+        from scripts import _bootstrap  # noqa: F401
+    else:
+        import _bootstrap  # noqa: F401
+"""
+
+import os
+import sys
+
+FRONTEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if FRONTEND_DIR not in sys.path:
+    sys.path.insert(0, FRONTEND_DIR)
+
+import db  # noqa: E402,F401
+import repositories.employee_repository  # noqa: E402,F401
@@ -0,0 +1,19 @@
+"""
+Shared QApplication for the smoke scripts.
+Qt allows one QApplication per process; scripts run from the same process
+(or imported by a harness) reuse it instead of paying platform start-up again.
+"""
+
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+_app = None
+
+
+def get_app() -> QApplication:
+    """Return the process-wide QApplication, creating it on first use."""
+    global _app
+    if _app is None:
+        _app = QApplication.instance() or QApplication(sys.argv)
+    return _app
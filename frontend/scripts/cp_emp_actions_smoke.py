@@ -5,24 +5,27 @@ Verifies that action button container can be created without exceptions.
 """
 
 import sys
-import os
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+if __package__:
+    from scripts import _bootstrap  # noqa: F401  (frontend on sys.path, shared modules loaded)
+else:
+    # Run as a file rather than with -m: only scripts/ is on sys.path yet
+    import _bootstrap  # noqa: F401
+
+# Imported outside smoke_test() so a missing/broken PySide6 fails loudly as an
+# import error instead of being logged as a test failure
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton
+from PySide6.QtCore import Qt
+from scripts._qt_fixture import get_app
 
 def smoke_test():
     """Run smoke test for employee action buttons."""
     log_path = Path(__file__).parent.parent / "logs" / "copilot_emp_actions.log"
     
     try:
-        from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout, QPushButton
-        from PySide6.QtCore import Qt
-        
-        # Create QApplication instance (required for Qt widgets)
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication(sys.argv)
+        # Shared QApplication instance (required for Qt widgets)
+        get_app()
         
         # Simulate creating action button container
         actions_widget = QWidget()
@@ -56,12 +59,14 @@ def smoke_test():
         assert delete_btn.width() == 36
         
         # Write success log
-        with open(log_path, "w") as f:
-            f.write("SMOKE_OK\n")
-            f.write("Employee action buttons smoke test passed.\n")
-            f.write(f"Edit button: {edit_btn.text()} - Size: {edit_btn.width()}x{edit_btn.height()}\n")
-            f.write(f"Delete button: {delete_btn.text()} - Size: {delete_btn.width()}x{delete_btn.height()}\n")
-            f.write(f"Container layout spacing: {actions_layout.spacing()}\n")
+        with open(log_path, "w", buffering=65536) as f:
+            f.write(
+                "SMOKE_OK\n"
+                "Employee action buttons smoke test passed.\n"
+                f"Edit button: {edit_btn.text()} - Size: {edit_btn.width()}x{edit_btn.height()}\n"
+                f"Delete button: {delete_btn.text()} - Size: {delete_btn.width()}x{delete_btn.height()}\n"
+                f"Container layout spacing: {actions_layout.spacing()}\n"
+            )
         
         print("SMOKE_OK")
         return True
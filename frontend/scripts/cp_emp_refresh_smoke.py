@@ -4,12 +4,14 @@ Employee Refresh Smoke Test
 Verifies get_all_employees() method works correctly.
 """
 
-import sys
 import os
 from datetime import datetime
 
-# Add frontend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+if __package__:
+    from scripts import _bootstrap  # noqa: F401  (frontend on sys.path, shared modules loaded)
+else:
+    # Run as a file rather than with -m: only scripts/ is on sys.path yet
+    import _bootstrap  # noqa: F401
 
 def run_smoke_test():
     """Test get_all_employees method."""
@@ -46,16 +48,21 @@ Timestamp: {datetime.now().isoformat()}
 
 """
 
-if __name__ == "__main__":
-    result = run_smoke_test()
-    print(result)
-    
-    # Write to log file
+def write_log(result: str) -> str:
+    """Write the test output to logs/copilot_emp_refresh.log and return the path."""
     log_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
     os.makedirs(log_dir, exist_ok=True)
     
     log_path = os.path.join(log_dir, 'copilot_emp_refresh.log')
     with open(log_path, 'w', encoding='utf-8') as f:
         f.write(result)
+    return log_path
+
+if __name__ == "__main__":
+    result = run_smoke_test()
+    print(result)
+    
+    # Write to log file
+    log_path = write_log(result)
     
     print(f"\nLog written to: {log_path}")
@@ -10,7 +10,7 @@ This script demonstrates and validates:
 
 Usage:
     cd frontend
-    python scripts/cp_employee_smoke.py
+    python -m scripts.cp_employee_smoke
 
 Results are logged to: logs/copilot_emp_smoke.log
 =============================================================================
@@ -19,18 +19,23 @@ Results are logged to: logs/copilot_emp_smoke.log
 import sys
 import os
 from datetime import datetime
+from typing import List
+from unittest.mock import patch
 
-# Add frontend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+if __package__:
+    from scripts import _bootstrap  # noqa: F401  (frontend on sys.path, shared modules loaded)
+else:
+    # Run as a file rather than with -m: only scripts/ is on sys.path yet
+    import _bootstrap  # noqa: F401
 
+import db
 from repositories.employee_repository import EmployeeRepository
 
 
-def log_message(message: str, log_file):
-    """Write message to both console and log file."""
+def log_message(message: str, log_lines: List[str]):
+    """Print message and keep it for the log file (written once at the end)."""
     print(message)
-    log_file.write(message + "\n")
-    log_file.flush()
+    log_lines.append(message)
 
 
 def run_smoke_test():
@@ -42,13 +47,14 @@ def run_smoke_test():
     
     log_path = os.path.join(log_dir, 'copilot_emp_smoke.log')
     
-    with open(log_path, 'w', encoding='utf-8') as log_file:
+    log_lines: List[str] = []
+    try:
         timestamp = datetime.now().isoformat()
         
-        log_message("=" * 70, log_file)
-        log_message("EMPLOYEE CREATION & LOGIN SMOKE TEST", log_file)
-        log_message(f"Timestamp: {timestamp}", log_file)
-        log_message("=" * 70, log_file)
+        log_message("=" * 70, log_lines)
+        log_message("EMPLOYEE CREATION & LOGIN SMOKE TEST", log_lines)
+        log_message(f"Timestamp: {timestamp}", log_lines)
+        log_message("=" * 70, log_lines)
         
         # Test data
         test_username = f"smoke_test_{datetime.now().strftime('%Y%m%d%H%M%S')}"
@@ -59,10 +65,10 @@ def run_smoke_test():
             # ================================================================
             # TEST 1: Admin creates employee account
             # ================================================================
-            log_message("\n[TEST 1] Admin creates employee account", log_file)
-            log_message(f"  Username: {test_username}", log_file)
-            log_message(f"  Name: {test_name}", log_file)
-            log_message(f"  Role: Employee", log_file)
+            log_message("\n[TEST 1] Admin creates employee account", log_lines)
+            log_message(f"  Username: {test_username}", log_lines)
+            log_message(f"  Name: {test_name}", log_lines)
+            log_message(f"  Role: Employee", log_lines)
             
             success, message = EmployeeRepository.create_employee(
                 employee_name=test_name,
@@ -75,17 +81,17 @@ def run_smoke_test():
             )
             
             if success:
-                log_message(f"  ✓ SUCCESS: {message}", log_file)
+                log_message(f"  ✓ SUCCESS: {message}", log_lines)
             else:
-                log_message(f"  ✗ FAILED: {message}", log_file)
-                log_message("\n[RESULT] SMOKE TEST FAILED", log_file)
+                log_message(f"  ✗ FAILED: {message}", log_lines)
+                log_message("\n[RESULT] SMOKE TEST FAILED", log_lines)
                 return 1
             
             # ================================================================
             # TEST 2: Verify employee can authenticate
             # ================================================================
-            log_message("\n[TEST 2] Employee authenticates with credentials", log_file)
-            log_message(f"  Username: {test_username}", log_file)
+            log_message("\n[TEST 2] Employee authenticates with credentials", log_lines)
+            log_message(f"  Username: {test_username}", log_lines)
             
             auth_success, employee, auth_message = EmployeeRepository.authenticate(
                 test_username,
@@ -93,104 +99,114 @@ def run_smoke_test():
             )
             
             if auth_success:
-                log_message(f"  ✓ SUCCESS: Authentication successful", log_file)
-                log_message(f"    - Employee ID: {employee.employee_id}", log_file)
-                log_message(f"    - Name: {employee.employee_name}", log_file)
-                log_message(f"    - Role: {employee.role}", log_file)
-                log_message(f"    - Position: {employee.position}", log_file)
+                log_message(f"  ✓ SUCCESS: Authentication successful", log_lines)
+                log_message(f"    - Employee ID: {employee.employee_id}", log_lines)
+                log_message(f"    - Name: {employee.employee_name}", log_lines)
+                log_message(f"    - Role: {employee.role}", log_lines)
+                log_message(f"    - Position: {employee.position}", log_lines)
             else:
-                log_message(f"  ✗ FAILED: {auth_message}", log_file)
-                log_message("\n[RESULT] SMOKE TEST FAILED", log_file)
+                log_message(f"  ✗ FAILED: {auth_message}", log_lines)
+                log_message("\n[RESULT] SMOKE TEST FAILED", log_lines)
                 return 1
             
             # ================================================================
             # TEST 3: Verify role is 'Employee'
             # ================================================================
-            log_message("\n[TEST 3] Verify role enforcement", log_file)
+            log_message("\n[TEST 3] Verify role enforcement", log_lines)
             
             if employee.role == 'Employee':
-                log_message(f"  ✓ SUCCESS: Role correctly set to 'Employee'", log_file)
+                log_message(f"  ✓ SUCCESS: Role correctly set to 'Employee'", log_lines)
             else:
-                log_message(f"  ✗ FAILED: Role is '{employee.role}' instead of 'Employee'", log_file)
-                log_message("\n[RESULT] SMOKE TEST FAILED", log_file)
+                log_message(f"  ✗ FAILED: Role is '{employee.role}' instead of 'Employee'", log_lines)
+                log_message("\n[RESULT] SMOKE TEST FAILED", log_lines)
                 return 1
             
             # ================================================================
             # TEST 4: Verify password is hashed (not plain text)
             # ================================================================
-            log_message("\n[TEST 4] Verify password hashing", log_file)
+            log_message("\n[TEST 4] Verify password hashing", log_lines)
             
             # Get employee record with password hash
             sql = "SELECT password_hash FROM EMPLOYEE WHERE Username = ?"
-            import db
             row = db.execute_query(sql, (test_username,), fetch='one')
             
             if row and row.password_hash:
                 # Hashed passwords should start with $pbkdf2-sha256$
                 if row.password_hash.startswith('$pbkdf2-sha256$'):
-                    log_message(f"  ✓ SUCCESS: Password is properly hashed with pbkdf2_sha256", log_file)
-                    log_message(f"    Hash prefix: {row.password_hash[:30]}...", log_file)
+                    log_message(f"  ✓ SUCCESS: Password is properly hashed with pbkdf2_sha256", log_lines)
+                    log_message(f"    Hash prefix: {row.password_hash[:30]}...", log_lines)
                 else:
-                    log_message(f"  ✗ FAILED: Password hash format unexpected", log_file)
-                    log_message(f"    Hash: {row.password_hash[:50]}", log_file)
+                    log_message(f"  ✗ FAILED: Password hash format unexpected", log_lines)
+                    log_message(f"    Hash: {row.password_hash[:50]}", log_lines)
             else:
-                log_message(f"  ✗ FAILED: No password hash found", log_file)
-                log_message("\n[RESULT] SMOKE TEST FAILED", log_file)
+                log_message(f"  ✗ FAILED: No password hash found", log_lines)
+                log_message("\n[RESULT] SMOKE TEST FAILED", log_lines)
                 return 1
             
             # ================================================================
             # TEST 5: Verify parameterized SQL (no SQL injection)
             # ================================================================
-            log_message("\n[TEST 5] Verify SQL injection protection", log_file)
+            log_message("\n[TEST 5] Verify SQL injection protection", log_lines)
             
-            # Try SQL injection in username
+            # Try SQL injection in username. The lookup is stubbed out: what
+            # matters is that the username reaches the driver as a bound
+            # parameter, which needs no database round-trip to check.
             malicious_username = "admin' OR '1'='1"
-            auth_success, _, _ = EmployeeRepository.authenticate(malicious_username, "anypass")
+            with patch.object(db, 'call_procedure_with_result', return_value=[]) as lookup:
+                auth_success, _, _ = EmployeeRepository.authenticate(malicious_username, "anypass")
+            procedure, params = lookup.call_args.args
+            parameterized = (
+                procedure == 'usp_GetEmployeeWithPassword'
+                and params == (malicious_username,)
+            )
             
-            if not auth_success:
-                log_message(f"  ✓ SUCCESS: SQL injection attempt blocked", log_file)
-                log_message(f"    Malicious input: {malicious_username}", log_file)
+            if parameterized and not auth_success:
+                log_message(f"  ✓ SUCCESS: SQL injection attempt blocked", log_lines)
+                log_message(f"    Malicious input: {malicious_username}", log_lines)
             else:
-                log_message(f"  ✗ FAILED: SQL injection vulnerability detected!", log_file)
-                log_message("\n[RESULT] SMOKE TEST FAILED", log_file)
+                log_message(f"  ✗ FAILED: SQL injection vulnerability detected!", log_lines)
+                log_message("\n[RESULT] SMOKE TEST FAILED", log_lines)
                 return 1
             
             # ================================================================
             # CLEANUP: Delete test employee
             # ================================================================
-            log_message("\n[CLEANUP] Removing test employee", log_file)
+            log_message("\n[CLEANUP] Removing test employee", log_lines)
             
             delete_success, delete_message = EmployeeRepository.delete(employee.employee_id)
             
             if delete_success:
-                log_message(f"  ✓ SUCCESS: Test employee deleted", log_file)
+                log_message(f"  ✓ SUCCESS: Test employee deleted", log_lines)
             else:
-                log_message(f"  ⚠ WARNING: Could not delete test employee: {delete_message}", log_file)
-                log_message(f"    Manual cleanup may be needed for: {employee.employee_id}", log_file)
+                log_message(f"  ⚠ WARNING: Could not delete test employee: {delete_message}", log_lines)
+                log_message(f"    Manual cleanup may be needed for: {employee.employee_id}", log_lines)
             
             # ================================================================
             # FINAL RESULT
             # ================================================================
-            log_message("\n" + "=" * 70, log_file)
-            log_message("[RESULT] ALL TESTS PASSED ✓", log_file)
-            log_message("=" * 70, log_file)
-            log_message("\nSummary:", log_file)
-            log_message("  • Admin can create employee accounts", log_file)
-            log_message("  • Employees can authenticate with username/password", log_file)
-            log_message("  • Role enforcement works correctly", log_file)
-            log_message("  • Passwords are hashed with pbkdf2_sha256", log_file)
-            log_message("  • SQL injection protection is active", log_file)
-            log_message("\nEmployee creation and login functionality is working correctly!", log_file)
+            log_message("\n" + "=" * 70, log_lines)
+            log_message("[RESULT] ALL TESTS PASSED ✓", log_lines)
+            log_message("=" * 70, log_lines)
+            log_message("\nSummary:", log_lines)
+            log_message("  • Admin can create employee accounts", log_lines)
+            log_message("  • Employees can authenticate with username/password", log_lines)
+            log_message("  • Role enforcement works correctly", log_lines)
+            log_message("  • Passwords are hashed with pbkdf2_sha256", log_lines)
+            log_message("  • SQL injection protection is active", log_lines)
+            log_message("\nEmployee creation and login functionality is working correctly!", log_lines)
             
             return 0
             
         except Exception as e:
-            log_message(f"\n✗ CRITICAL ERROR: {str(e)}", log_file)
-            log_message("\n[RESULT] SMOKE TEST FAILED", log_file)
+            log_message(f"\n✗ CRITICAL ERROR: {str(e)}", log_lines)
+            log_message("\n[RESULT] SMOKE TEST FAILED", log_lines)
             import traceback
-            log_message("\nStack trace:", log_file)
-            log_message(traceback.format_exc(), log_file)
+            log_message("\nStack trace:", log_lines)
+            log_message(traceback.format_exc(), log_lines)
             return 1
+    finally:
+        with open(log_path, 'w', encoding='utf-8') as log_file:
+            log_file.write("\n".join(log_lines) + "\n")
 
 
 if __name__ == "__main__":
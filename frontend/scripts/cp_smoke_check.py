@@ -11,39 +11,59 @@ Test Coverage:
 - CategoryRepository.get_all_categories()
 - SubcategoryRepository.get_next_id()
 - SubcategoryRepository.create_subcategory()
-- SubcategoryRepository.get_subcategories_for_category()
+- SubcategoryRepository.get_all_grouped_by_category()
 
 Usage:
     cd frontend
-    python scripts/cp_smoke_check.py
+    python -m scripts.cp_smoke_check
 
 Note: This script creates test data in the database. Run with caution.
 =============================================================================
 """
 
+import io
 import sys
-import os
 
-# Add frontend directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __package__:
+    from scripts import _bootstrap  # noqa: F401  (frontend on sys.path, shared modules loaded)
+else:
+    # Run as a file rather than with -m: only scripts/ is on sys.path yet
+    import _bootstrap  # noqa: F401
 
 from repositories.category_repository import CategoryRepository
 from repositories.subcategory_repository import SubcategoryRepository
 
 
+# Output is collected here and written in one go by _flush_output()
+_buf = io.StringIO()
+_BAR = "=" * 70
+
+
+def out(line: str = "") -> None:
+    """Buffer one line of output."""
+    _buf.write(line)
+    _buf.write('\n')
+
+
+def _flush_output() -> None:
+    """Write the buffered output to stdout and empty the buffer."""
+    sys.stdout.write(_buf.getvalue())
+    sys.stdout.flush()
+    _buf.seek(0)
+    _buf.truncate()
+
+
 def print_header(text):
     """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {text}")
-    print("=" * 70)
+    out(f"\n{_BAR}\n  {text}\n{_BAR}")
 
 
 def print_test(test_name, passed, details=""):
     """Print test result."""
     status = "✓ PASS" if passed else "✗ FAIL"
-    print(f"{status} | {test_name}")
+    out(f"{status} | {test_name}")
     if details:
-        print(f"       {details}")
+        out(f"       {details}")
 
 
 def test_category_next_id():
@@ -86,12 +106,14 @@ def test_category_get_all():
         print_test("get_all_categories()", passed, f"Found {len(categories)} categories")
         
         # Check for our test category
-        test_cat = next((c for c in categories if c.cat_name == "CP_Test_Category"), None)
+        # Reversed so the first category with a given name wins, as before
+        by_name = {c.cat_name: c for c in reversed(categories)}
+        test_cat = by_name.get("CP_Test_Category")
         if test_cat:
-            print(f"       Test category found: {test_cat.cat_id} - {test_cat.cat_name}")
+            out(f"       Test category found: {test_cat.cat_id} - {test_cat.cat_name}")
             return True, test_cat.cat_id
         else:
-            print("       Warning: Test category not found in results")
+            out("       Warning: Test category not found in results")
             return passed, None
     except Exception as e:
         print_test("get_all_categories()", False, f"Error: {str(e)}")
@@ -138,24 +160,26 @@ def test_subcategory_get_by_category(cat_id):
     print_header("TEST: Subcategory Retrieval")
     
     if not cat_id:
-        print_test("get_subcategories_for_category()", False, "No valid category ID provided")
+        print_test("get_all_grouped_by_category()", False, "No valid category ID provided")
         return False
     
     try:
-        subcategories = SubcategoryRepository.get_subcategories_for_category(cat_id)
+        # One listing for all categories, looked up locally
+        subcategories = SubcategoryRepository.get_all_grouped_by_category().get(cat_id, [])
         passed = len(subcategories) > 0
-        print_test("get_subcategories_for_category()", passed, f"Found {len(subcategories)} subcategories")
+        print_test("get_all_grouped_by_category()", passed, f"Found {len(subcategories)} subcategories")
         
         # Check for our test subcategory
-        test_subcat = next((s for s in subcategories if s.subcat_name == "CP_Test_Subcategory"), None)
+        by_name = {s.subcat_name: s for s in reversed(subcategories)}
+        test_subcat = by_name.get("CP_Test_Subcategory")
         if test_subcat:
-            print(f"       Test subcategory found: {test_subcat.subcat_id} - {test_subcat.subcat_name}")
+            out(f"       Test subcategory found: {test_subcat.subcat_id} - {test_subcat.subcat_name}")
         else:
-            print("       Warning: Test subcategory not found in results")
+            out("       Warning: Test subcategory not found in results")
         
         return passed
     except Exception as e:
-        print_test("get_subcategories_for_category()", False, f"Error: {str(e)}")
+        print_test("get_all_grouped_by_category()", False, f"Error: {str(e)}")
         return False
 
 
@@ -163,67 +187,68 @@ def cleanup_test_data(cat_id, subcat_id):
     """Clean up test data created during smoke checks."""
     print_header("CLEANUP: Removing Test Data")
     
-    # Delete subcategory first (foreign key constraint)
-    if subcat_id:
+    # The category and its subcategories go in one call / transaction
+    if cat_id:
+        try:
+            success, message = CategoryRepository.delete_cascade(cat_id)
+            print_test(f"Delete category {cat_id} (subcategory {subcat_id})", success, message)
+        except Exception as e:
+            print_test(f"Delete category {cat_id}", False, f"Error: {str(e)}")
+    elif subcat_id:
         try:
             success, message = SubcategoryRepository.delete(subcat_id)
             print_test(f"Delete subcategory {subcat_id}", success, message)
         except Exception as e:
             print_test(f"Delete subcategory {subcat_id}", False, f"Error: {str(e)}")
-    
-    # Delete category
-    if cat_id:
-        try:
-            success, message = CategoryRepository.delete(cat_id)
-            print_test(f"Delete category {cat_id}", success, message)
-        except Exception as e:
-            print_test(f"Delete category {cat_id}", False, f"Error: {str(e)}")
 
 
 def run_smoke_checks():
     """Run all smoke checks."""
-    print_header("COPILOT SMOKE CHECK - Category & Subcategory Dialogs")
-    print("Testing repository methods used by new dialog views")
-    print("Test data will be created and cleaned up automatically")
-    
-    results = []
-    cat_id = None
-    subcat_id = None
-    
-    # Test Category Operations
-    results.append(("Category ID Generation", test_category_next_id()))
-    
-    cat_created, cat_id = test_category_create()
-    results.append(("Category Creation", cat_created))
-    
-    cat_retrieved, cat_id_retrieved = test_category_get_all()
-    results.append(("Category Retrieval", cat_retrieved))
-    if cat_id is None and cat_id_retrieved:
-        cat_id = cat_id_retrieved
-    
-    # Test Subcategory Operations
-    results.append(("Subcategory ID Generation", test_subcategory_next_id()))
-    
-    subcat_created, subcat_id = test_subcategory_create(cat_id)
-    results.append(("Subcategory Creation", subcat_created))
-    
-    results.append(("Subcategory Retrieval", test_subcategory_get_by_category(cat_id)))
-    
-    # Cleanup
-    cleanup_test_data(cat_id, subcat_id)
-    
-    # Summary
-    print_header("TEST SUMMARY")
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-    print(f"Tests Passed: {passed}/{total}")
-    
-    if passed == total:
-        print("\n✓ ALL TESTS PASSED - Dialogs are ready for use!")
-        return 0
-    else:
-        print(f"\n✗ {total - passed} TEST(S) FAILED - Review errors above")
-        return 1
+    try:
+        print_header("COPILOT SMOKE CHECK - Category & Subcategory Dialogs")
+        out("Testing repository methods used by new dialog views")
+        out("Test data will be created and cleaned up automatically")
+        
+        results = []
+        cat_id = None
+        subcat_id = None
+        
+        # Test Category Operations
+        results.append(("Category ID Generation", test_category_next_id()))
+        
+        cat_created, cat_id = test_category_create()
+        results.append(("Category Creation", cat_created))
+        
+        cat_retrieved, cat_id_retrieved = test_category_get_all()
+        results.append(("Category Retrieval", cat_retrieved))
+        if cat_id is None and cat_id_retrieved:
+            cat_id = cat_id_retrieved
+        
+        # Test Subcategory Operations
+        results.append(("Subcategory ID Generation", test_subcategory_next_id()))
+        
+        subcat_created, subcat_id = test_subcategory_create(cat_id)
+        results.append(("Subcategory Creation", subcat_created))
+        
+        results.append(("Subcategory Retrieval", test_subcategory_get_by_category(cat_id)))
+        
+        # Cleanup
+        cleanup_test_data(cat_id, subcat_id)
+        
+        # Summary
+        print_header("TEST SUMMARY")
+        passed = sum(1 for _, result in results if result)
+        total = len(results)
+        out(f"Tests Passed: {passed}/{total}")
+        
+        if passed == total:
+            out("\n✓ ALL TESTS PASSED - Dialogs are ready for use!")
+            return 0
+        else:
+            out(f"\n✗ {total - passed} TEST(S) FAILED - Review errors above")
+            return 1
+    finally:
+        _flush_output()
 
 
 if __name__ == "__main__":
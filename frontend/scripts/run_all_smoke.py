@@ -0,0 +1,53 @@
+"""
+=============================================================================
+Run All Employee Smoke Tests
+=============================================================================
+Runs the employee smoke tests in one process, so the interpreter start-up,
+PySide6/pyodbc imports and the database connection are paid once instead
+of once per script. Each test still writes its own log file in logs/.
+
+The individual scripts remain runnable on their own for debugging.
+
+Usage:
+    cd frontend
+    python -m scripts.run_all_smoke
+=============================================================================
+"""
+
+import sys
+
+if __package__:
+    from scripts import _bootstrap  # noqa: F401  (frontend on sys.path, shared modules loaded)
+else:
+    # Run as a file rather than with -m: only scripts/ is on sys.path yet
+    import _bootstrap  # noqa: F401
+
+import db
+from scripts import cp_emp_actions_smoke, cp_emp_refresh_smoke, cp_employee_smoke
+
+
+def run_all() -> int:
+    """Run every smoke test; returns 0 if all passed, 1 otherwise."""
+    results = {}
+    
+    results['actions'] = cp_emp_actions_smoke.smoke_test()
+    
+    # One shared connection for the database-backed tests
+    with db.connection_scope():
+        refresh_output = cp_emp_refresh_smoke.run_smoke_test()
+        print(refresh_output)
+        cp_emp_refresh_smoke.write_log(refresh_output)
+        results['refresh'] = 'TEST PASSED' in refresh_output
+        
+        results['employee'] = cp_employee_smoke.run_smoke_test() == 0
+    
+    print("\n" + "=" * 70)
+    for name, passed in results.items():
+        print(f"  {name:<10} {'PASSED ✓' if passed else 'FAILED ✗'}")
+    print("=" * 70)
+    
+    return 0 if all(results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all())
@@ -5,8 +5,12 @@ Smoke Check Script
 Quick validation script to test repository fetch operations.
 
 Run this after making changes to verify basic functionality:
+    python -m scripts.smoke_check      (from frontend/)
     python scripts/smoke_check.py
 
+The connection test runs first; the repository fetches then run
+concurrently, each on its own pooled connection (db.connection_scope()).
+
 Tests:
     - Product fetch
     - Customer fetch
@@ -17,21 +21,54 @@ Tests:
 =============================================================================
 """
 
+import io
 import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __package__:
+    from scripts import _bootstrap  # noqa: F401  (frontend on sys.path, shared modules loaded)
+else:
+    # Run as a file rather than with -m: only scripts/ is on sys.path yet
+    import _bootstrap  # noqa: F401
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple
+
+import db
+from repositories.product_repository import ProductRepository
+from repositories.customer_repository import CustomerRepository
+from repositories.supplier_repository import SupplierRepository
+from repositories.inventory_repository import InventoryRepository
+from repositories.category_repository import CategoryRepository
+
+
+# Output is collected here and written in one go by _flush_output()
+_buf = io.StringIO()
+_BAR = "=" * 60
 
-from typing import Tuple
+
+def out(line: str = "") -> None:
+    """Buffer one line of output."""
+    _buf.write(line)
+    _buf.write('\n')
+
+
+def _flush_output() -> None:
+    """Write the buffered output to stdout and empty the buffer."""
+    sys.stdout.write(_buf.getvalue())
+    sys.stdout.flush()
+    _buf.seek(0)
+    _buf.truncate()
 
 
 def test_database_connection() -> Tuple[bool, str]:
     """Test database connectivity."""
     try:
-        import db
-        conn = db.get_connection()
-        conn.close()
+        # Pooled, so the connection is handed back for the fetch tests to reuse
+        with db.connection_scope(pooled=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
         return True, "Database connection successful"
     except Exception as e:
         return False, f"Database connection failed: {str(e)}"
@@ -40,7 +77,6 @@ def test_database_connection() -> Tuple[bool, str]:
 def test_product_fetch() -> Tuple[bool, str]:
     """Test fetching products."""
     try:
-        from repositories.product_repository import ProductRepository
         products = ProductRepository.get_all()
         if products:
             p = products[0]
@@ -58,7 +94,6 @@ def test_product_fetch() -> Tuple[bool, str]:
 def test_customer_fetch() -> Tuple[bool, str]:
     """Test fetching customers."""
     try:
-        from repositories.customer_repository import CustomerRepository
         customers = CustomerRepository.get_all()
         if customers:
             c = customers[0]
@@ -76,7 +111,6 @@ def test_customer_fetch() -> Tuple[bool, str]:
 def test_supplier_fetch() -> Tuple[bool, str]:
     """Test fetching suppliers."""
     try:
-        from repositories.supplier_repository import SupplierRepository
         suppliers = SupplierRepository.get_all()
         if suppliers:
             s = suppliers[0]
@@ -96,7 +130,6 @@ def test_supplier_fetch() -> Tuple[bool, str]:
 def test_inventory_fetch() -> Tuple[bool, str]:
     """Test fetching inventory."""
     try:
-        from repositories.inventory_repository import InventoryRepository
         inventory = InventoryRepository.get_all()
         if inventory:
             i = inventory[0]
@@ -113,7 +146,6 @@ def test_inventory_fetch() -> Tuple[bool, str]:
 def test_category_fetch() -> Tuple[bool, str]:
     """Test fetching categories."""
     try:
-        from repositories.category_repository import CategoryRepository
         categories = CategoryRepository.get_all()
         if categories:
             c = categories[0]
@@ -126,43 +158,59 @@ def test_category_fetch() -> Tuple[bool, str]:
         return False, f"Category fetch failed: {str(e)}"
 
 
+def _run_with_pooled_connection(test_func: Callable[[], Tuple[bool, str]]) -> Tuple[bool, str]:
+    """Run one test on a worker thread, on its own pooled connection."""
+    try:
+        with db.connection_scope(pooled=True):
+            return test_func()
+    except Exception as e:
+        # The tests catch their own errors; this comes from opening the connection
+        return False, f"Database connection failed: {str(e)}"
+
+
 def run_smoke_tests():
     """Run all smoke tests and report results."""
-    
-    print("=" * 60)
-    print("SMOKE CHECK - Mobile Accessory Inventory System")
-    print("=" * 60)
-    print()
-    
-    tests = [
-        ("Database Connection", test_database_connection),
-        ("Product Repository", test_product_fetch),
-        ("Customer Repository", test_customer_fetch),
-        ("Supplier Repository", test_supplier_fetch),
-        ("Inventory Repository", test_inventory_fetch),
-        ("Category Repository", test_category_fetch),
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test_name, test_func in tests:
-        success, message = test_func()
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} | {test_name}")
-        print(f"       {message}")
-        print()
+    try:
+        out(f"{_BAR}\nSMOKE CHECK - Mobile Accessory Inventory System\n{_BAR}")
+        out()
+        
+        # Independent fetches, run concurrently once the connection test passes
+        fetch_tests = [
+            ("Product Repository", test_product_fetch),
+            ("Customer Repository", test_customer_fetch),
+            ("Supplier Repository", test_supplier_fetch),
+            ("Inventory Repository", test_inventory_fetch),
+            ("Category Repository", test_category_fetch),
+        ]
+        
+        results = [("Database Connection", *test_database_connection())]
+        if results[0][1]:
+            with ThreadPoolExecutor(max_workers=len(fetch_tests)) as executor:
+                futures = [
+                    (test_name, executor.submit(_run_with_pooled_connection, test_func))
+                    for test_name, test_func in fetch_tests
+                ]
+                # Reported in list order, not completion order
+                results.extend((test_name, *future.result()) for test_name, future in futures)
+        
+        passed = 0
+        failed = 0
+        for test_name, success, message in results:
+            status = "✅ PASS" if success else "❌ FAIL"
+            out(f"{status} | {test_name}")
+            out(f"       {message}")
+            out()
+            
+            if success:
+                passed += 1
+            else:
+                failed += 1
+        
+        out(f"{_BAR}\nResults: {passed} passed, {failed} failed\n{_BAR}")
         
-        if success:
-            passed += 1
-        else:
-            failed += 1
-    
-    print("=" * 60)
-    print(f"Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-    
-    return failed == 0
+        return failed == 0
+    finally:
+        _flush_output()
 
 
 if __name__ == "__main__":
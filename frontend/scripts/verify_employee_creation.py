@@ -7,23 +7,25 @@ This script demonstrates and verifies that:
 2. The newly created employee can log in successfully
 3. Role-based authentication is enforced
 
-Usage: python scripts/verify_employee_creation.py
+Usage (from frontend/): python -m scripts.verify_employee_creation
 =============================================================================
 """
 
 import sys
-import os
 
-# Add frontend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+if __package__:
+    from scripts import _bootstrap  # noqa: F401  (frontend on sys.path, shared modules loaded)
+else:
+    # Run as a file rather than with -m: only scripts/ is on sys.path yet
+    import _bootstrap  # noqa: F401
 
 from repositories.employee_repository import EmployeeRepository
 
+_BAR = "=" * 60
+
 def test_admin_creates_employee():
     """Test that admin can create an employee account."""
-    print("=" * 60)
-    print("TEST: Admin Creates Employee Account")
-    print("=" * 60)
+    print(f"{_BAR}\nTEST: Admin Creates Employee Account\n{_BAR}")
     
     # Test data
     test_username = "test_emp_001"
@@ -86,16 +88,12 @@ def test_admin_creates_employee():
     except:
         print(f"   ⚠ WARNING: Could not delete test employee (manual cleanup may be needed)")
     
-    print("\n" + "=" * 60)
-    print("ALL TESTS PASSED ✓")
-    print("=" * 60)
+    print(f"\n{_BAR}\nALL TESTS PASSED ✓\n{_BAR}")
     return True
 
 def test_duplicate_username():
     """Test that duplicate usernames are rejected."""
-    print("\n" + "=" * 60)
-    print("TEST: Duplicate Username Rejection")
-    print("=" * 60)
+    print(f"\n{_BAR}\nTEST: Duplicate Username Rejection\n{_BAR}")
     
     # Try to create with existing username
     print("\n1. Attempting to create employee with existing username...")
@@ -117,9 +115,7 @@ def test_duplicate_username():
 
 def main():
     """Run all verification tests."""
-    print("\n" + "=" * 60)
-    print("Employee Creation Verification Script")
-    print("=" * 60)
+    print(f"\n{_BAR}\nEmployee Creation Verification Script\n{_BAR}")
     
     try:
         # Test 1: Create and authenticate
@@ -128,12 +124,10 @@ def main():
         # Test 2: Duplicate username
         test2_passed = test_duplicate_username()
         
-        print("\n" + "=" * 60)
-        print("SUMMARY")
-        print("=" * 60)
+        print(f"\n{_BAR}\nSUMMARY\n{_BAR}")
         print(f"Test 1 (Admin Creates Employee): {'PASS ✓' if test1_passed else 'FAIL ✗'}")
         print(f"Test 2 (Duplicate Username):     {'PASS ✓' if test2_passed else 'FAIL ✗'}")
-        print("=" * 60)
+        print(_BAR)
         
         if test1_passed and test2_passed:
             print("\nAll tests passed! Employee creation is working correctly.")
@@ -11,15 +11,41 @@ This module provides common utility functions used throughout the application:
 """
 
 import re
+import string
+from functools import lru_cache
 from decimal import Decimal, InvalidOperation
 from datetime import date, datetime, time
 from typing import Optional, Union, Tuple
 
+try:
+    import pandas as pd
+except ImportError:  # optional dependency
+    pd = None
+
+
+# Compiled once at import; the validators and parsers run per field/row
+_EMAIL_LOCAL_OK = frozenset(string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_OK = frozenset(string.ascii_letters + string.digits + '.-')
+# Deletes phone formatting: -()+. and every whitespace character (the same
+# set as regex \s; U+3000 is the highest)
+_PHONE_STRIP = str.maketrans('', '', '-()+.' + ''.join(
+    c for c in map(chr, range(0x3001)) if c.isspace()
+))
+# Same rule as is_valid_email, for the vectorized pandas path (fullmatch)
+_EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+_CURRENCY_CLEAN_RE = re.compile(r'[^\d.-]')
+_INT_CLEAN_RE = re.compile(r'[^\d-]')
+
 
 # =============================================================================
 # VALIDATION FUNCTIONS
 # =============================================================================
 
+def _is_blank(value: Optional[str]) -> bool:
+    """True for None, '' and whitespace-only strings (no strip() copy)."""
+    return not value or value.isspace()
+
+
 def is_valid_email(email: str) -> bool:
     """
     Validate an email address format.
@@ -39,9 +65,17 @@ def is_valid_email(email: str) -> bool:
     if not email:
         return True  # Empty is valid (optional field)
     
-    # Simple email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    # Single pass equivalent of ^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$
+    # (no regex engine, no backtracking on long inputs)
+    at = email.find('@')
+    if at < 1 or not _EMAIL_LOCAL_OK.issuperset(email[:at]):
+        return False
+    domain = email[at + 1:]
+    dot = domain.rfind('.')
+    if dot < 1 or not _EMAIL_DOMAIN_OK.issuperset(domain[:dot]):
+        return False
+    tld = domain[dot + 1:]
+    return len(tld) >= 2 and tld.isascii() and tld.isalpha()
 
 
 def is_valid_phone(phone: str) -> bool:
@@ -64,12 +98,52 @@ def is_valid_phone(phone: str) -> bool:
         return True  # Empty is valid (optional field)
     
     # Remove common formatting characters
-    cleaned = re.sub(r'[\s\-\(\)\+\.]', '', phone)
+    cleaned = phone.translate(_PHONE_STRIP)
     
     # Check if remaining characters are digits and length is reasonable
     return cleaned.isdigit() and 7 <= len(cleaned) <= 15
 
 
+def bulk_validate_emails(values):
+    """
+    Validate a whole column of email addresses (e.g. from a CSV import).
+    
+    With a pandas Series the check runs as one vectorized string operation
+    instead of one is_valid_email() call per cell. Missing and empty values
+    are valid, as in is_valid_email.
+    
+    Args:
+        values: pandas Series, or any iterable of strings
+    
+    Returns:
+        Boolean Series for a Series input, otherwise a list of bools
+    """
+    if pd is not None and isinstance(values, pd.Series):
+        filled = values.fillna('').astype(str)
+        return filled.str.fullmatch(_EMAIL_RE, na=False) | (filled == '')
+    return [is_valid_email(value) for value in values]
+
+
+def bulk_validate_phones(values):
+    """
+    Validate a whole column of phone numbers (e.g. from a CSV import).
+    
+    Vectorized counterpart of is_valid_phone(); missing and empty values
+    are valid.
+    
+    Args:
+        values: pandas Series, or any iterable of strings
+    
+    Returns:
+        Boolean Series for a Series input, otherwise a list of bools
+    """
+    if pd is not None and isinstance(values, pd.Series):
+        filled = values.fillna('').astype(str)
+        cleaned = filled.str.translate(_PHONE_STRIP)
+        return (cleaned.str.isdigit() & cleaned.str.len().between(7, 15)) | (filled == '')
+    return [is_valid_phone(value) for value in values]
+
+
 def is_valid_decimal(value: str, min_value: float = None, max_value: float = None) -> bool:
     """
     Validate a decimal/currency value.
@@ -82,13 +156,22 @@ def is_valid_decimal(value: str, min_value: float = None, max_value: float = Non
     Returns:
         True if valid decimal within range, False otherwise
     """
+    if min_value is None and max_value is None:
+        # Only the format matters: float() accepts the same numeric strings
+        # and is much cheaper than building a Decimal
+        try:
+            float(value)
+            return True
+        except ValueError:
+            return False
+    
     try:
         decimal_value = Decimal(value)
         
-        if min_value is not None and decimal_value < Decimal(str(min_value)):
+        if min_value is not None and decimal_value < _bound_decimal(min_value):
             return False
         
-        if max_value is not None and decimal_value > Decimal(str(max_value)):
+        if max_value is not None and decimal_value > _bound_decimal(max_value):
             return False
         
         return True
@@ -96,6 +179,12 @@ def is_valid_decimal(value: str, min_value: float = None, max_value: float = Non
         return False
 
 
+@lru_cache(maxsize=256)
+def _bound_decimal(bound: float) -> Decimal:
+    """Decimal form of a validator bound (the same few bounds recur)."""
+    return Decimal(str(bound))
+
+
 def is_valid_integer(value: str, min_value: int = None, max_value: int = None) -> bool:
     """
     Validate an integer value.
@@ -132,7 +221,7 @@ def is_not_empty(value: str) -> bool:
     Returns:
         True if value contains non-whitespace characters
     """
-    return bool(value and value.strip())
+    return not _is_blank(value)
 
 
 # =============================================================================
@@ -161,19 +250,68 @@ def format_currency(
         >>> format_currency(1234.5, '€')
         '€1,234.50'
     """
+    # Numbers (int/float/Decimal) format directly with a thousands separator;
+    # Decimal keeps its exact value. Only strings need parsing.
+    if isinstance(amount, (int, float, Decimal)):
+        return f"{symbol}{amount:,.{decimal_places}f}"
     try:
-        if isinstance(amount, str):
-            amount = Decimal(amount)
-        elif isinstance(amount, (int, float)):
-            amount = Decimal(str(amount))
-        
-        # Format with thousands separator and decimal places
-        formatted = f"{float(amount):,.{decimal_places}f}"
-        return f"{symbol}{formatted}"
+        return f"{symbol}{Decimal(amount):,.{decimal_places}f}"
     except (InvalidOperation, ValueError):
         return f"{symbol}0.00"
 
 
+@lru_cache(maxsize=None)
+def make_currency_formatter(symbol: str = 'Rs. ', decimal_places: int = 2):
+    """
+    Return a one-argument format_currency() specialised for symbol/places.
+    
+    The format spec is built once, so table loops that bind the result skip
+    the per-call keyword defaults and spec construction. Output is identical
+    to format_currency(amount, symbol, decimal_places).
+    
+    Example:
+        >>> format_usd = make_currency_formatter('$')
+        >>> format_usd(1234.5)
+        '$1,234.50'
+    """
+    spec = f",.{decimal_places}f"
+    fallback = f"{symbol}0.00"
+    numeric = (int, float, Decimal)
+    
+    def format_amount(amount: Union[Decimal, float, int, str]) -> str:
+        if isinstance(amount, numeric):
+            return symbol + format(amount, spec)
+        try:
+            return symbol + format(Decimal(amount), spec)
+        except (InvalidOperation, ValueError):
+            return fallback
+    
+    return format_amount
+
+
+# format_currency() with the default 'Rs. ' symbol and 2 places
+format_rs = make_currency_formatter()
+
+
+def _is_iso_shape(value: str, length: int) -> bool:
+    """
+    True if value is laid out as 'YYYY-MM-DD' (length 10) or
+    'YYYY-MM-DD HH:MM:SS' (length 19) in ASCII. For these strings the C
+    fromisoformat() parses exactly what strptime() with that format would,
+    so the date helpers can skip strptime.
+    """
+    # Years below 1000 are left to strptime: strftime('%Y') does not pad them
+    if len(value) != length or not value.isascii() or value[0] == '0':
+        return False
+    if length == 10:
+        return value[4] == value[7] == '-' and value.replace('-', '').isdigit()
+    return (
+        value[4] == value[7] == '-' and value[10] == ' ' and value[13] == value[16] == ':'
+        and value[:10].replace('-', '').isdigit()
+        and value[11:].replace(':', '').isdigit()
+    )
+
+
 def format_date(
     value: Union[date, datetime, str],
     format_str: str = '%Y-%m-%d'
@@ -195,10 +333,20 @@ def format_date(
         '15/01/2024'
     """
     if isinstance(value, str):
-        try:
-            value = datetime.strptime(value, '%Y-%m-%d').date()
-        except ValueError:
-            return value
+        if _is_iso_shape(value, 10):
+            if format_str == '%Y-%m-%d':
+                # Already in the output format (or unparseable, which is
+                # returned unchanged anyway)
+                return value
+            try:
+                value = date.fromisoformat(value)
+            except ValueError:
+                return value
+        else:
+            try:
+                value = datetime.strptime(value, '%Y-%m-%d').date()
+            except ValueError:
+                return value
     
     if isinstance(value, datetime):
         value = value.date()
@@ -224,10 +372,18 @@ def format_datetime(
         Formatted datetime string
     """
     if isinstance(value, str):
-        try:
-            value = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-        except ValueError:
-            return value
+        if _is_iso_shape(value, 19):
+            if format_str == '%Y-%m-%d %H:%M:%S':
+                return value
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return value
+        else:
+            try:
+                value = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+            except ValueError:
+                return value
     
     if isinstance(value, datetime):
         return value.strftime(format_str)
@@ -280,6 +436,9 @@ def format_quantity(value: int, singular: str = 'item', plural: str = None) -> s
         plural = singular + 's'
     
     label = singular if value == 1 else plural
+    if type(value) is int and -1000 < value < 1000:
+        # No thousands separator possible; skip the ',' format spec
+        return f"{value} {label}"
     return f"{value:,} {label}"
 
 
@@ -315,12 +474,16 @@ def parse_currency(value: str) -> Optional[Decimal]:
     Returns:
         Decimal value or None if parsing fails
     """
-    if not value:
+    if _is_blank(value):
         return None
     
+    # Remove currency symbols and thousands separators
+    cleaned = _CURRENCY_CLEAN_RE.sub('', value)
+    if cleaned.isdecimal() and len(cleaned) < 19:
+        # Whole amount ('1,234', 'Rs. 42'): int() is far cheaper than
+        # Decimal's string parser and gives the same value
+        return Decimal(int(cleaned))
     try:
-        # Remove currency symbols and thousands separators
-        cleaned = re.sub(r'[^\d.-]', '', value)
         return Decimal(cleaned)
     except InvalidOperation:
         return None
@@ -336,12 +499,12 @@ def parse_integer(value: str) -> Optional[int]:
     Returns:
         Integer value or None if parsing fails
     """
-    if not value:
+    if _is_blank(value):
         return None
     
     try:
         # Remove any non-digit characters except minus sign
-        cleaned = re.sub(r'[^\d-]', '', value)
+        cleaned = _INT_CLEAN_RE.sub('', value)
         return int(cleaned)
     except ValueError:
         return None
@@ -351,6 +514,8 @@ def parse_integer(value: str) -> Optional[int]:
 # ID GENERATION HELPERS
 # =============================================================================
 
+# IDs repeat across table refreshes, so both helpers are memoized
+@lru_cache(maxsize=4096)
 def generate_id(prefix: str, number: int, width: int = 3) -> str:
     """
     Generate a formatted ID string.
@@ -372,6 +537,7 @@ def generate_id(prefix: str, number: int, width: int = 3) -> str:
     return f"{prefix}{number:0{width}d}"
 
 
+@lru_cache(maxsize=4096)
 def parse_id_number(id_string: str, prefix: str) -> Optional[int]:
     """
     Extract the numeric part from an ID string.
@@ -514,7 +680,10 @@ class ValidationResult:
 # ERROR REPORTING FUNCTIONS
 # =============================================================================
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import traceback
 import os
 from pathlib import Path
@@ -524,15 +693,54 @@ LOG_DIR = Path(__file__).parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 LOG_FILE = LOG_DIR / "app_errors.log"
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
-    ]
+
+class _BatchFileHandler(logging.FileHandler):
+    """FileHandler that leaves flushing to _LogBuffer (one flush per batch)."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        # StreamHandler.emit without the flush after every record
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _LogBuffer(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes its target file once per batch."""
+    
+    def flush(self) -> None:
+        with self.lock:
+            super().flush()
+            if self.target is not None:
+                self.target.flush()
+
+
+# log_*() calls only enqueue the record; a listener thread does the file
+# writes, so the UI thread never blocks on disk I/O. Records are written in
+# batches of up to 512 (ERROR and above flush at once, so crash details
+# reach the file). At exit the listener drains the queue first, then the
+# buffer is flushed (atexit runs in reverse order).
+_file_handler = _BatchFileHandler(LOG_FILE, encoding='utf-8')
+_file_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+)
+_log_buffer = _LogBuffer(512, flushLevel=logging.ERROR, target=_file_handler)
+_log_queue: 'queue.SimpleQueue[logging.LogRecord]' = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_buffer, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_buffer.flush)
+atexit.register(_log_listener.stop)
 
 _logger = logging.getLogger("MobileAccessoryInventory")
+_logger.setLevel(logging.DEBUG)
+_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_logger.propagate = False
 
 
 def log_info(message: str) -> None:
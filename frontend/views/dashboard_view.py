@@ -33,12 +33,15 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont
-from decimal import Decimal
+import asyncio
 
+import db
 from repositories.employee_repository import Employee
 from repositories.sale_repository import SaleRepository
 from repositories.inventory_repository import InventoryRepository
 from repositories.product_repository import ProductRepository
+from repositories.customer_repository import CustomerRepository
+from repositories.field_mapper import from_cents
 from utils import format_currency, format_date
 from error_reporter import report_error
 
@@ -444,34 +447,50 @@ class DashboardView(QWidget):
         """Refresh all dashboard data from the database."""
         
         try:
+            # Independent queries run concurrently, each on a pooled connection
+            (recent_sales, low_stock_items, products,
+             today_sales, customers) = asyncio.run(self._fetch_dashboard_data())
+            
             # Load recent sales
-            self._load_recent_sales()
+            self._load_recent_sales(recent_sales)
             
             # Load low stock items
-            self._load_low_stock_items()
+            self._load_low_stock_items(low_stock_items)
             
             # Load statistics
-            self._load_statistics()
+            self._load_statistics(products, today_sales, customers)
         
         except Exception as e:
             report_error("Dashboard Data Load Error", e, self)
     
-    def _load_recent_sales(self):
+    async def _fetch_dashboard_data(self):
+        """
+        Fetch all dashboard data concurrently.
+        
+        A failed query comes back as its exception (return_exceptions=True)
+        so the other panels still load; each _load_* method reports it.
+        """
+        return await asyncio.gather(
+            # Recent sales (limit to 10) with their line items in one call
+            db.run_pooled(lambda: SaleRepository.attach_details(SaleRepository.get_all(10))),
+            db.run_pooled(InventoryRepository.get_low_stock_items),
+            db.run_pooled(ProductRepository.get_all),
+            db.run_pooled(SaleRepository.get_today_sales),
+            # Customer count (exclude walk-in)
+            db.run_pooled(CustomerRepository.get_all, include_walkin=False),
+            return_exceptions=True
+        )
+    
+    def _load_recent_sales(self, sales):
         """Load the most recent sales into the table."""
         
         try:
-            # Get recent sales (limit to 10)
-            sales = SaleRepository.get_all()[:10]
+            if isinstance(sales, Exception):
+                raise sales
             
             self.recent_sales_table.setRowCount(len(sales))
             
             for row, sale in enumerate(sales):
-                # Load full sale details if not already loaded
-                if not sale.details:
-                    full_sale = SaleRepository.get_by_id(sale.invoice_no)
-                    if full_sale:
-                        sale = full_sale
-                
                 # Date
                 date_item = QTableWidgetItem(
                     format_date(sale.sale_date) if sale.sale_date else ""
@@ -498,12 +517,12 @@ class DashboardView(QWidget):
         except Exception as e:
             print(f"Error loading recent sales: {e}")
     
-    def _load_low_stock_items(self):
+    def _load_low_stock_items(self, low_stock_items):
         """Load low stock items into the table."""
         
         try:
-            # Get low stock items
-            low_stock_items = InventoryRepository.get_low_stock_items()
+            if isinstance(low_stock_items, Exception):
+                raise low_stock_items
             
             self.low_stock_table.setRowCount(len(low_stock_items))
             self.low_stock_count = len(low_stock_items)
@@ -532,33 +551,25 @@ class DashboardView(QWidget):
         except Exception as e:
             print(f"Error loading low stock items: {e}")
     
-    def _load_statistics(self):
+    def _load_statistics(self, products, today_sales, customers):
         """Load dashboard statistics."""
         
         try:
-            # Get total products count
-            products = ProductRepository.get_all()
-            self.products_card.set_value(str(len(products)))
+            for result in (products, today_sales, customers):
+                if isinstance(result, Exception):
+                    raise result
             
-            # Get today's sales total
-            from datetime import date
-            today = date.today()
-            sales = SaleRepository.get_all()
+            # Total products count
+            self.products_card.set_value(str(len(products)))
             
-            # Calculate today's sales total
-            today_total = Decimal('0')
-            for s in sales:
-                if s.sale_date:
-                    # sale_date is already a date object, no need to call .date()
-                    sale_date = s.sale_date if isinstance(s.sale_date, date) else s.sale_date.date()
-                    if sale_date == today:
-                        today_total += (s.net_amount or s.total_amount or 0)
+            # Today's sales total
+            today_cents = 0
+            for s in today_sales:
+                today_cents += (s.net_amount_cents or s.total_amount_cents or 0)
             
-            self.today_sales_card.set_value(format_currency(today_total))
+            self.today_sales_card.set_value(format_currency(from_cents(today_cents)))
             
-            # Customer count (exclude walk-in if needed)
-            from repositories.customer_repository import CustomerRepository
-            customers = CustomerRepository.get_all(include_walkin=False)
+            # Customer count (walk-in excluded)
             self.customers_card.set_value(str(len(customers)))
         
         except Exception as e:
@@ -37,6 +37,7 @@ from decimal import Decimal
 from datetime import date
 
 from repositories.product_repository import ProductRepository, Product
+from repositories.field_mapper import to_cents
 from repositories.category_repository import CategoryRepository
 from repositories.subcategory_repository import SubcategoryRepository
 from repositories.supplier_repository import SupplierRepository
@@ -617,10 +618,8 @@ class ProductFormView(QWidget):
         
         if reply == QMessageBox.Yes:
             try:
-                # First delete all subcategories under this category
-                SubcategoryRepository.delete_by_category(cat_id)
-                # Then delete the category
-                success, message = CategoryRepository.delete(cat_id)
+                # Subcategories and category are deleted in one transaction
+                success, message = CategoryRepository.delete_cascade(cat_id)
                 if success:
                     QMessageBox.information(self, "Success", "Category and its subcategories deleted successfully.")
                     # Reload dropdowns
@@ -959,8 +958,8 @@ class ProductFormView(QWidget):
                 subcat_id=self.subcategory_combo.currentData(),
                 brand=self.brand_combo.currentText().strip() or None,
                 description=self.description_input.toPlainText().strip() or None,
-                cost_price=cost_price,
-                retail_price=retail_price,
+                cost_price_cents=to_cents(cost_price),
+                retail_price_cents=to_cents(retail_price),
                 min_stock_level=self.min_stock_input.value(),
                 date_added=purchase_date
             )
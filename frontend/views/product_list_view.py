@@ -28,7 +28,7 @@ from PySide6.QtGui import QFont, QKeySequence, QShortcut
 from repositories.product_repository import ProductRepository, Product
 from repositories.category_repository import CategoryRepository
 from repositories.subcategory_repository import SubcategoryRepository
-from utils import format_currency
+from utils import format_rs
 
 
 class ProductListView(QWidget):
@@ -449,7 +449,7 @@ class ProductListView(QWidget):
             
             # Price
             price_item = QTableWidgetItem(
-                format_currency(product.retail_price) if product.retail_price else "Rs. 0.00"
+                format_rs(product.retail_price) if product.retail_price else "Rs. 0.00"
             )
             price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
             self.product_table.setItem(row, 6, price_item)
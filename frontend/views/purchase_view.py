@@ -27,6 +27,8 @@ from decimal import Decimal
 from datetime import date, datetime, timedelta
 from typing import List, Optional
 
+import pyodbc
+
 from repositories.purchase_repository import PurchaseRepository, Purchase
 
 
@@ -200,7 +202,15 @@ class PurchaseDetailDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            success, message = PurchaseRepository.mark_as_received(self.purchase.purchase_no)
+            try:
+                success, message = PurchaseRepository.mark_as_received(self.purchase.purchase_no)
+            except pyodbc.Error as e:
+                QMessageBox.critical(
+                    self, "Error",
+                    f"Failed to mark order as received: {str(e)}",
+                    QMessageBox.Ok
+                )
+                return
             
             if success:
                 QMessageBox.information(self, "Success", message)
@@ -223,7 +233,15 @@ class PurchaseDetailDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            success, message = PurchaseRepository.cancel_purchase(self.purchase.purchase_no)
+            try:
+                success, message = PurchaseRepository.cancel_purchase(self.purchase.purchase_no)
+            except pyodbc.Error as e:
+                QMessageBox.critical(
+                    self, "Error",
+                    f"Failed to cancel order: {str(e)}",
+                    QMessageBox.Ok
+                )
+                return
             
             if success:
                 QMessageBox.information(self, "Success", message)
@@ -449,7 +449,7 @@ class ReportView(QWidget):
         try:
             start_date, end_date = self._get_date_range()
             
-            # Get sales report summary (includes profit calculation)
+            # Get sales report (summary with profit, top products, category sales)
             summary = SaleRepository.get_sales_report(start_date, end_date)
             
             # Update summary cards
@@ -480,13 +480,9 @@ class ReportView(QWidget):
             else:
                 self.margin_label.setText("📈 Profit Margin: N/A (No sales)")
             
-            # Get top selling products
-            top_products = SaleRepository.get_top_selling_products(10, start_date, end_date)
-            self._populate_top_products(top_products)
-            
-            # Get sales by category
-            category_sales = SaleRepository.get_sales_by_category(start_date, end_date)
-            self._populate_category_sales(category_sales)
+            # Top selling products and category sales come with the report
+            self._populate_top_products(summary['top_products'])
+            self._populate_category_sales(summary['category_sales'])
             
             # Update date range display in cards
             date_range_text = f"From {start_date} to {end_date}"
@@ -47,7 +47,7 @@ from repositories.customer_repository import CustomerRepository
 from repositories.inventory_repository import InventoryRepository
 from repositories.sale_repository import SaleRepository
 from repositories.employee_repository import Employee
-from utils import format_currency
+from utils import format_currency, format_rs
 
 
 class ReceiptDialog(QDialog):
@@ -594,11 +594,11 @@ class CheckoutDialog(QDialog):
                 qty_item.setTextAlignment(Qt.AlignCenter)
                 tbl.setItem(r, 1, qty_item)
                 # Price
-                price_item = QTableWidgetItem(format_currency(item.unit_price))
+                price_item = QTableWidgetItem(format_rs(item.unit_price))
                 price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
                 tbl.setItem(r, 2, price_item)
                 # Total
-                total_item = QTableWidgetItem(format_currency(item.total_price))
+                total_item = QTableWidgetItem(format_rs(item.total_price))
                 total_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
                 tbl.setItem(r, 3, total_item)
                 tbl.setRowHeight(r, 30)
@@ -1710,7 +1710,7 @@ class SalePOSView(QWidget):
             self.cart_table.setItem(row, 0, name_item)
             
             # Unit price
-            price_item = QTableWidgetItem(format_currency(item.unit_price))
+            price_item = QTableWidgetItem(format_rs(item.unit_price))
             price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
             self.cart_table.setItem(row, 1, price_item)
             
@@ -1720,7 +1720,7 @@ class SalePOSView(QWidget):
             self.cart_table.setItem(row, 2, qty_item)
             
             # Total
-            total_item = QTableWidgetItem(format_currency(item.total_price))
+            total_item = QTableWidgetItem(format_rs(item.total_price))
             total_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
             self.cart_table.setItem(row, 3, total_item)
             
@@ -28,7 +28,7 @@ from typing import List, Optional
 
 from repositories.sale_repository import SaleRepository, Sale
 from repositories.employee_repository import EmployeeRepository
-from utils import format_currency
+from utils import format_currency, format_rs
 
 
 class SaleDetailDialog(QDialog):
@@ -106,11 +106,11 @@ class SaleDetailDialog(QDialog):
                 qty_item.setTextAlignment(Qt.AlignCenter)
                 self.items_table.setItem(row, 2, qty_item)
                 
-                price_item = QTableWidgetItem(format_currency(detail.unit_price))
+                price_item = QTableWidgetItem(format_rs(detail.unit_price))
                 price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
                 self.items_table.setItem(row, 3, price_item)
                 
-                total_item = QTableWidgetItem(format_currency(detail.line_total))
+                total_item = QTableWidgetItem(format_rs(detail.line_total))
                 total_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
                 self.items_table.setItem(row, 4, total_item)
         
@@ -469,13 +469,12 @@ class SaleView(QWidget):
         try:
             start_date, end_date = self._get_date_range()
             
-            # Get sales for the date range
-            sales = SaleRepository.get_by_date_range(start_date, end_date)
-            
-            # Filter by employee if selected
+            # Stream sales for the date range, filtering by employee if selected
             selected_employee_id = self.employee_combo.currentData()
-            if selected_employee_id:
-                sales = [s for s in sales if s.employee_id == selected_employee_id]
+            sales = [
+                s for s in SaleRepository.iter_by_date_range(start_date, end_date)
+                if not selected_employee_id or s.employee_id == selected_employee_id
+            ]
             
             # Update table
             self._populate_table(sales)
@@ -520,7 +519,7 @@ class SaleView(QWidget):
             self.sales_table.setItem(row, 4, QTableWidgetItem(sale.employee_name or sale.employee_id))
             
             # Amount
-            amount_item = QTableWidgetItem(format_currency(sale.net_amount))
+            amount_item = QTableWidgetItem(format_rs(sale.net_amount))
             amount_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
             amount_item.setForeground(QColor("#4CAF50"))
             self.sales_table.setItem(row, 5, amount_item)
@@ -550,9 +549,9 @@ class SaleView(QWidget):
     def _update_summary(self, sales: List[Sale]):
         """Update the summary cards."""
         total_sales = len(sales)
-        total_revenue = sum(float(s.total_amount) for s in sales)
-        total_discount = sum(float(s.discount) for s in sales)
-        net_revenue = sum(float(s.net_amount) for s in sales)
+        total_revenue = sum(s.total_amount_cents for s in sales) / 100
+        total_discount = sum(s.discount_cents for s in sales) / 100
+        net_revenue = sum(s.net_amount_cents for s in sales) / 100
         
         # Update card values
         self.sales_count_card.findChild(QLabel, "value_label").setText(str(total_sales))
@@ -23,6 +23,12 @@ GO
 CREATE DATABASE MobileAccessoryInventory;
 GO
 
+-- Readers see the last committed row version instead of waiting on writers'
+-- locks (lists and dropdowns never block behind a purchase or sale being
+-- saved). Procedures that must serialize use explicit UPDLOCK/HOLDLOCK hints.
+ALTER DATABASE MobileAccessoryInventory SET READ_COMMITTED_SNAPSHOT ON;
+GO
+
 USE MobileAccessoryInventory;
 GO
 
@@ -82,7 +88,7 @@ GO
 
 -- SUPPLIER: Vendors we purchase from
 CREATE TABLE dbo.SUPPLIER (
-    Supplier_ID     NVARCHAR(10)    NOT NULL PRIMARY KEY,
+    Supplier_ID     NVARCHAR(10)    NOT NULL CONSTRAINT PK_SUPPLIER PRIMARY KEY,
     Supplier_Name   NVARCHAR(100)   NOT NULL,
     Contact_Person  NVARCHAR(100)   NULL,
     Phone           NVARCHAR(20)    NULL,
@@ -117,6 +123,16 @@ CREATE TABLE dbo.PURCHASE_DETAIL (
 );
 GO
 
+-- SUPPLIER_STATS: Per-supplier purchase totals, kept current by the
+-- trg_PURCHASE_SupplierStats trigger (see stored_procedures.sql)
+CREATE TABLE dbo.SUPPLIER_STATS (
+    Supplier_ID             NVARCHAR(10)    NOT NULL PRIMARY KEY,
+    Total_Purchases         INT             NOT NULL DEFAULT 0,
+    Total_Purchase_Value    DECIMAL(12,2)   NOT NULL DEFAULT 0,
+    CONSTRAINT FK_SUPPLIERSTATS_SUPPLIER FOREIGN KEY (Supplier_ID) REFERENCES dbo.SUPPLIER(Supplier_ID)
+);
+GO
+
 -- EMPLOYEE: Store staff with login credentials
 CREATE TABLE dbo.EMPLOYEE (
     Employee_ID     NVARCHAR(10)    NOT NULL PRIMARY KEY,
@@ -127,7 +143,7 @@ CREATE TABLE dbo.EMPLOYEE (
     Hire_Date       DATE            NOT NULL DEFAULT GETDATE(),
     Salary          DECIMAL(10,2)   NULL CHECK (Salary IS NULL OR Salary >= 0),
     Username        NVARCHAR(50)    NULL,
-    password_hash   NVARCHAR(200)   NULL,
+    password_hash   VARCHAR(200)    NULL,
     role            NVARCHAR(30)    NOT NULL DEFAULT 'Employee'
 );
 GO
@@ -190,8 +206,28 @@ CREATE NONCLUSTERED INDEX IX_PRODUCT_SubcatID ON dbo.PRODUCT(Subcat_ID);
 CREATE NONCLUSTERED INDEX IX_INVENTORY_CurrentStock ON dbo.INVENTORY(Current_Stock);
 CREATE NONCLUSTERED INDEX IX_SALE_SaleDate ON dbo.SALE(Sale_Date);
 CREATE NONCLUSTERED INDEX IX_PURCHASE_SupplierID ON dbo.PURCHASE(Supplier_ID);
+-- Covers usp_SearchSuppliers' LIKE fallback (narrow scan instead of the
+-- table); Supplier_ID is the clustered key and is carried along
+CREATE NONCLUSTERED INDEX IX_SUPPLIER_Search ON dbo.SUPPLIER(Supplier_Name, City) INCLUDE (Contact_Person, Phone, Email, Address);
 CREATE NONCLUSTERED INDEX IX_SALE_EmployeeID ON dbo.SALE(Employee_ID);
+-- One account per username (employees without a login keep Username NULL);
+-- usp_AddEmployee relies on it instead of checking first
+CREATE UNIQUE NONCLUSTERED INDEX UX_EMPLOYEE_Username ON dbo.EMPLOYEE(Username) WHERE Username IS NOT NULL;
 CREATE NONCLUSTERED INDEX IX_SALE_CustomerID ON dbo.SALE(Customer_ID);
+-- Covers the per-product aggregations (top sellers, sales by category);
+-- Invoice_No comes along as part of the clustered key
+CREATE NONCLUSTERED INDEX IX_SaleDetail_Product ON dbo.SALE_DETAIL(Product_Code) INCLUDE (Quantity, Line_Total);
+GO
+
+-- Full-text index for usp_SearchSuppliers word searches. Skipped when the
+-- Full-Text Search feature is not installed; the procedure then falls back
+-- to LIKE prefix matching.
+IF FULLTEXTSERVICEPROPERTY('IsFullTextInstalled') = 1
+BEGIN
+    EXEC('CREATE FULLTEXT CATALOG ftSupplier;');
+    EXEC('CREATE FULLTEXT INDEX ON dbo.SUPPLIER(Supplier_Name, Contact_Person, City)
+          KEY INDEX PK_SUPPLIER ON ftSupplier;');
+END;
 GO
 
 -- ============================================================================
@@ -204,13 +240,55 @@ CREATE TYPE dbo.PurchaseDetailType AS TABLE (
 );
 GO
 
+-- Keyed on Product_Code: one row per product (matches PK_SALE_DETAIL) and
+-- lets usp_CreateSale's inventory join seek instead of scan
 CREATE TYPE dbo.SaleDetailType AS TABLE (
-    Product_Code    NVARCHAR(20)    NOT NULL,
+    Product_Code    NVARCHAR(20)    NOT NULL PRIMARY KEY,
     Quantity        INT             NOT NULL,
     Unit_Price      DECIMAL(10,2)   NOT NULL
 );
 GO
 
+-- Bulk sale import (usp_CreateSalesBulk): one row per invoice, and its
+-- line items keyed by (Invoice_No, Product_Code) like SALE_DETAIL
+CREATE TYPE dbo.SaleHeaderType AS TABLE (
+    Invoice_No      NVARCHAR(20)    NOT NULL PRIMARY KEY,
+    Customer_ID     NVARCHAR(10)    NOT NULL,
+    Employee_ID     NVARCHAR(10)    NOT NULL,
+    Sale_Date       DATE            NULL,
+    Sale_Time       TIME            NULL,
+    Discount        DECIMAL(10,2)   NOT NULL
+);
+GO
+
+CREATE TYPE dbo.SaleLineType AS TABLE (
+    Invoice_No      NVARCHAR(20)    NOT NULL,
+    Product_Code    NVARCHAR(20)    NOT NULL,
+    Quantity        INT             NOT NULL,
+    Unit_Price      DECIMAL(10,2)   NOT NULL,
+    PRIMARY KEY (Invoice_No, Product_Code)
+);
+GO
+
+-- Bulk supplier import (usp_AddSuppliersBulk); same columns as SUPPLIER
+CREATE TYPE dbo.SupplierType AS TABLE (
+    Supplier_ID     NVARCHAR(10)    NOT NULL PRIMARY KEY,
+    Supplier_Name   NVARCHAR(100)   NOT NULL,
+    Contact_Person  NVARCHAR(100)   NULL,
+    Phone           NVARCHAR(20)    NULL,
+    Email           NVARCHAR(100)   NULL,
+    Address         NVARCHAR(200)   NULL,
+    City            NVARCHAR(50)    NULL
+);
+GO
+
+-- Generic list of keys (purchase numbers, invoice numbers, product codes)
+-- for "fetch many by key" procedures
+CREATE TYPE dbo.CodeListType AS TABLE (
+    Code            NVARCHAR(20)    NOT NULL PRIMARY KEY
+);
+GO
+
 -- ============================================================================
 -- SAMPLE DATA
 -- ============================================================================
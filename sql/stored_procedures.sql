@@ -155,8 +155,13 @@ CREATE PROCEDURE usp_AddSubcategory
 AS
 BEGIN
     SET NOCOUNT ON;
+    -- Return codes: 0 = created, 1 = ID already exists, 2 = category not found
+    IF EXISTS (SELECT 1 FROM SUBCATEGORY WHERE Subcat_ID = @SubcatId) RETURN 1;
+    IF NOT EXISTS (SELECT 1 FROM CATEGORY WHERE Cat_ID = @CatId) RETURN 2;
+    
     INSERT INTO SUBCATEGORY (Subcat_ID, Cat_ID, Subcat_Name, Description)
     VALUES (@SubcatId, @CatId, @SubcatName, @Description);
+    RETURN 0;
 END;
 GO
 
@@ -176,6 +181,21 @@ BEGIN
 END;
 GO
 
+IF OBJECT_ID('usp_UpdateSubcategoryName', 'P') IS NOT NULL DROP PROCEDURE usp_UpdateSubcategoryName;
+GO
+CREATE PROCEDURE usp_UpdateSubcategoryName
+    @SubcatId NVARCHAR(10),
+    @SubcatName NVARCHAR(50)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    -- Return codes: 0 = updated, 1 = subcategory not found
+    UPDATE SUBCATEGORY SET Subcat_Name = @SubcatName WHERE Subcat_ID = @SubcatId;
+    IF @@ROWCOUNT = 0 RETURN 1;
+    RETURN 0;
+END;
+GO
+
 IF OBJECT_ID('usp_DeleteSubcategory', 'P') IS NOT NULL DROP PROCEDURE usp_DeleteSubcategory;
 GO
 CREATE PROCEDURE usp_DeleteSubcategory
@@ -183,7 +203,12 @@ CREATE PROCEDURE usp_DeleteSubcategory
 AS
 BEGIN
     SET NOCOUNT ON;
+    -- Return codes: 0 = deleted, 1 = not found, 2 = has products
+    IF NOT EXISTS (SELECT 1 FROM SUBCATEGORY WHERE Subcat_ID = @SubcatId) RETURN 1;
+    IF EXISTS (SELECT 1 FROM PRODUCT WHERE Subcat_ID = @SubcatId) RETURN 2;
+    
     DELETE FROM SUBCATEGORY WHERE Subcat_ID = @SubcatId;
+    RETURN 0;
 END;
 GO
 
@@ -207,7 +232,40 @@ CREATE PROCEDURE usp_DeleteSubcategoriesByCategory
 AS
 BEGIN
     SET NOCOUNT ON;
+    -- Return codes: 0 = deleted (or none existed), 2 = some have products
+    IF EXISTS (
+        SELECT 1 FROM PRODUCT p
+        INNER JOIN SUBCATEGORY s ON p.Subcat_ID = s.Subcat_ID
+        WHERE s.Cat_ID = @CatId
+    ) RETURN 2;
+    
     DELETE FROM SUBCATEGORY WHERE Cat_ID = @CatId;
+    RETURN 0;
+END;
+GO
+
+IF OBJECT_ID('usp_DeleteCategoryCascade', 'P') IS NOT NULL DROP PROCEDURE usp_DeleteCategoryCascade;
+GO
+CREATE PROCEDURE usp_DeleteCategoryCascade
+    @CatId NVARCHAR(10)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+    -- Deletes a category and all of its subcategories in one transaction.
+    -- Return codes: 0 = deleted, 1 = category not found, 2 = some subcategory has products
+    IF NOT EXISTS (SELECT 1 FROM CATEGORY WHERE Cat_ID = @CatId) RETURN 1;
+    IF EXISTS (
+        SELECT 1 FROM PRODUCT p
+        INNER JOIN SUBCATEGORY s ON p.Subcat_ID = s.Subcat_ID
+        WHERE s.Cat_ID = @CatId
+    ) RETURN 2;
+    
+    BEGIN TRANSACTION;
+    DELETE FROM SUBCATEGORY WHERE Cat_ID = @CatId;
+    DELETE FROM CATEGORY WHERE Cat_ID = @CatId;
+    COMMIT TRANSACTION;
+    RETURN 0;
 END;
 GO
 
@@ -326,9 +384,12 @@ CREATE PROCEDURE usp_ListSuppliers
 AS
 BEGIN
     SET NOCOUNT ON;
-    SELECT Supplier_ID, Supplier_Name, Contact_Person, Phone, Email, Address, City
-    FROM SUPPLIER
-    ORDER BY Supplier_Name;
+    SELECT s.Supplier_ID, s.Supplier_Name, s.Contact_Person, s.Phone, s.Email, s.Address, s.City,
+           ISNULL(st.Total_Purchases, 0) AS Total_Purchases,
+           ISNULL(st.Total_Purchase_Value, 0) AS Total_Purchase_Value
+    FROM SUPPLIER s
+    LEFT JOIN SUPPLIER_STATS st ON st.Supplier_ID = s.Supplier_ID
+    ORDER BY s.Supplier_Name;
 END;
 GO
 
@@ -339,9 +400,12 @@ CREATE PROCEDURE usp_GetSupplierById
 AS
 BEGIN
     SET NOCOUNT ON;
-    SELECT Supplier_ID, Supplier_Name, Contact_Person, Phone, Email, Address, City
-    FROM SUPPLIER
-    WHERE Supplier_ID = @SupplierId;
+    SELECT s.Supplier_ID, s.Supplier_Name, s.Contact_Person, s.Phone, s.Email, s.Address, s.City,
+           ISNULL(st.Total_Purchases, 0) AS Total_Purchases,
+           ISNULL(st.Total_Purchase_Value, 0) AS Total_Purchase_Value
+    FROM SUPPLIER s
+    LEFT JOIN SUPPLIER_STATS st ON st.Supplier_ID = s.Supplier_ID
+    WHERE s.Supplier_ID = @SupplierId;
 END;
 GO
 
@@ -363,6 +427,60 @@ BEGIN
 END;
 GO
 
+-- Insert many suppliers in one call (see SupplierRepository.create_bulk);
+-- all rows are inserted or, on any error, none
+IF OBJECT_ID('usp_AddSuppliersBulk', 'P') IS NOT NULL DROP PROCEDURE usp_AddSuppliersBulk;
+GO
+CREATE PROCEDURE usp_AddSuppliersBulk
+    @Suppliers dbo.SupplierType READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+    INSERT INTO SUPPLIER (Supplier_ID, Supplier_Name, Contact_Person, Phone, Email, Address, City)
+    SELECT Supplier_ID, Supplier_Name, Contact_Person, Phone, Email, Address, City
+    FROM @Suppliers;
+    SELECT @@ROWCOUNT AS Inserted;
+END;
+GO
+
+-- Supplier IDs are drawn from a sequence (like PaymentSeq), so IDs reserved
+-- in ranges by the application never collide with server-allocated ones.
+-- The sequence starts after any existing Supplier_ID.
+IF OBJECT_ID('dbo.SupplierIdSeq', 'SO') IS NULL
+BEGIN
+    DECLARE @SupplierSeqStart INT;
+    SELECT @SupplierSeqStart = ISNULL(MAX(CAST(SUBSTRING(Supplier_ID, 4, 10) AS INT)), 0) + 1
+    FROM SUPPLIER;
+    EXEC('CREATE SEQUENCE dbo.SupplierIdSeq AS INT START WITH '
+         + CAST(@SupplierSeqStart AS VARCHAR(10)) + ' INCREMENT BY 1 CACHE 50;');
+END;
+GO
+
+-- Allocate the next SUP### and insert in one call (see SupplierRepository.create_supplier)
+IF OBJECT_ID('usp_CreateSupplierAutoId', 'P') IS NOT NULL DROP PROCEDURE usp_CreateSupplierAutoId;
+GO
+CREATE PROCEDURE usp_CreateSupplierAutoId
+    @SupplierName NVARCHAR(100),
+    @ContactPerson NVARCHAR(100) = NULL,
+    @Phone NVARCHAR(20) = NULL,
+    @Email NVARCHAR(100) = NULL,
+    @Address NVARCHAR(200) = NULL,
+    @City NVARCHAR(50) = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    -- FORMAT 'D3' pads to at least 3 digits but never truncates (SUP1000),
+    -- same as the application's f"SUP{n:03d}" for reserved ranges
+    DECLARE @SupplierNo INT = NEXT VALUE FOR dbo.SupplierIdSeq;
+    DECLARE @SupplierId NVARCHAR(10) = 'SUP' + FORMAT(@SupplierNo, 'D3');
+    
+    INSERT INTO SUPPLIER (Supplier_ID, Supplier_Name, Contact_Person, Phone, Email, Address, City)
+    VALUES (@SupplierId, @SupplierName, @ContactPerson, @Phone, @Email, @Address, @City);
+    
+    SELECT @SupplierId AS NewId;
+END;
+GO
+
 IF OBJECT_ID('usp_UpdateSupplier', 'P') IS NOT NULL DROP PROCEDURE usp_UpdateSupplier;
 GO
 CREATE PROCEDURE usp_UpdateSupplier
@@ -390,6 +508,8 @@ CREATE PROCEDURE usp_DeleteSupplier
 AS
 BEGIN
     SET NOCOUNT ON;
+    -- Stats row is left at zero once all purchases are cancelled
+    DELETE FROM SUPPLIER_STATS WHERE Supplier_ID = @SupplierId AND Total_Purchases = 0;
     DELETE FROM SUPPLIER WHERE Supplier_ID = @SupplierId;
 END;
 GO
@@ -400,10 +520,30 @@ CREATE PROCEDURE usp_GetNextSupplierId
 AS
 BEGIN
     SET NOCOUNT ON;
-    DECLARE @NextNum INT;
-    SELECT @NextNum = ISNULL(MAX(CAST(SUBSTRING(Supplier_ID, 4, 10) AS INT)), 0) + 1
-    FROM SUPPLIER;
-    SELECT 'SUP' + RIGHT('000' + CAST(@NextNum AS VARCHAR), 3) AS NextId;
+    DECLARE @SupplierNo INT = NEXT VALUE FOR dbo.SupplierIdSeq;
+    SELECT 'SUP' + FORMAT(@SupplierNo, 'D3') AS NextId;  -- SUP001 .. SUP999, SUP1000
+END;
+GO
+
+-- Supplier IDs are handed out by the application from ranges reserved here
+-- (see SupplierRepository.get_next_id)
+IF OBJECT_ID('usp_ReserveSupplierIdRange', 'P') IS NOT NULL DROP PROCEDURE usp_ReserveSupplierIdRange;
+GO
+CREATE PROCEDURE usp_ReserveSupplierIdRange
+    @Count INT
+AS
+BEGIN
+    SET NOCOUNT ON;
+    IF @Count IS NULL OR @Count < 1 RETURN;
+    
+    -- Reserve @Count consecutive numbers in one call
+    DECLARE @First SQL_VARIANT;
+    EXEC sys.sp_sequence_get_range
+        @sequence_name = N'dbo.SupplierIdSeq',
+        @range_size = @Count,
+        @range_first_value = @First OUTPUT;
+    
+    SELECT CAST(@First AS INT) AS FirstNo;
 END;
 GO
 
@@ -414,14 +554,97 @@ CREATE PROCEDURE usp_SearchSuppliers
 AS
 BEGIN
     SET NOCOUNT ON;
+    
+    -- Terms of 3+ characters use the full-text index when there is one:
+    -- any word in name/contact/city starting with the term. The CONTAINS
+    -- query is dynamic so the procedure still compiles without the index.
+    IF LEN(@SearchTerm) >= 3
+       AND OBJECTPROPERTY(OBJECT_ID('SUPPLIER'), 'TableHasActiveFulltextIndex') = 1
+    BEGIN
+        DECLARE @Words NVARCHAR(110) = N'"' + REPLACE(@SearchTerm, N'"', N'') + N'*"';
+        EXEC sp_executesql N'
+            SELECT s.Supplier_ID, s.Supplier_Name, s.Contact_Person, s.Phone, s.Email, s.Address, s.City,
+                   ISNULL(st.Total_Purchases, 0) AS Total_Purchases,
+                   ISNULL(st.Total_Purchase_Value, 0) AS Total_Purchase_Value
+            FROM SUPPLIER s
+            LEFT JOIN SUPPLIER_STATS st ON st.Supplier_ID = s.Supplier_ID
+            WHERE CONTAINS((s.Supplier_Name, s.Contact_Person, s.City), @Words)
+            ORDER BY s.Supplier_Name;',
+            N'@Words NVARCHAR(110)', @Words = @Words;
+        RETURN;
+    END;
+    
+    -- Short terms (or no full-text index): substring match on each column.
+    -- Not sargable; IX_SUPPLIER_Search covers the columns, so this scans
+    -- the narrow index rather than the table.
     DECLARE @Pattern NVARCHAR(102) = '%' + @SearchTerm + '%';
-    SELECT Supplier_ID, Supplier_Name, Contact_Person, Phone, Email, Address, City
-    FROM SUPPLIER
-    WHERE Supplier_Name LIKE @Pattern OR Contact_Person LIKE @Pattern OR City LIKE @Pattern
-    ORDER BY Supplier_Name;
+    SELECT s.Supplier_ID, s.Supplier_Name, s.Contact_Person, s.Phone, s.Email, s.Address, s.City,
+           ISNULL(st.Total_Purchases, 0) AS Total_Purchases,
+           ISNULL(st.Total_Purchase_Value, 0) AS Total_Purchase_Value
+    FROM SUPPLIER s
+    LEFT JOIN SUPPLIER_STATS st ON st.Supplier_ID = s.Supplier_ID
+    WHERE s.Supplier_Name LIKE @Pattern OR s.Contact_Person LIKE @Pattern OR s.City LIKE @Pattern
+    ORDER BY s.Supplier_Name;
+END;
+GO
+
+-- Purchase totals per supplier. The trigger applies each change to PURCHASE
+-- as a delta; usp_RefreshSupplierStats rebuilds the table from scratch.
+IF OBJECT_ID('trg_PURCHASE_SupplierStats', 'TR') IS NOT NULL DROP TRIGGER trg_PURCHASE_SupplierStats;
+GO
+CREATE TRIGGER trg_PURCHASE_SupplierStats
+ON PURCHASE
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+    MERGE SUPPLIER_STATS AS target
+    USING (
+        SELECT Supplier_ID, SUM(Cnt) AS Cnt, SUM(Amount) AS Amount
+        FROM (
+            SELECT Supplier_ID, 1 AS Cnt, Total_Amount AS Amount FROM inserted
+            UNION ALL
+            SELECT Supplier_ID, -1, -Total_Amount FROM deleted
+        ) d
+        GROUP BY Supplier_ID
+    ) AS delta
+    ON target.Supplier_ID = delta.Supplier_ID
+    WHEN MATCHED THEN
+        UPDATE SET Total_Purchases = target.Total_Purchases + delta.Cnt,
+                   Total_Purchase_Value = target.Total_Purchase_Value + delta.Amount
+    WHEN NOT MATCHED THEN
+        INSERT (Supplier_ID, Total_Purchases, Total_Purchase_Value)
+        VALUES (delta.Supplier_ID, delta.Cnt, delta.Amount);
 END;
 GO
 
+IF OBJECT_ID('usp_RefreshSupplierStats', 'P') IS NOT NULL DROP PROCEDURE usp_RefreshSupplierStats;
+GO
+CREATE PROCEDURE usp_RefreshSupplierStats
+AS
+BEGIN
+    SET NOCOUNT ON;
+    MERGE SUPPLIER_STATS AS target
+    USING (
+        SELECT Supplier_ID, COUNT(*) AS Cnt, SUM(Total_Amount) AS Amount
+        FROM PURCHASE
+        GROUP BY Supplier_ID
+    ) AS totals
+    ON target.Supplier_ID = totals.Supplier_ID
+    WHEN MATCHED THEN
+        UPDATE SET Total_Purchases = totals.Cnt, Total_Purchase_Value = totals.Amount
+    WHEN NOT MATCHED BY TARGET THEN
+        INSERT (Supplier_ID, Total_Purchases, Total_Purchase_Value)
+        VALUES (totals.Supplier_ID, totals.Cnt, totals.Amount)
+    WHEN NOT MATCHED BY SOURCE THEN
+        DELETE;
+END;
+GO
+
+-- Bring SUPPLIER_STATS in line with any purchases recorded before the trigger
+EXEC usp_RefreshSupplierStats;
+GO
+
 -- ============================================================================
 -- CUSTOMER PROCEDURES
 -- ============================================================================
@@ -566,13 +789,24 @@ CREATE PROCEDURE usp_AddEmployee
     @Position NVARCHAR(50) = NULL,
     @Salary DECIMAL(10,2) = NULL,
     @Username NVARCHAR(50) = NULL,
-    @PasswordHash NVARCHAR(200) = NULL,
+    @PasswordHash VARCHAR(200) = NULL,
     @Role NVARCHAR(30) = 'Employee'
 AS
 BEGIN
     SET NOCOUNT ON;
-    INSERT INTO EMPLOYEE (Employee_ID, Employee_Name, Phone, Email, Position, Hire_Date, Salary, Username, password_hash, role)
-    VALUES (@EmployeeId, @EmployeeName, @Phone, @Email, @Position, GETDATE(), @Salary, @Username, @PasswordHash, @Role);
+    -- Return codes: 0 = created, 1 = username taken, 2 = employee ID exists
+    -- (duplicates are caught by UX_EMPLOYEE_Username / the primary key, so
+    -- there is no separate existence check to race against)
+    BEGIN TRY
+        INSERT INTO EMPLOYEE (Employee_ID, Employee_Name, Phone, Email, Position, Hire_Date, Salary, Username, password_hash, role)
+        VALUES (@EmployeeId, @EmployeeName, @Phone, @Email, @Position, GETDATE(), @Salary, @Username, @PasswordHash, @Role);
+    END TRY
+    BEGIN CATCH
+        IF ERROR_NUMBER() = 2601 RETURN 1;  -- duplicate key in unique index
+        IF ERROR_NUMBER() = 2627 RETURN 2;  -- primary key violation
+        THROW;
+    END CATCH
+    RETURN 0;
 END;
 GO
 
@@ -625,7 +859,7 @@ IF OBJECT_ID('usp_AuthenticateEmployee', 'P') IS NOT NULL DROP PROCEDURE usp_Aut
 GO
 CREATE PROCEDURE usp_AuthenticateEmployee
     @Username NVARCHAR(50),
-    @PasswordHash NVARCHAR(200)
+    @PasswordHash VARCHAR(200)
 AS
 BEGIN
     SET NOCOUNT ON;
@@ -639,7 +873,7 @@ IF OBJECT_ID('usp_ChangeEmployeePassword', 'P') IS NOT NULL DROP PROCEDURE usp_C
 GO
 CREATE PROCEDURE usp_ChangeEmployeePassword
     @EmployeeId NVARCHAR(10),
-    @NewPasswordHash NVARCHAR(200)
+    @NewPasswordHash VARCHAR(200)
 AS
 BEGIN
     SET NOCOUNT ON;
@@ -727,6 +961,27 @@ BEGIN
 END;
 GO
 
+IF OBJECT_ID('usp_GetProductsByCodes', 'P') IS NOT NULL DROP PROCEDURE usp_GetProductsByCodes;
+GO
+CREATE PROCEDURE usp_GetProductsByCodes
+    @ProductCodes dbo.CodeListType READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SELECT 
+        p.Product_Code, p.Subcat_ID, p.Product_Name, p.Brand, 
+        p.Description, p.Cost_Price, p.Retail_Price, 
+        p.Min_Stock_Level, p.Date_Added,
+        s.Subcat_Name, c.Cat_ID, c.Cat_Name,
+        ISNULL(i.Current_Stock, 0) AS Current_Stock
+    FROM PRODUCT p
+    INNER JOIN @ProductCodes pc ON p.Product_Code = pc.Code
+    INNER JOIN SUBCATEGORY s ON p.Subcat_ID = s.Subcat_ID
+    INNER JOIN CATEGORY c ON s.Cat_ID = c.Cat_ID
+    LEFT JOIN INVENTORY i ON p.Product_Code = i.Product_Code;
+END;
+GO
+
 IF OBJECT_ID('usp_GetProductsByCategory', 'P') IS NOT NULL DROP PROCEDURE usp_GetProductsByCategory;
 GO
 CREATE PROCEDURE usp_GetProductsByCategory
@@ -777,10 +1032,15 @@ CREATE PROCEDURE usp_SearchProducts
     @SearchTerm NVARCHAR(100) = NULL,
     @CatId NVARCHAR(10) = NULL,
     @SubcatId NVARCHAR(10) = NULL,
-    @LowStockOnly BIT = 0
+    @LowStockOnly BIT = 0,
+    @Page INT = 1,
+    @PageSize INT = NULL
 AS
 BEGIN
     SET NOCOUNT ON;
+    DECLARE @Offset INT = (ISNULL(@Page, 1) - 1) * ISNULL(@PageSize, 0);
+    
+    -- Result set 1: requested page (all rows when @PageSize is NULL)
     SELECT 
         p.Product_Code, p.Subcat_ID, p.Product_Name, p.Brand, 
         p.Description, p.Cost_Price, p.Retail_Price, 
@@ -798,7 +1058,23 @@ BEGIN
       AND (@CatId IS NULL OR c.Cat_ID = @CatId)
       AND (@SubcatId IS NULL OR p.Subcat_ID = @SubcatId)
       AND (@LowStockOnly = 0 OR ISNULL(i.Current_Stock, 0) <= p.Min_Stock_Level)
-    ORDER BY p.Product_Name;
+    ORDER BY p.Product_Name
+    OFFSET @Offset ROWS
+    FETCH NEXT ISNULL(@PageSize, 2147483647) ROWS ONLY;
+    
+    -- Result set 2: total number of matches (for pagination)
+    SELECT COUNT(*) AS Total
+    FROM PRODUCT p
+    INNER JOIN SUBCATEGORY s ON p.Subcat_ID = s.Subcat_ID
+    INNER JOIN CATEGORY c ON s.Cat_ID = c.Cat_ID
+    LEFT JOIN INVENTORY i ON p.Product_Code = i.Product_Code
+    WHERE (@SearchTerm IS NULL OR 
+           p.Product_Code LIKE '%' + @SearchTerm + '%' OR
+           p.Product_Name LIKE '%' + @SearchTerm + '%' OR
+           p.Brand LIKE '%' + @SearchTerm + '%')
+      AND (@CatId IS NULL OR c.Cat_ID = @CatId)
+      AND (@SubcatId IS NULL OR p.Subcat_ID = @SubcatId)
+      AND (@LowStockOnly = 0 OR ISNULL(i.Current_Stock, 0) <= p.Min_Stock_Level);
 END;
 GO
 
@@ -824,6 +1100,23 @@ BEGIN
 END;
 GO
 
+IF OBJECT_ID('usp_GetStockColumns', 'P') IS NOT NULL DROP PROCEDURE usp_GetStockColumns;
+GO
+CREATE PROCEDURE usp_GetStockColumns
+AS
+BEGIN
+    SET NOCOUNT ON;
+    -- Narrow stock snapshot for client-side threshold checks
+    SELECT 
+        p.Product_Code,
+        ISNULL(i.Current_Stock, 0) AS Current_Stock,
+        p.Min_Stock_Level
+    FROM PRODUCT p
+    LEFT JOIN INVENTORY i ON p.Product_Code = i.Product_Code
+    ORDER BY p.Product_Code;
+END;
+GO
+
 IF OBJECT_ID('usp_AddProduct', 'P') IS NOT NULL DROP PROCEDURE usp_AddProduct;
 GO
 CREATE PROCEDURE usp_AddProduct
@@ -874,11 +1167,15 @@ CREATE PROCEDURE usp_UpdateProduct
 AS
 BEGIN
     SET NOCOUNT ON;
+    -- Return codes: 0 = updated, 1 = product not found
     UPDATE PRODUCT
     SET Subcat_ID = @SubcatId, Product_Name = @ProductName, Brand = @Brand,
         Description = @Description, Cost_Price = @CostPrice, 
         Retail_Price = @RetailPrice, Min_Stock_Level = @MinStockLevel
     WHERE Product_Code = @ProductCode;
+    
+    IF @@ROWCOUNT = 0 RETURN 1;
+    RETURN 0;
 END;
 GO
 
@@ -889,6 +1186,12 @@ CREATE PROCEDURE usp_DeleteProduct
 AS
 BEGIN
     SET NOCOUNT ON;
+    -- Return codes: 0 = deleted, 1 = not found,
+    --               2 = has purchase records, 3 = has sale records
+    IF NOT EXISTS (SELECT 1 FROM PRODUCT WHERE Product_Code = @ProductCode) RETURN 1;
+    IF EXISTS (SELECT 1 FROM PURCHASE_DETAIL WHERE Product_Code = @ProductCode) RETURN 2;
+    IF EXISTS (SELECT 1 FROM SALE_DETAIL WHERE Product_Code = @ProductCode) RETURN 3;
+    
     BEGIN TRY
         BEGIN TRANSACTION;
         DELETE FROM INVENTORY WHERE Product_Code = @ProductCode;
@@ -896,9 +1199,10 @@ BEGIN
         COMMIT TRANSACTION;
     END TRY
     BEGIN CATCH
-        ROLLBACK TRANSACTION;
+        IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;
         THROW;
     END CATCH
+    RETURN 0;
 END;
 GO
 
@@ -938,6 +1242,32 @@ BEGIN
 END;
 GO
 
+IF OBJECT_ID('usp_ListInventoryFiltered', 'P') IS NOT NULL DROP PROCEDURE usp_ListInventoryFiltered;
+GO
+CREATE PROCEDURE usp_ListInventoryFiltered
+    @CatId NVARCHAR(10) = NULL,
+    @Brand NVARCHAR(50) = NULL,
+    @LowStockOnly BIT = 0
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SELECT 
+        i.Product_Code, i.Current_Stock, i.Last_Updated,
+        p.Product_Name, p.Brand, p.Min_Stock_Level, 
+        p.Retail_Price, p.Cost_Price,
+        s.Subcat_Name, c.Cat_Name
+    FROM INVENTORY i
+    INNER JOIN PRODUCT p ON i.Product_Code = p.Product_Code
+    INNER JOIN SUBCATEGORY s ON p.Subcat_ID = s.Subcat_ID
+    INNER JOIN CATEGORY c ON s.Cat_ID = c.Cat_ID
+    WHERE (@CatId IS NULL OR c.Cat_ID = @CatId)
+      AND (@Brand IS NULL OR p.Brand = @Brand)
+      AND (@LowStockOnly = 0 OR i.Current_Stock <= p.Min_Stock_Level)
+    ORDER BY p.Product_Name
+    OPTION (RECOMPILE);
+END;
+GO
+
 IF OBJECT_ID('usp_GetInventoryByProduct', 'P') IS NOT NULL DROP PROCEDURE usp_GetInventoryByProduct;
 GO
 CREATE PROCEDURE usp_GetInventoryByProduct
@@ -1030,6 +1360,31 @@ BEGIN
 END;
 GO
 
+IF OBJECT_ID('usp_GetPurchasesWithDetails', 'P') IS NOT NULL DROP PROCEDURE usp_GetPurchasesWithDetails;
+GO
+CREATE PROCEDURE usp_GetPurchasesWithDetails
+    @PurchaseNos dbo.CodeListType READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+    -- Result set 1: purchase headers
+    SELECT p.Purchase_No, p.Supplier_ID, p.Purchase_Date, 
+           p.Total_Amount, p.Payment_Status, p.Notes,
+           s.Supplier_Name
+    FROM PURCHASE p
+    INNER JOIN @PurchaseNos n ON p.Purchase_No = n.Code
+    INNER JOIN SUPPLIER s ON p.Supplier_ID = s.Supplier_ID;
+    
+    -- Result set 2: line items for all requested purchases
+    SELECT pd.Purchase_No, pd.Product_Code, pd.Quantity, 
+           pd.Unit_Price, pd.Line_Total, pr.Product_Name
+    FROM PURCHASE_DETAIL pd
+    INNER JOIN @PurchaseNos n ON pd.Purchase_No = n.Code
+    INNER JOIN PRODUCT pr ON pd.Product_Code = pr.Product_Code
+    ORDER BY pd.Purchase_No, pr.Product_Name;
+END;
+GO
+
 IF OBJECT_ID('usp_GetPurchaseDetails', 'P') IS NOT NULL DROP PROCEDURE usp_GetPurchaseDetails;
 GO
 CREATE PROCEDURE usp_GetPurchaseDetails
@@ -1098,7 +1453,7 @@ GO
 IF OBJECT_ID('usp_CreatePurchaseOrder', 'P') IS NOT NULL DROP PROCEDURE usp_CreatePurchaseOrder;
 GO
 CREATE PROCEDURE usp_CreatePurchaseOrder
-    @PurchaseNo NVARCHAR(20),
+    @PurchaseNo NVARCHAR(20) = NULL,  -- NULL = allocate the next PUR### here
     @SupplierID NVARCHAR(10),
     @ProductCode NVARCHAR(20),
     @Quantity INT,
@@ -1110,6 +1465,14 @@ BEGIN
     BEGIN TRY
         BEGIN TRANSACTION;
         
+        IF @PurchaseNo IS NULL
+        BEGIN
+            -- Range lock holds concurrent callers until this insert commits
+            SELECT @PurchaseNo = 'PUR' + RIGHT('000' + CAST(
+                ISNULL(MAX(CAST(SUBSTRING(Purchase_No, 4, 10) AS INT)), 0) + 1 AS VARCHAR), 3)
+            FROM PURCHASE WITH (UPDLOCK, HOLDLOCK);
+        END
+        
         DECLARE @LineTotal DECIMAL(10,2) = @Quantity * @UnitPrice;
         
         INSERT INTO PURCHASE (Purchase_No, Supplier_ID, Purchase_Date, Total_Amount, Payment_Status, Notes)
@@ -1191,15 +1554,13 @@ CREATE PROCEDURE usp_MarkPurchaseReceived
 AS
 BEGIN
     SET NOCOUNT ON;
+    -- Return codes: 0 = received, 1 = not found, 2 = already received
+    IF NOT EXISTS (SELECT 1 FROM PURCHASE WHERE Purchase_No = @PurchaseNo) RETURN 1;
+    IF EXISTS (SELECT 1 FROM PURCHASE WHERE Purchase_No = @PurchaseNo AND Payment_Status = 'Received') RETURN 2;
+    
     BEGIN TRY
         BEGIN TRANSACTION;
         
-        IF EXISTS (SELECT 1 FROM PURCHASE WHERE Purchase_No = @PurchaseNo AND Payment_Status = 'Received')
-        BEGIN
-            RAISERROR('Purchase already marked as received', 16, 1);
-            RETURN;
-        END
-        
         -- Update inventory for each item
         UPDATE i
         SET i.Current_Stock = i.Current_Stock + pd.Quantity,
@@ -1211,12 +1572,12 @@ BEGIN
         UPDATE PURCHASE SET Payment_Status = 'Received' WHERE Purchase_No = @PurchaseNo;
         
         COMMIT TRANSACTION;
-        SELECT 1 AS Success;
     END TRY
     BEGIN CATCH
-        ROLLBACK TRANSACTION;
+        IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;
         THROW;
     END CATCH
+    RETURN 0;
 END;
 GO
 
@@ -1228,25 +1589,37 @@ CREATE PROCEDURE usp_CancelPurchase
 AS
 BEGIN
     SET NOCOUNT ON;
+    -- Return codes: 0 = cancelled, 1 = not found, 2 = already received
+    IF NOT EXISTS (SELECT 1 FROM PURCHASE WHERE Purchase_No = @PurchaseNo) RETURN 1;
+    IF EXISTS (SELECT 1 FROM PURCHASE WHERE Purchase_No = @PurchaseNo AND Payment_Status = 'Received') RETURN 2;
+    
     BEGIN TRY
         BEGIN TRANSACTION;
-        
-        IF EXISTS (SELECT 1 FROM PURCHASE WHERE Purchase_No = @PurchaseNo AND Payment_Status = 'Received')
-        BEGIN
-            RAISERROR('Cannot cancel a received purchase', 16, 1);
-            RETURN;
-        END
-        
         DELETE FROM PURCHASE_DETAIL WHERE Purchase_No = @PurchaseNo;
         DELETE FROM PURCHASE WHERE Purchase_No = @PurchaseNo;
-        
         COMMIT TRANSACTION;
-        SELECT 1 AS Success;
     END TRY
     BEGIN CATCH
-        ROLLBACK TRANSACTION;
+        IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;
         THROW;
     END CATCH
+    RETURN 0;
+END;
+GO
+
+-- Update purchase payment status
+IF OBJECT_ID('usp_UpdatePurchaseStatus', 'P') IS NOT NULL DROP PROCEDURE usp_UpdatePurchaseStatus;
+GO
+CREATE PROCEDURE usp_UpdatePurchaseStatus
+    @PurchaseNo NVARCHAR(20),
+    @Status NVARCHAR(20)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    -- Return codes: 0 = updated, 1 = not found
+    UPDATE PURCHASE SET Payment_Status = @Status WHERE Purchase_No = @PurchaseNo;
+    IF @@ROWCOUNT = 0 RETURN 1;
+    RETURN 0;
 END;
 GO
 
@@ -1329,6 +1702,48 @@ BEGIN
 END;
 GO
 
+-- Line items for several invoices (dbo.CodeListType holds the invoice numbers)
+IF OBJECT_ID('usp_GetSaleDetailsForInvoices', 'P') IS NOT NULL DROP PROCEDURE usp_GetSaleDetailsForInvoices;
+GO
+CREATE PROCEDURE usp_GetSaleDetailsForInvoices
+    @InvoiceNos dbo.CodeListType READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SELECT sd.Invoice_No, sd.Product_Code, sd.Quantity, 
+           sd.Unit_Price, sd.Line_Total, p.Product_Name
+    FROM SALE_DETAIL sd
+    INNER JOIN @InvoiceNos ids ON sd.Invoice_No = ids.Code
+    INNER JOIN PRODUCT p ON sd.Product_Code = p.Product_Code
+    ORDER BY sd.Invoice_No, p.Product_Name;
+END;
+GO
+
+-- Sale header and line items in one call (two result sets)
+IF OBJECT_ID('usp_GetSaleWithDetails', 'P') IS NOT NULL DROP PROCEDURE usp_GetSaleWithDetails;
+GO
+CREATE PROCEDURE usp_GetSaleWithDetails
+    @InvoiceNo NVARCHAR(20)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SELECT s.Invoice_No, s.Customer_ID, s.Employee_ID, 
+           s.Sale_Date, s.Sale_Time, s.Total_Amount, s.Discount, s.Net_Amount,
+           c.Customer_Name, e.Employee_Name
+    FROM SALE s
+    INNER JOIN CUSTOMER c ON s.Customer_ID = c.Customer_ID
+    INNER JOIN EMPLOYEE e ON s.Employee_ID = e.Employee_ID
+    WHERE s.Invoice_No = @InvoiceNo;
+    
+    SELECT sd.Invoice_No, sd.Product_Code, sd.Quantity, 
+           sd.Unit_Price, sd.Line_Total, p.Product_Name
+    FROM SALE_DETAIL sd
+    INNER JOIN PRODUCT p ON sd.Product_Code = p.Product_Code
+    WHERE sd.Invoice_No = @InvoiceNo
+    ORDER BY p.Product_Name;
+END;
+GO
+
 IF OBJECT_ID('usp_GetSalesByCustomer', 'P') IS NOT NULL DROP PROCEDURE usp_GetSalesByCustomer;
 GO
 CREATE PROCEDURE usp_GetSalesByCustomer
@@ -1384,6 +1799,24 @@ BEGIN
 END;
 GO
 
+IF OBJECT_ID('usp_GetSalesToday', 'P') IS NOT NULL DROP PROCEDURE usp_GetSalesToday;
+GO
+CREATE PROCEDURE usp_GetSalesToday
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @Today DATE = CAST(GETDATE() AS DATE);
+    SELECT s.Invoice_No, s.Customer_ID, s.Employee_ID, 
+           s.Sale_Date, s.Sale_Time, s.Total_Amount, s.Discount, s.Net_Amount,
+           c.Customer_Name, e.Employee_Name
+    FROM SALE s
+    INNER JOIN CUSTOMER c ON s.Customer_ID = c.Customer_ID
+    INNER JOIN EMPLOYEE e ON s.Employee_ID = e.Employee_ID
+    WHERE s.Sale_Date = @Today
+    ORDER BY s.Sale_Time DESC;
+END;
+GO
+
 IF OBJECT_ID('usp_GetNextInvoiceNo', 'P') IS NOT NULL DROP PROCEDURE usp_GetNextInvoiceNo;
 GO
 CREATE PROCEDURE usp_GetNextInvoiceNo
@@ -1412,6 +1845,7 @@ CREATE PROCEDURE usp_CreateSale
 AS
 BEGIN
     SET NOCOUNT ON;
+    SET XACT_ABORT ON;
     SET @Success = 0;
     SET @CreatedKey = NULL;
     SET @ErrorMessage = NULL;
@@ -1440,27 +1874,29 @@ BEGIN
         RETURN;
     END
     
-    -- Check stock availability
     DECLARE @InsufficientStock TABLE (Product_Code NVARCHAR(20), Requested INT, Available INT);
     
-    INSERT INTO @InsufficientStock (Product_Code, Requested, Available)
-    SELECT d.Product_Code, d.Quantity, ISNULL(i.Current_Stock, 0)
-    FROM @Details d
-    LEFT JOIN INVENTORY i ON d.Product_Code = i.Product_Code
-    WHERE ISNULL(i.Current_Stock, 0) < d.Quantity;
-    
-    IF EXISTS (SELECT 1 FROM @InsufficientStock)
-    BEGIN
-        SELECT TOP 1 @ErrorMessage = 'Insufficient stock for ' + Product_Code + 
-               '. Requested: ' + CAST(Requested AS VARCHAR) + 
-               ', Available: ' + CAST(Available AS VARCHAR)
-        FROM @InsufficientStock;
-        RETURN;
-    END
-    
     BEGIN TRY
         BEGIN TRANSACTION;
         
+        -- Check stock availability; UPDLOCK keeps the rows from changing
+        -- between the check and the decrement below
+        INSERT INTO @InsufficientStock (Product_Code, Requested, Available)
+        SELECT d.Product_Code, d.Quantity, ISNULL(i.Current_Stock, 0)
+        FROM @Details d
+        LEFT JOIN INVENTORY i WITH (UPDLOCK, HOLDLOCK) ON d.Product_Code = i.Product_Code
+        WHERE ISNULL(i.Current_Stock, 0) < d.Quantity;
+        
+        IF EXISTS (SELECT 1 FROM @InsufficientStock)
+        BEGIN
+            SELECT TOP 1 @ErrorMessage = 'Insufficient stock for ' + Product_Code + 
+                   '. Requested: ' + CAST(Requested AS VARCHAR) + 
+                   ', Available: ' + CAST(Available AS VARCHAR)
+            FROM @InsufficientStock;
+            ROLLBACK TRANSACTION;
+            RETURN;
+        END
+        
         SELECT @TotalAmount = SUM(Quantity * Unit_Price) FROM @Details;
         SET @NetAmount = @TotalAmount - @Discount;
         IF @NetAmount < 0 SET @NetAmount = 0;
@@ -1490,6 +1926,84 @@ BEGIN
 END;
 GO
 
+-- Create many sales in one call (data import / POS resync). All or nothing.
+IF OBJECT_ID('usp_CreateSalesBulk', 'P') IS NOT NULL DROP PROCEDURE usp_CreateSalesBulk;
+GO
+CREATE PROCEDURE usp_CreateSalesBulk
+    @Headers dbo.SaleHeaderType READONLY,
+    @Details dbo.SaleLineType READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+    -- Return codes: 0 = created, 1 = no sales given,
+    --               2 = an invoice has no line items (or a line has no invoice),
+    --               3 = unknown customer or employee, 4 = invoice number exists,
+    --               5 = insufficient stock
+    IF NOT EXISTS (SELECT 1 FROM @Headers) RETURN 1;
+    IF EXISTS (SELECT 1 FROM @Headers h WHERE NOT EXISTS (SELECT 1 FROM @Details d WHERE d.Invoice_No = h.Invoice_No))
+       OR EXISTS (SELECT 1 FROM @Details d WHERE NOT EXISTS (SELECT 1 FROM @Headers h WHERE h.Invoice_No = d.Invoice_No))
+        RETURN 2;
+    IF EXISTS (
+        SELECT 1 FROM @Headers h
+        WHERE NOT EXISTS (SELECT 1 FROM CUSTOMER c WHERE c.Customer_ID = h.Customer_ID)
+           OR NOT EXISTS (SELECT 1 FROM EMPLOYEE e WHERE e.Employee_ID = h.Employee_ID)
+    ) RETURN 3;
+    
+    BEGIN TRY
+        BEGIN TRANSACTION;
+        
+        IF EXISTS (SELECT 1 FROM SALE s WITH (UPDLOCK, HOLDLOCK) INNER JOIN @Headers h ON s.Invoice_No = h.Invoice_No)
+        BEGIN
+            ROLLBACK TRANSACTION;
+            RETURN 4;
+        END
+        
+        -- One pass over the lines: total requested per product vs. stock
+        IF EXISTS (
+            SELECT 1
+            FROM (SELECT Product_Code, SUM(Quantity) AS Quantity FROM @Details GROUP BY Product_Code) d
+            LEFT JOIN INVENTORY i WITH (UPDLOCK, HOLDLOCK) ON d.Product_Code = i.Product_Code
+            WHERE ISNULL(i.Current_Stock, 0) < d.Quantity
+        )
+        BEGIN
+            ROLLBACK TRANSACTION;
+            RETURN 5;
+        END
+        
+        INSERT INTO SALE (Invoice_No, Customer_ID, Employee_ID, Sale_Date, Sale_Time, Total_Amount, Discount, Net_Amount)
+        SELECT h.Invoice_No, h.Customer_ID, h.Employee_ID,
+               ISNULL(h.Sale_Date, CAST(GETDATE() AS DATE)),
+               ISNULL(h.Sale_Time, CAST(GETDATE() AS TIME)),
+               t.Total, h.Discount,
+               CASE WHEN t.Total - h.Discount < 0 THEN 0 ELSE t.Total - h.Discount END
+        FROM @Headers h
+        INNER JOIN (
+            SELECT Invoice_No, SUM(Quantity * Unit_Price) AS Total
+            FROM @Details GROUP BY Invoice_No
+        ) t ON t.Invoice_No = h.Invoice_No;
+        
+        INSERT INTO SALE_DETAIL (Invoice_No, Product_Code, Quantity, Unit_Price, Line_Total)
+        SELECT Invoice_No, Product_Code, Quantity, Unit_Price, Quantity * Unit_Price
+        FROM @Details;
+        
+        UPDATE i
+        SET i.Current_Stock = i.Current_Stock - d.Quantity,
+            i.Last_Updated = GETDATE()
+        FROM INVENTORY i
+        INNER JOIN (SELECT Product_Code, SUM(Quantity) AS Quantity FROM @Details GROUP BY Product_Code) d
+            ON i.Product_Code = d.Product_Code;
+        
+        COMMIT TRANSACTION;
+    END TRY
+    BEGIN CATCH
+        IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;
+        THROW;
+    END CATCH
+    RETURN 0;
+END;
+GO
+
 IF OBJECT_ID('usp_GetDailySalesSummary', 'P') IS NOT NULL DROP PROCEDURE usp_GetDailySalesSummary;
 GO
 CREATE PROCEDURE usp_GetDailySalesSummary
@@ -1550,13 +2064,96 @@ BEGIN
     LEFT JOIN PRODUCT p ON sub.Subcat_ID = p.Subcat_ID
     LEFT JOIN SALE_DETAIL sd ON p.Product_Code = sd.Product_Code
     LEFT JOIN SALE s ON sd.Invoice_No = s.Invoice_No
-    WHERE (@StartDate IS NULL OR CAST(s.Sale_Date AS DATE) >= @StartDate)
-      AND (@EndDate IS NULL OR CAST(s.Sale_Date AS DATE) <= @EndDate)
+    WHERE (@StartDate IS NULL OR s.Sale_Date >= @StartDate)
+      AND (@EndDate IS NULL OR s.Sale_Date <= @EndDate)
     GROUP BY c.Cat_ID, c.Cat_Name
     ORDER BY Total_Revenue DESC;
 END;
 GO
 
+-- JSON variants for exports: the same aggregations returned as one
+-- NVARCHAR(MAX) document (column "Json") with the repository's dict keys.
+-- Wrapping FOR JSON in a scalar subquery keeps it in a single row.
+IF OBJECT_ID('usp_GetDailySalesSummaryJson', 'P') IS NOT NULL DROP PROCEDURE usp_GetDailySalesSummaryJson;
+GO
+CREATE PROCEDURE usp_GetDailySalesSummaryJson
+    @TargetDate DATE = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    IF @TargetDate IS NULL SET @TargetDate = CAST(GETDATE() AS DATE);
+    
+    SELECT (
+        SELECT 
+            CONVERT(CHAR(10), @TargetDate, 23) AS [date],
+            COUNT(*) AS total_sales,
+            ISNULL(SUM(Total_Amount), 0) AS gross_revenue,
+            ISNULL(SUM(Discount), 0) AS total_discount,
+            ISNULL(SUM(Net_Amount), 0) AS net_revenue
+        FROM SALE
+        WHERE Sale_Date = @TargetDate
+        FOR JSON PATH, WITHOUT_ARRAY_WRAPPER
+    ) AS Json;
+END;
+GO
+
+IF OBJECT_ID('usp_GetTopSellingProductsJson', 'P') IS NOT NULL DROP PROCEDURE usp_GetTopSellingProductsJson;
+GO
+CREATE PROCEDURE usp_GetTopSellingProductsJson
+    @Limit INT = 10,
+    @StartDate DATE = NULL,
+    @EndDate DATE = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SELECT ISNULL((
+        SELECT TOP (@Limit)
+            p.Product_Code AS product_code,
+            p.Product_Name AS product_name,
+            p.Brand AS brand,
+            SUM(sd.Quantity) AS total_quantity,
+            SUM(sd.Line_Total) AS total_revenue
+        FROM SALE_DETAIL sd
+        INNER JOIN PRODUCT p ON sd.Product_Code = p.Product_Code
+        INNER JOIN SALE s ON sd.Invoice_No = s.Invoice_No
+        WHERE (@StartDate IS NULL OR s.Sale_Date >= @StartDate)
+          AND (@EndDate IS NULL OR s.Sale_Date <= @EndDate)
+        GROUP BY p.Product_Code, p.Product_Name, p.Brand
+        ORDER BY total_quantity DESC
+        FOR JSON PATH, INCLUDE_NULL_VALUES
+    ), N'[]') AS Json;
+END;
+GO
+
+IF OBJECT_ID('usp_GetSalesByCategoryJson', 'P') IS NOT NULL DROP PROCEDURE usp_GetSalesByCategoryJson;
+GO
+CREATE PROCEDURE usp_GetSalesByCategoryJson
+    @StartDate DATE = NULL,
+    @EndDate DATE = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SELECT ISNULL((
+        SELECT 
+            c.Cat_ID AS cat_id,
+            c.Cat_Name AS cat_name,
+            COUNT(DISTINCT s.Invoice_No) AS sale_count,
+            ISNULL(SUM(sd.Quantity), 0) AS total_quantity,
+            ISNULL(SUM(sd.Line_Total), 0) AS total_revenue
+        FROM CATEGORY c
+        LEFT JOIN SUBCATEGORY sub ON c.Cat_ID = sub.Cat_ID
+        LEFT JOIN PRODUCT p ON sub.Subcat_ID = p.Subcat_ID
+        LEFT JOIN SALE_DETAIL sd ON p.Product_Code = sd.Product_Code
+        LEFT JOIN SALE s ON sd.Invoice_No = s.Invoice_No
+        WHERE (@StartDate IS NULL OR s.Sale_Date >= @StartDate)
+          AND (@EndDate IS NULL OR s.Sale_Date <= @EndDate)
+        GROUP BY c.Cat_ID, c.Cat_Name
+        ORDER BY total_revenue DESC
+        FOR JSON PATH
+    ), N'[]') AS Json;
+END;
+GO
+
 -- ============================================================================
 -- PAYMENT PROCEDURES
 -- ============================================================================
@@ -1601,6 +2198,30 @@ BEGIN
 END;
 GO
 
+IF OBJECT_ID('usp_GetInvoiceWithPayments', 'P') IS NOT NULL DROP PROCEDURE usp_GetInvoiceWithPayments;
+GO
+CREATE PROCEDURE usp_GetInvoiceWithPayments
+    @InvoiceNo NVARCHAR(20)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    -- Result set 1: invoice header (same shape as usp_GetSaleById)
+    SELECT s.Invoice_No, s.Customer_ID, s.Employee_ID, 
+           s.Sale_Date, s.Sale_Time, s.Total_Amount, s.Discount, s.Net_Amount,
+           c.Customer_Name, e.Employee_Name
+    FROM SALE s
+    INNER JOIN CUSTOMER c ON s.Customer_ID = c.Customer_ID
+    INNER JOIN EMPLOYEE e ON s.Employee_ID = e.Employee_ID
+    WHERE s.Invoice_No = @InvoiceNo;
+    
+    -- Result set 2: payments against the invoice
+    SELECT Payment_ID, Invoice_No, Payment_Method, Amount_Paid, Payment_Date
+    FROM PAYMENT
+    WHERE Invoice_No = @InvoiceNo
+    ORDER BY Payment_Date;
+END;
+GO
+
 IF OBJECT_ID('usp_AddPayment', 'P') IS NOT NULL DROP PROCEDURE usp_AddPayment;
 GO
 CREATE PROCEDURE usp_AddPayment
@@ -1612,10 +2233,22 @@ CREATE PROCEDURE usp_AddPayment
 AS
 BEGIN
     SET NOCOUNT ON;
-    IF @PaymentDate IS NULL SET @PaymentDate = GETDATE();
-    
+    -- NULL date means "now" on the server clock
     INSERT INTO PAYMENT (Payment_ID, Invoice_No, Payment_Method, Amount_Paid, Payment_Date)
-    VALUES (@PaymentId, @InvoiceNo, @PaymentMethod, @AmountPaid, @PaymentDate);
+    VALUES (@PaymentId, @InvoiceNo, @PaymentMethod, @AmountPaid, COALESCE(@PaymentDate, GETDATE()));
+END;
+GO
+
+-- Payment IDs are drawn from a sequence so concurrent/bulk creates never
+-- compute the same MAX+1. Created here (after sample data is loaded) so the
+-- sequence starts after any existing Payment_ID.
+IF OBJECT_ID('dbo.PaymentSeq', 'SO') IS NULL
+BEGIN
+    DECLARE @PaymentSeqStart INT;
+    SELECT @PaymentSeqStart = ISNULL(MAX(CAST(SUBSTRING(Payment_ID, 4, 10) AS INT)), 0) + 1
+    FROM PAYMENT;
+    EXEC('CREATE SEQUENCE dbo.PaymentSeq AS INT START WITH '
+         + CAST(@PaymentSeqStart AS VARCHAR(10)) + ' INCREMENT BY 1 CACHE 50;');
 END;
 GO
 
@@ -1625,10 +2258,67 @@ CREATE PROCEDURE usp_GetNextPaymentId
 AS
 BEGIN
     SET NOCOUNT ON;
-    DECLARE @NextNum INT;
-    SELECT @NextNum = ISNULL(MAX(CAST(SUBSTRING(Payment_ID, 4, 10) AS INT)), 0) + 1
-    FROM PAYMENT;
-    SELECT 'PAY' + RIGHT('000' + CAST(@NextNum AS VARCHAR), 3) AS NextId;
+    DECLARE @PaymentNo INT = NEXT VALUE FOR dbo.PaymentSeq;
+    SELECT 'PAY' + FORMAT(@PaymentNo, 'D3') AS NextId;  -- PAY001 .. PAY999, PAY1000
+END;
+GO
+
+IF OBJECT_ID('usp_GetNextPaymentIds', 'P') IS NOT NULL DROP PROCEDURE usp_GetNextPaymentIds;
+GO
+CREATE PROCEDURE usp_GetNextPaymentIds
+    @N INT
+AS
+BEGIN
+    SET NOCOUNT ON;
+    IF @N IS NULL OR @N < 1 RETURN;
+    
+    -- Reserve @N consecutive values in one call
+    DECLARE @First SQL_VARIANT;
+    EXEC sys.sp_sequence_get_range
+        @sequence_name = N'dbo.PaymentSeq',
+        @range_size = @N,
+        @range_first_value = @First OUTPUT;
+    
+    DECLARE @Start INT = CAST(@First AS INT);
+    SELECT 'PAY' + FORMAT(@Start + n.Offset, 'D3') AS NextId
+    FROM (
+        SELECT TOP (@N) ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) - 1 AS Offset
+        FROM sys.all_objects a CROSS JOIN sys.all_objects b
+    ) n
+    ORDER BY n.Offset;
+END;
+GO
+
+-- Invoice numbers are reserved in ranges by the application (see
+-- SaleRepository.get_next_id). Like PaymentSeq, the sequence starts after
+-- any existing Invoice_No.
+IF OBJECT_ID('dbo.InvoiceSeq', 'SO') IS NULL
+BEGIN
+    DECLARE @InvoiceSeqStart INT;
+    SELECT @InvoiceSeqStart = ISNULL(MAX(CAST(SUBSTRING(Invoice_No, 4, 10) AS INT)), 0) + 1
+    FROM SALE;
+    EXEC('CREATE SEQUENCE dbo.InvoiceSeq AS INT START WITH '
+         + CAST(@InvoiceSeqStart AS VARCHAR(10)) + ' INCREMENT BY 1 CACHE 50;');
+END;
+GO
+
+IF OBJECT_ID('usp_ReserveInvoiceRange', 'P') IS NOT NULL DROP PROCEDURE usp_ReserveInvoiceRange;
+GO
+CREATE PROCEDURE usp_ReserveInvoiceRange
+    @Count INT
+AS
+BEGIN
+    SET NOCOUNT ON;
+    IF @Count IS NULL OR @Count < 1 RETURN;
+    
+    -- Reserve @Count consecutive numbers in one call
+    DECLARE @First SQL_VARIANT;
+    EXEC sys.sp_sequence_get_range
+        @sequence_name = N'dbo.InvoiceSeq',
+        @range_size = @Count,
+        @range_first_value = @First OUTPUT;
+    
+    SELECT CAST(@First AS INT) AS FirstNo;
 END;
 GO
 
@@ -1701,6 +2391,43 @@ BEGIN
     LEFT JOIN SALE_DETAIL sd ON s.Invoice_No = sd.Invoice_No
     LEFT JOIN PRODUCT p ON sd.Product_Code = p.Product_Code
     WHERE CAST(s.Sale_Date AS DATE) BETWEEN @StartDate AND @EndDate;
+    
+    -- Daily breakdown
+    SELECT 
+        CAST(s.Sale_Date AS DATE) AS Sale_Date,
+        COUNT(*) AS Sale_Count,
+        ISNULL(SUM(s.Net_Amount), 0) AS Total_Revenue
+    FROM SALE s
+    WHERE CAST(s.Sale_Date AS DATE) BETWEEN @StartDate AND @EndDate
+    GROUP BY CAST(s.Sale_Date AS DATE)
+    ORDER BY Sale_Date;
+    
+    -- Top selling products (same shape as usp_GetTopSellingProducts)
+    SELECT TOP (10)
+        p.Product_Code, p.Product_Name, p.Brand,
+        SUM(sd.Quantity) AS Total_Quantity,
+        SUM(sd.Line_Total) AS Total_Revenue
+    FROM SALE_DETAIL sd
+    INNER JOIN PRODUCT p ON sd.Product_Code = p.Product_Code
+    INNER JOIN SALE s ON sd.Invoice_No = s.Invoice_No
+    WHERE s.Sale_Date >= @StartDate AND s.Sale_Date <= @EndDate
+    GROUP BY p.Product_Code, p.Product_Name, p.Brand
+    ORDER BY Total_Quantity DESC;
+    
+    -- Sales by category (same shape as usp_GetSalesByCategory)
+    SELECT 
+        c.Cat_ID, c.Cat_Name,
+        COUNT(DISTINCT s.Invoice_No) AS Sale_Count,
+        ISNULL(SUM(sd.Quantity), 0) AS Total_Quantity,
+        ISNULL(SUM(sd.Line_Total), 0) AS Total_Revenue
+    FROM CATEGORY c
+    LEFT JOIN SUBCATEGORY sub ON c.Cat_ID = sub.Cat_ID
+    LEFT JOIN PRODUCT p ON sub.Subcat_ID = p.Subcat_ID
+    LEFT JOIN SALE_DETAIL sd ON p.Product_Code = sd.Product_Code
+    LEFT JOIN SALE s ON sd.Invoice_No = s.Invoice_No
+    WHERE s.Sale_Date >= @StartDate AND s.Sale_Date <= @EndDate
+    GROUP BY c.Cat_ID, c.Cat_Name
+    ORDER BY Total_Revenue DESC;
 END;
 GO
 